@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""Reproducible latency benchmark for the czytaj hook → audio chain (runs on plain Linux).
+
+WHY: the latency work so far lives in prose (thoughts/shared/petla/czytaj-latency-audit-
+2026-06-03.md) and in ad-hoc _log timings (SYNTH-DONE / CHANNEL-OK / UNLOCK-DONE) read off
+a phone. Neither catches a regression in one hop before it ships. This harness times every
+hop in isolation, N times, and prints p50/p95 per stage — a slower hop shows up as a number,
+and --baseline diffs it against a saved run.
+
+Everything runs against the REAL hook modules (files/hooks/czytaj) inside a throwaway HOME,
+with stand-ins on PATH for the Android-side tools:
+  - termux-media-player  `play` returns at once, `info` says nothing is playing
+  - rish                 answers the dumpsys/ime/media_session probes after --rish-ms
+  - termux-volume        music stream at 7
+  - piper-daemon         READY/OK protocol; writes float32 audio after --daemon-ms per char
+So the numbers measure OUR overhead (parsing, imports, spawns, socket + pool hops, PCM
+conversion) plus the configured stand-in delays — not the phone's ONNX inference.
+
+    python3 addons/czytaj/bench/czytaj_bench.py [-n 30] [--only synth,pcm]
+                                                [--json out.json] [--baseline old.json]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import shutil
+import signal
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+from typing import Callable
+
+HOOK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "files", "hooks", "czytaj")
+HOOK_DIR = os.path.normpath(HOOK_DIR)
+
+FAKE_PLAYER = """#!/bin/sh
+case "$1" in info) echo "No track currently playing";; esac
+"""
+
+FAKE_RISH = """#!{py}
+import sys, time
+time.sleep({delay})
+cmd = sys.argv[-1]
+if "dumpsys power" in cmd:
+    print("  mWakefulness=Awake")
+elif "ime list" in cmd:
+    print("com.example.keyboard/.Ime")
+"""
+
+FAKE_VOLUME = """#!/bin/sh
+echo '[{"stream": "music", "volume": 7, "max_volume": 15}]'
+"""
+
+FAKE_DAEMON = """#!{py}
+import struct, sys, time
+print("READY", flush=True)
+while True:
+    path = sys.stdin.readline()
+    if not path:
+        break
+    text = sys.stdin.readline()
+    time.sleep({per_char} * len(text))
+    n = len(text) * 800          # ~36 ms of 22050 Hz audio per char, like piper at 0.6
+    with open(path.strip(), "wb") as f:
+        f.write(struct.pack("<%df" % n, *([0.1] * n)))
+    print("OK", flush=True)
+"""
+
+SENTENCE = "To jest zdanie testowe o przecietnej dlugosci, takie jak w odpowiedzi."
+MARKDOWN = ("## Podsumowanie\n\n- **Zmiana**: `piper_server.py` — nowy *pool* daemonow.\n"
+            "- [link](https://example.com) i ```kod``` oraz > cytat.\n\n"
+            "| kol | kol |\n|---|---|\n| a | b |\n\n") * 8
+
+
+def _write_exe(path: str, body: str) -> None:
+    with open(path, "w") as f:
+        f.write(body)
+    os.chmod(path, 0o755)
+
+
+def make_sandbox(rish_ms: float, daemon_ms: float) -> dict:
+    """Throwaway HOME + fake tools. Must run BEFORE any hook module is imported —
+    czytaj_paths resolves every path from $HOME at import time."""
+    root = tempfile.mkdtemp(prefix="czytaj-bench-")
+    home = os.path.join(root, "home")
+    bindir = os.path.join(root, "bin")
+    libpiper = os.path.join(root, "piper-tts", "piper1-gpl", "libpiper")
+    for d in (home, bindir, libpiper, os.path.join(root, "piper-tts", "voices")):
+        os.makedirs(d)
+    py = sys.executable or "/usr/bin/env python3"
+    _write_exe(os.path.join(bindir, "termux-media-player"), FAKE_PLAYER)
+    _write_exe(os.path.join(bindir, "termux-volume"), FAKE_VOLUME)
+    _write_exe(os.path.join(bindir, "rish"), FAKE_RISH.format(py=py, delay=rish_ms / 1000.0))
+    daemon = FAKE_DAEMON.format(py=py, per_char=daemon_ms / 1000.0)
+    _write_exe(os.path.join(libpiper, "piper-daemon"), daemon)
+    _write_exe(os.path.join(libpiper, "piper"), daemon)   # only has to exist (PIPER_BIN check)
+    os.environ.update({
+        "HOME": home,
+        "PIPER_HOME": os.path.join(root, "piper-tts"),
+        "PATH": bindir + os.pathsep + os.environ.get("PATH", ""),
+        "TMPDIR": os.path.join(root, "tmp"),
+        "CZYTAJ_TERMUX_FLAGS_DIR": os.path.join(root, "termux-flags"),
+    })
+    os.environ.pop("CLAUDE_PROJECT_DIR", None)
+    os.makedirs(os.environ["TMPDIR"])
+    return {"root": root, "home": home}
+
+
+def make_transcript(home: str, turns: int) -> str:
+    """Synthetic Claude Code transcript: `turns` × (user, 3 tool calls + results, reply)."""
+    d = os.path.join(home, ".claude", "projects", "bench")
+    os.makedirs(d, exist_ok=True)
+    path = os.path.join(d, "session.jsonl")
+    filler = "x" * 600
+    with open(path, "w") as f:
+        for t in range(turns):
+            f.write(json.dumps({"type": "user", "uuid": f"u{t}",
+                                "message": {"content": f"Pytanie {t}"}}) + "\n")
+            for k in range(3):
+                f.write(json.dumps({"type": "assistant", "uuid": f"a{t}-{k}", "message": {
+                    "content": [{"type": "tool_use", "name": "Bash", "input": {"command": filler}}]}}) + "\n")
+                f.write(json.dumps({"type": "user", "uuid": f"r{t}-{k}", "message": {
+                    "content": [{"type": "tool_result", "content": filler}]}}) + "\n")
+            f.write(json.dumps({"type": "assistant", "uuid": f"a{t}", "message": {
+                "content": [{"type": "text", "text": f"Odpowiedz {t}. " + SENTENCE}]}}) + "\n")
+    return path
+
+
+def percentile(samples: list[float], p: float) -> float:
+    """Nearest-rank percentile (no interpolation — stable for small N)."""
+    s = sorted(samples)
+    return s[max(0, min(len(s) - 1, math.ceil(p * len(s)) - 1))]
+
+
+def check_pcm_paths(czytaj_pcm) -> None:
+    """The pcm stage times the NumPy path when NumPy is installed: its bytes must match the
+    stdlib array path exactly (in-range, clipped and -1.0 samples)."""
+    if czytaj_pcm._np is None:
+        return
+    import random
+    rnd = random.Random(7)
+    samples = [rnd.uniform(-1.3, 1.3) for _ in range(22050)] + [-1.0, 1.0, -0.0, 0.5 / 32767]
+    raw = struct.pack("<%df" % len(samples), *samples)
+    via_np = czytaj_pcm.float32_to_int16(raw)
+    saved, czytaj_pcm._np = czytaj_pcm._np, None
+    try:
+        via_array = czytaj_pcm.float32_to_int16(raw)
+    finally:
+        czytaj_pcm._np = saved
+    assert via_np == via_array, "czytaj_pcm: NumPy output differs from the array path"
+
+
+def build_stages(sb: dict, transcript: str) -> list[tuple[str, Callable[[], object]]]:
+    sys.path.insert(0, HOOK_DIR)
+    import czytaj_paths as cz
+    import czytaj_pcm
+    import czytaj_transcript
+    import czytaj_ttscache
+    import _speak
+    import fcntl
+    import piper_server
+    import piper_stream
+    from pathlib import Path
+
+    check_pcm_paths(czytaj_pcm)
+    out_wav = Path(sb["home"], "bench.wav")
+    raw = struct.pack("<%df" % (22050 * 5), *([0.25] * (22050 * 5)))   # 5 s of audio
+    idx_path = czytaj_transcript._index_path(transcript)
+    counter = [0]
+
+    msgs_idx_path = czytaj_transcript._index_path(transcript, ".msgs.json")
+
+    def texts_cold():
+        try:
+            os.unlink(msgs_idx_path)
+        except OSError:
+            pass
+        return czytaj_transcript.assistant_texts(transcript, 5)
+
+    def transcript_cold():
+        try:
+            os.unlink(idx_path)
+        except OSError:
+            pass
+        return czytaj_transcript.turn_start(transcript)
+
+    def guards_uncached():
+        try:
+            os.unlink(cz.DEVICE_STATE)
+        except OSError:
+            pass
+        # each probe self-caches 5 s (czytaj_store rows) — fresh=True times the real hop
+        return _speak._run_guard_probes(fresh=True)
+
+    def guards_snapshot():
+        if _speak.read_device_state() is None:   # the watcher's sampler, done inline
+            _speak.sample_device_state()
+        return _speak.is_other_audio_playing(check_self=False)
+
+    def speak_lock():
+        fd = os.open(cz.SPEAK_LOCK, os.O_CREAT | os.O_RDWR, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def synth_daemon():
+        counter[0] += 1                 # unique text: never a global-cache hit
+        return piper_server.speak_wav(f"{SENTENCE} {counter[0]}.", out_wav, priority="interactive")
+
+    def spawn(args: list[str], stdin: bytes = b"", env: dict | None = None) -> Callable[[], object]:
+        def run():
+            return subprocess.run(args, input=stdin, stdout=subprocess.DEVNULL,
+                                  stderr=subprocess.DEVNULL, env=env, timeout=30).returncode
+        return run
+
+    py = sys.executable or "python3"
+    # A 50 ms clip: the play stage should time spawn + import + channel + the first
+    # `info` confirmation, not a stand-in playback duration.
+    short_wav = Path(sb["home"], "short.wav")
+    with wave.open(str(short_wav), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(22050)
+        w.writeframes(b"\x00\x00" * 1102)
+    play_env = dict(os.environ, CZYTAJ_PLAY_WAV=str(short_wav))
+    piper_stream.synthesize_warm(SENTENCE, out_wav)   # seed the global cache + out_wav
+    return [
+        ("transcript.turn_start cold", transcript_cold),
+        ("transcript.turn_start warm", lambda: czytaj_transcript.turn_start(transcript)),
+        ("transcript.last-5 messages cold", texts_cold),
+        ("transcript.last-5 messages warm", lambda: czytaj_transcript.assistant_texts(transcript, 5)),
+        ("transcript.parse_current_turn", lambda: _speak._parse_current_turn(transcript)),
+        ("text.strip_markdown", lambda: _speak.strip_markdown(MARKDOWN)),
+        ("guards.probes (rish, uncached)", guards_uncached),
+        ("guards.snapshot lookup", guards_snapshot),
+        ("lock.speak_lock", speak_lock),
+        ("synth.daemon round-trip", synth_daemon),
+        ("synth.tts-cache hit", lambda: piper_stream.synthesize_warm(SENTENCE, out_wav)),
+        ("pcm.float32_to_int16 (5 s)", lambda: czytaj_pcm.float32_to_int16(raw)),
+        ("tts-cache.evict scan", lambda: czytaj_ttscache.evict()),
+        ("spawn.termux-media-player", spawn(["termux-media-player", "info"])),
+        ("spawn.hook_client stop", spawn([py, "-S", os.path.join(HOOK_DIR, "hook_client.py"), "stop"],
+                                         stdin=json.dumps({"transcript_path": ""}).encode())),
+        ("spawn.piper_stream play-cached", spawn([py, os.path.join(HOOK_DIR, "piper_stream.py")],
+                                                 env=play_env)),
+    ]
+
+
+def run(stages, iterations: int, only: list[str]) -> dict:
+    results = {}
+    for name, fn in stages:
+        if only and not any(name.startswith(o) for o in only):
+            continue
+        fn()                            # warm-up (imports, first daemon spawn, page cache)
+        samples = []
+        for _ in range(iterations):
+            t = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - t) * 1000.0)
+        results[name] = {"n": iterations, "p50_ms": round(percentile(samples, 0.5), 3),
+                         "p95_ms": round(percentile(samples, 0.95), 3)}
+    return results
+
+
+def report(results: dict, baseline: dict) -> None:
+    print(f"{'stage':34} {'n':>4} {'p50 ms':>10} {'p95 ms':>10}" + ("   Δp50" if baseline else ""))
+    for name, r in results.items():
+        line = f"{name:34} {r['n']:>4} {r['p50_ms']:>10.2f} {r['p95_ms']:>10.2f}"
+        old = baseline.get(name)
+        if old and old.get("p50_ms"):
+            line += f"  {(r['p50_ms'] / old['p50_ms'] - 1) * 100:+6.0f}%"
+        print(line)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    ap.add_argument("-n", "--iterations", type=int, default=20)
+    ap.add_argument("--only", default="", help="comma-separated stage-name prefixes")
+    ap.add_argument("--turns", type=int, default=400, help="synthetic transcript size (turns)")
+    ap.add_argument("--rish-ms", type=float, default=50.0, help="stand-in rish latency")
+    ap.add_argument("--daemon-ms", type=float, default=1.0, help="stand-in synth ms per char")
+    ap.add_argument("--json", default="", help="write results here")
+    ap.add_argument("--baseline", default="", help="earlier --json output to diff p50 against")
+    args = ap.parse_args()
+
+    sb = make_sandbox(args.rish_ms, args.daemon_ms)
+    try:
+        transcript = make_transcript(sb["home"], args.turns)
+        flag_dir = os.path.join(sb["home"], ".claude", "czytaj-flags")
+        os.makedirs(flag_dir)
+        open(os.path.join(flag_dir, ".keepwarm-bench"), "w").close()   # server stays up
+        open(os.path.join(sb["home"], ".claude", "czytaj-shizuku.flag"), "w").close()  # probes → rish
+        stages = build_stages(sb, transcript)
+        print(f"transcript {os.path.getsize(transcript) / 1e6:.1f} MB, {args.iterations} iterations,"
+              f" rish {args.rish_ms:g} ms, daemon {args.daemon_ms:g} ms/char")
+        results = run(stages, args.iterations, [o for o in args.only.split(",") if o])
+        baseline = {}
+        if args.baseline:
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        report(results, baseline)
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump(results, f, indent=1)
+    finally:
+        pid_file = os.path.join(sb["home"], ".cache", "czytaj", "piper-server", "server.pid")
+        try:
+            with open(pid_file) as f:
+                os.kill(int(f.read().strip()), signal.SIGTERM)
+        except (OSError, ValueError):
+            pass
+        time.sleep(0.2)
+        shutil.rmtree(sb["root"], ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
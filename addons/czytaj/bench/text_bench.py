@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""czytaj_text.normalize vs the old 15-pass strip_markdown, on real transcripts.
+
+Reads every assistant text block from Claude Code transcripts (default: all of
+~/.claude/projects/**/*.jsonl, or the files/dirs given; a non-.jsonl file, e.g. a
+thoughts/*.md note, counts as one reply), then:
+  - diffs the two outputs and prints the first few mismatches (--show N),
+  - times both over the whole corpus (best of -n rounds) and prints µs per reply.
+
+LEGACY below is a frozen copy of _speak.strip_markdown as it was before czytaj_text — the
+reference the new single pass is held to. Runs on plain Linux, no hook state touched.
+
+    python3 addons/czytaj/bench/text_bench.py [-n 5] [--show 5] [paths...]
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import time
+
+HOOK_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                         "..", "files", "hooks", "czytaj"))
+sys.path.insert(0, HOOK_DIR)
+import czytaj_text  # noqa: E402
+
+
+def legacy_strip_markdown(text: str) -> str:
+    t = text
+    t = re.sub(r"```.*?```", " ", t, flags=re.DOTALL)
+    t = re.sub(r"```.*$", " ", t, flags=re.DOTALL)
+    t = re.sub(r"`([^`]+)`", r"\1", t)
+    t = re.sub(r"(?<!\w)\*\*([^*]+)\*\*(?!\w)", r"\1", t)
+    t = re.sub(r"(?<!\w)\*([^*]+)\*(?!\w)", r"\1", t)
+    t = re.sub(r"^#+\s*", "", t, flags=re.MULTILINE)
+    t = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", t)
+    t = re.sub(r"(?m)^\s*[-=*_]{3,}\s*$", " ", t)
+    t = re.sub(r"\|", " ", t)
+    t = re.sub(r"[\U0001F000-\U0001FAFF\U00002600-\U000027BF\U0001F1E6-\U0001F1FF"
+               "\uFE0F\u2190-\u21FF\u2300-\u23FF]", "", t)
+    t = re.sub(r"^\s*[-*]\s+", ". ", t, flags=re.MULTILINE)
+    t = re.sub(r"^\s*\d+\.\s+", ". ", t, flags=re.MULTILINE)
+    t = re.sub(r"\n{2,}", ". ", t)
+    t = re.sub(r"\s+", " ", t)
+    return t.strip()
+
+
+def _texts(paths: list[str]) -> list[str]:
+    files: list[str] = []
+    for p in paths:
+        if os.path.isdir(p):
+            files += glob.glob(os.path.join(p, "**", "*.jsonl"), recursive=True)
+        else:
+            files.append(p)
+    out = []
+    for path in sorted(files):
+        if not path.endswith(".jsonl"):
+            try:
+                with open(path, encoding="utf-8", errors="replace") as f:
+                    out.append(f.read())
+            except OSError:
+                pass
+            continue
+        try:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    try:
+                        msg = json.loads(line).get("message") or {}
+                    except (ValueError, AttributeError):
+                        continue
+                    if msg.get("role") != "assistant" or not isinstance(msg.get("content"), list):
+                        continue
+                    for block in msg["content"]:
+                        if isinstance(block, dict) and block.get("type") == "text" and block.get("text"):
+                            out.append(block["text"])
+        except OSError:
+            continue
+    return out
+
+
+def _best(fn, texts: list[str], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        for t in texts:
+            fn(t)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("paths", nargs="*", default=[os.path.expanduser("~/.claude/projects")])
+    ap.add_argument("-n", type=int, default=5, help="timing rounds (best is reported)")
+    ap.add_argument("--show", type=int, default=3, help="mismatches to print")
+    args = ap.parse_args()
+
+    texts = _texts(args.paths)
+    if not texts:
+        print("no assistant text found in", " ".join(args.paths))
+        return 1
+    chars = sum(len(t) for t in texts)
+    diffs = [t for t in texts if legacy_strip_markdown(t) != czytaj_text.normalize(t)]
+    print(f"corpus: {len(texts)} replies, {chars} chars")
+    print(f"identical output: {len(texts) - len(diffs)}/{len(texts)}")
+    for t in diffs[:args.show]:
+        print("  --- input:  ", repr(t[:200]))
+        print("      legacy: ", repr(legacy_strip_markdown(t)[:200]))
+        print("      new:    ", repr(czytaj_text.normalize(t)[:200]))
+    old = _best(legacy_strip_markdown, texts, args.n)
+    new = _best(czytaj_text.normalize, texts, args.n)
+    per = 1e6 / len(texts)
+    print(f"legacy strip_markdown  {old * per:8.1f} µs/reply")
+    print(f"czytaj_text.normalize  {new * per:8.1f} µs/reply   ({old / new:.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,19 +11,26 @@ import json
 import os
 import re
 import signal
+import struct
 import subprocess
 import sys
 import time
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from czytaj_paths import (  # noqa: E402  — SSOT for paths/config/key (audit 2026-06-15)
-    FLAG_DIR, STATE_FILE, SPEAK_LOCK, LOG_FILE, PAUSE_FLAG, ADB_FLAG, SHIZUKU_FLAG,
+    FLAG_DIR, STATE_FILE, SPEAK_LOCK, PAUSE_FLAG, ADB_FLAG, SHIZUKU_FLAG,
     SCREEN_CACHE, ACTIVE_SESSION_FILE, SPOKEN_LEDGER, LAST_FOLDER_FILE,
-    MIC_CACHE, MEDIA_CACHE, VOL_CACHE, PIPER_BIN, VOICE_TYPER_FLAG, VOICE_TYPER_STALE_S,
+    MIC_CACHE, MEDIA_CACHE, VOL_CACHE, DEVICE_STATE, DEVICE_STATE_WANTED, PIPER_BIN, VOICE_TYPER_FLAG, VOICE_TYPER_STALE_S,
     TERMUX_HOME, TERMUX_PREFIX, TERMUX_FLAGS_DIR, READBACK_CACHE_DIRS, first_writable_dir,
-    AUDIO_CLIENT_PATS,
     project_dir as _project_dir, project_flag as _project_flag,
 )
+from czytaj_transcript import turn_start, read_from, assistant_texts, newest_digest  # noqa: E402
+import czytaj_log  # noqa: E402
+import czytaj_pids  # noqa: E402
+import czytaj_shell  # noqa: E402
+import czytaj_sessions  # noqa: E402
+import czytaj_store  # noqa: E402
+import czytaj_text  # noqa: E402
 # FLAG_DIR holds per-project flags: <sha1(realpath)>.flag (F15: legacy global flag removed).
 PAUSE_DEFAULT_S = 60.0
 SCREEN_CACHE_TTL_S = 5.0
@@ -48,17 +55,15 @@ ACTIVE_WINDOW_FLAG = os.environ.get(
 # most ONCE across all panes; a shared last-folder file drives the spoken
 # project-name announcement ("Utility. <tekst>") so the user knows which window.
 SPOKEN_LEDGER_TTL_S = 45.0      # sliding window; refreshed on every repeat attempt
+# Slot-file ledger (store-unavailable fallback): czytaj_store.LEDGER_SLOTS fixed records of
+# (sha1 digest, claim time), each claim one pread + pwrite of its own slot under flock.
+_LEDGER_REC = struct.Struct("<20sd")
 FOLDER_REANNOUNCE_S = 30.0      # re-say the folder name after this much channel idle
 
 
-def _log(*parts: object) -> None:
-    """Append timestamped event line to ~/.claude/czytaj.log. Never raises."""
-    try:
-        with open(LOG_FILE, "a") as f:
-            ts = time.strftime("%H:%M:%S") + f".{int((time.time() % 1) * 1000):03d}"
-            f.write(f"{ts} pid={os.getpid()} {' '.join(str(p) for p in parts)}\n")
-    except OSError:
-        pass
+def _log(tag: str, *parts: object, **fields: object) -> None:
+    """Append one structured record to ~/.claude/czytaj.log (czytaj_log). Never raises."""
+    czytaj_log.log(tag, *parts, **fields)
 SILENT_WAV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "silent.wav")
 PIPER_STREAM = os.path.join(os.path.dirname(os.path.abspath(__file__)), "piper_stream.py")
 # PIPER_BIN, VOICE_TYPER_FLAG, VOICE_TYPER_STALE_S come from czytaj_paths (imported above).
@@ -96,6 +101,11 @@ def mark_active_session(transcript_path: str) -> None:
     tid = _transcript_id(transcript_path)
     if not tid:
         return
+    try:
+        czytaj_store.put("active_session", tid, time.time())
+        return
+    except czytaj_store.StoreError:
+        pass
     try:
         tmp = ACTIVE_SESSION_FILE + ".tmp"
         with open(tmp, "w") as f:
@@ -117,23 +127,30 @@ def is_active_session(transcript_path: str) -> bool:
     tid = _transcript_id(transcript_path)
     if not tid:
         return True
-    try:
-        with open(ACTIVE_SESSION_FILE) as f:
-            lines = f.read().splitlines()
-    except OSError:
-        return True
-    if len(lines) < 2:
-        return True
-    active_tid = lines[0].strip()
-    try:
-        marked_at = float(lines[1].strip())
-    except ValueError:
+    active = _active_session()
+    if active is None:
         return True
+    active_tid, marked_at = active
     if time.time() - marked_at > ACTIVE_SESSION_TTL_S:
         return True
     return tid == active_tid
 
 
+def _active_session() -> tuple[str, float] | None:
+    """(transcript id, marked-at) of the last prompted session, or None if unknown."""
+    try:
+        row = czytaj_store.get("active_session")
+        return (row[0], row[1]) if row and row[0] else None
+    except czytaj_store.StoreError:
+        pass
+    try:
+        with open(ACTIVE_SESSION_FILE) as f:
+            lines = f.read().splitlines()
+        return lines[0].strip(), float(lines[1].strip())
+    except (OSError, IndexError, ValueError):
+        return None
+
+
 def is_recording() -> bool:
     """True while the Voice Typer keyboard is dictating. Per the integration
     contract the keyboard writes the current epoch (seconds) to VOICE_TYPER_FLAG
@@ -220,33 +237,37 @@ def is_device_silenced() -> bool:
     return vols.get("music", 1) == 0
 
 
-def _read_screen_cache() -> bool | None:
-    """Return cached unlock state if cache file is fresh, else None."""
+def _cache_get(key: str, path: str, ttl_s: float) -> str | None:
+    """A probe-cache value younger than ttl_s: the store row `key`, or (store
+    unavailable) the legacy cache file at `path` by mtime. None on a miss."""
+    now = time.time()
     try:
-        st = os.stat(SCREEN_CACHE)
-    except OSError:
-        return None
-    if time.time() - st.st_mtime > SCREEN_CACHE_TTL_S:
-        return None
+        return czytaj_store.cache_get(key, ttl_s, now)
+    except czytaj_store.StoreError:
+        pass
     try:
-        with open(SCREEN_CACHE) as f:
-            v = f.read().strip()
+        if now - os.stat(path).st_mtime < ttl_s:
+            with open(path) as f:
+                return f.read().strip()
     except OSError:
-        return None
-    if v not in ("0", "1"):
-        return None  # F46: torn/empty read → treat as cache-miss (re-probe), NOT locked
-    return v == "1"
+        pass
+    return None
 
 
-def _write_screen_cache(unlocked: bool) -> None:
-    # F46: atomic tmp+replace so a concurrent _read_screen_cache never sees a
-    # truncated/empty file (which would be misread as "locked" → suppress TTS).
-    tmp = SCREEN_CACHE + ".tmp"
+def _cache_put(key: str, path: str, value: str) -> None:
+    try:
+        czytaj_store.put(key, value, time.time())
+        return
+    except czytaj_store.StoreError:
+        pass
+    # F46: atomic tmp+replace so a concurrent reader never sees a truncated/empty
+    # file (an empty screen cache would be misread as "locked" → suppress TTS).
+    tmp = path + ".tmp"
     try:
         with open(tmp, "w") as f:
-            f.write("1" if unlocked else "0")
-        os.replace(tmp, SCREEN_CACHE)
-        os.chmod(SCREEN_CACHE, 0o600)
+            f.write(value)
+        os.replace(tmp, path)
+        os.chmod(path, 0o600)
     except OSError:
         try:
             os.unlink(tmp)
@@ -254,6 +275,18 @@ def _write_screen_cache(unlocked: bool) -> None:
             pass
 
 
+def _read_screen_cache() -> bool | None:
+    """Return cached unlock state if fresh, else None."""
+    v = _cache_get("screen", SCREEN_CACHE, SCREEN_CACHE_TTL_S)
+    if v not in ("0", "1"):
+        return None  # F46: torn/empty read → treat as cache-miss (re-probe), NOT locked
+    return v == "1"
+
+
+def _write_screen_cache(unlocked: bool) -> None:
+    _cache_put("screen", SCREEN_CACHE, "1" if unlocked else "0")
+
+
 def _shell_cmd_prefix() -> list[str] | None:
     """Return the prefix that runs the next args with shell uid via Shizuku
     (preferred) or Wireless ADB (fallback). Returns None if neither is
@@ -272,6 +305,11 @@ def _run_shell(shell_cmd: str, timeout_s: float = 2.0) -> tuple[bool, str]:
     prefix = _shell_cmd_prefix()
     if prefix is None:
         return False, ""
+    # Resident session (czytaj_shell): the probe is one command over an already-running
+    # rish/adb shell instead of a fresh ~1.2-8s JVM boot per probe.
+    if czytaj_shell.ENABLED:
+        return czytaj_shell.run(prefix[:-1] if prefix[0] == "rish" else prefix,
+                                shell_cmd, timeout_s)
     if prefix[0] == "rish":
         cmd = prefix + [shell_cmd]
     else:
@@ -290,7 +328,7 @@ def _run_shell(shell_cmd: str, timeout_s: float = 2.0) -> tuple[bool, str]:
     return True, r.stdout
 
 
-def is_screen_unlocked() -> bool:
+def is_screen_unlocked(fresh: bool = False) -> bool:
     """True iff the user is actively interacting with the device.
 
     Uses dumpsys power's mWakefulness — most reliable single signal:
@@ -305,12 +343,12 @@ def is_screen_unlocked() -> bool:
     waking, blocking TTS during active use. mWakefulness flips
     immediately on touch/wake.
 
-    Requires Shizuku or Wireless ADB. Cached 5s. Fails OPEN — missing
-    helper or probe error → return True (don't suppress TTS just
-    because the probe broke)."""
+    Requires Shizuku or Wireless ADB. Cached 5s (fresh=True skips the cache read —
+    the device-state sampler). Fails OPEN — missing helper or probe error → return
+    True (don't suppress TTS just because the probe broke)."""
     if _shell_cmd_prefix() is None:
         return True
-    cached = _read_screen_cache()
+    cached = None if fresh else _read_screen_cache()
     if cached is not None:
         return cached
     ok, out = _run_shell(
@@ -361,7 +399,7 @@ def _enabled_ime_packages() -> frozenset[str] | None:
     return _IME_PACKAGES_CACHE[1]
 
 
-def is_mic_recording_global() -> bool:
+def is_mic_recording_global(fresh: bool = False) -> bool:
     """True iff any non-IME, non-Termux app currently records the
     microphone (e.g. WhatsApp voice msg, Messenger call, dictaphone).
     IME keyboards (Voice Typer, GBoard voice, etc.) hold the mic open
@@ -370,15 +408,12 @@ def is_mic_recording_global() -> bool:
 
     Probe: dumpsys audio's per-session source client= entries, filtered
     by silenced:false (actively listening). Requires Shizuku or Wireless
-    ADB. Fails open. Cached for PROBE_CACHE_TTL_S (5s)."""
+    ADB. Fails open. Cached for PROBE_CACHE_TTL_S (5s) unless fresh=True."""
     if _shell_cmd_prefix() is None:
         return False
-    cache = MIC_CACHE
-    try:
-        if time.time() - os.stat(cache).st_mtime < PROBE_CACHE_TTL_S:
-            return open(cache).read().strip() == "1"
-    except OSError:
-        pass
+    cached = None if fresh else _cache_get("mic", MIC_CACHE, PROBE_CACHE_TTL_S)
+    if cached is not None:
+        return cached == "1"
     ok, out = _run_shell(
         "dumpsys audio | grep -E 'source client=.*silenced:false.*pack:'",
         timeout_s=1.2,
@@ -401,30 +436,23 @@ def is_mic_recording_global() -> bool:
                 continue
             recording = True
             break
-    try:
-        with open(cache, "w") as f:
-            f.write("1" if recording else "0")
-        os.chmod(cache, 0o600)
-    except OSError:
-        pass
+    _cache_put("mic", MIC_CACHE, "1" if recording else "0")
     return recording
 
 
-def is_external_media_playing() -> bool:
+def is_external_media_playing(fresh: bool = False) -> bool:
     """True iff a foreign app (WhatsApp, Spotify, Messenger, YouTube...)
     has an active MediaSession in PLAYING state. Finally enables the
     'wait until WhatsApp voice msg finishes' behaviour the user asked
     about in the original audit.
 
-    Requires Shizuku or Wireless ADB. Fails open. Cached for PROBE_CACHE_TTL_S (5s)."""
+    Requires Shizuku or Wireless ADB. Fails open. Cached for PROBE_CACHE_TTL_S (5s)
+    unless fresh=True."""
     if _shell_cmd_prefix() is None:
         return False
-    cache = MEDIA_CACHE
-    try:
-        if time.time() - os.stat(cache).st_mtime < PROBE_CACHE_TTL_S:
-            return open(cache).read().strip() == "1"
-    except OSError:
-        pass
+    cached = None if fresh else _cache_get("media", MEDIA_CACHE, PROBE_CACHE_TTL_S)
+    if cached is not None:
+        return cached == "1"
     ok, out = _run_shell(
         "cmd media_session list-sessions",
         timeout_s=1.2,
@@ -438,12 +466,7 @@ def is_external_media_playing() -> bool:
                     continue
                 playing = True
                 break
-    try:
-        with open(cache, "w") as f:
-            f.write("1" if playing else "0")
-        os.chmod(cache, 0o600)
-    except OSError:
-        pass
+    _cache_put("media", MEDIA_CACHE, "1" if playing else "0")
     return playing
 
 
@@ -497,37 +520,132 @@ def is_other_audio_playing(check_self: bool = True) -> bool:
          interrupt a still-playing turn (kill_previous=True) MUST pass
          check_self=False, otherwise the new turn would skip itself
          instead of killing the stale one.
+    Signals 2-5 come from the watcher's device-state snapshot when it is
+    fresh (read_device_state), and are probed inline only when it isn't.
     """
     if is_paused_by_user():   # cheap local flag — keep first so /pauza short-circuits the probes
         return True
-    # AR1 (parallelized): the four independent signals below are each a separate
-    # rish/termux-volume subprocess (~1.2-1.5s). Run SERIALLY they summed to ~5s on the
-    # auto-read hot path (the dominant auto-read latency). Run them CONCURRENTLY in a thread
-    # pool so the whole group costs ~one probe (~1.2s). Every probe fails OPEN (a thread that
-    # errors contributes False), so concurrency can't make us falsely skip — worst case it is
-    # no slower than before. Each probe self-caches 5s, so a 2nd Stop within the window is ~0.
-    import concurrent.futures
-    _probes = (is_screen_locked_probe, is_mic_recording_global,
-               is_external_media_playing, is_device_silenced)
-    try:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(_probes)) as _ex:
-            _futs = [_ex.submit(_p) for _p in _probes]
-            if any(_f.result() for _f in concurrent.futures.as_completed(_futs)):
-                return True
-    except Exception:
-        # Thread-pool failure must not suppress TTS — fall back to the serial chain.
-        if is_screen_locked_probe() or is_mic_recording_global() \
-                or is_external_media_playing() or is_device_silenced():
-            return True
+    # Signals 2-5: the watcher's fresh device-state snapshot when there is one (a file read),
+    # else probe now (parallel; each probe self-caches 5s, so a 2nd Stop in the window is ~0).
+    state = read_device_state()
+    if state is None:
+        state = _run_guard_probes()
+    if any(state.get(name) for name, _fn in GUARD_PROBES):
+        return True
     if check_self and is_self_already_speaking():
         return True
     return False
 
 
-def is_screen_locked_probe() -> bool:
+def is_screen_locked_probe(fresh: bool = False) -> bool:
     """`not is_screen_unlocked()` as a single callable, so the parallel guard pool can treat
     'screen locked' uniformly with the other 'should-skip' probes (each returns True == skip)."""
-    return not is_screen_unlocked()
+    return not is_screen_unlocked(fresh)
+
+
+def is_device_silenced_probe(fresh: bool = False) -> bool:
+    """is_device_silenced() with the guard-probe signature (it has no cache to skip)."""
+    return is_device_silenced()
+
+
+# ── Device-state snapshot (the guard as a lookup, not a probe) ──────────────
+# The four guard probes each self-cache 5s (czytaj_store row), so the FIRST Stop after an
+# idle gap still paid a full probe round (~1.2s on the auto-read hot path). While reading is
+# on, volume_watcher's sampler thread runs them fresh every few seconds and writes ONE
+# snapshot (DEVICE_STATE: {"ts", <probe name>: bool, …}); is_other_audio_playing reads that
+# instead of probing. Same freshness contract as the per-probe caches: a snapshot older than
+# DEVICE_STATE_MAX_AGE_S is ignored and the hook probes itself (reading off / watcher dead /
+# sampler idle — each read touches DEVICE_STATE_WANTED, which keeps the sampler going).
+DEVICE_STATE_MAX_AGE_S = PROBE_CACHE_TTL_S
+GUARD_PROBES = (("screen_locked", is_screen_locked_probe),
+                ("mic_recording", is_mic_recording_global),
+                ("external_media", is_external_media_playing),
+                ("silenced", is_device_silenced_probe))
+
+
+def _run_guard_probes(fresh: bool = False) -> dict[str, bool]:
+    """Every guard probe (True == skip), concurrently. A probe that raises counts False."""
+    # AR1 (parallelized): each probe is a separate rish/termux-volume round-trip (~1.2-1.5s
+    # cold). Run SERIALLY they summed to ~5s on the auto-read hot path; in a thread pool the
+    # group costs ~one probe. Every probe fails OPEN, so concurrency can't make us falsely skip.
+    import concurrent.futures
+    out = {}
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(GUARD_PROBES)) as ex:
+            futs = {name: ex.submit(fn, fresh) for name, fn in GUARD_PROBES}
+            for name, fut in futs.items():
+                try:
+                    out[name] = bool(fut.result())
+                except Exception:
+                    out[name] = False
+    except Exception:
+        # Thread-pool failure must not suppress TTS — fall back to the serial chain.
+        for name, fn in GUARD_PROBES:
+            if name not in out:
+                try:
+                    out[name] = bool(fn(fresh))
+                except Exception:
+                    out[name] = False
+    return out
+
+
+def sample_device_state() -> dict:
+    """Probe everything fresh and publish the snapshot (atomic tmp+replace). Called by the
+    watcher's sampler thread; returns the snapshot written."""
+    state: dict = _run_guard_probes(fresh=True)
+    state["ts"] = time.time()
+    tmp = f"{DEVICE_STATE}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w") as f:
+            json.dump(state, f)
+        os.chmod(tmp, 0o600)
+        os.replace(tmp, DEVICE_STATE)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+    return state
+
+
+def _mark_device_state_wanted() -> None:
+    """Tell the sampler a hook wants the snapshot (it samples only on recent demand)."""
+    try:
+        os.utime(DEVICE_STATE_WANTED)
+    except FileNotFoundError:
+        try:
+            open(DEVICE_STATE_WANTED, "a").close()
+        except OSError:
+            pass
+    except OSError:
+        pass
+
+
+def device_state_wanted_age() -> float:
+    """Seconds since a hook last asked for the snapshot (inf if never)."""
+    try:
+        return time.time() - os.path.getmtime(DEVICE_STATE_WANTED)
+    except OSError:
+        return float("inf")
+
+
+def read_device_state(max_age_s: float = DEVICE_STATE_MAX_AGE_S) -> dict | None:
+    """The sampler's snapshot if it is fresh and complete, else None (caller probes).
+    Every call renews the sampler's demand marker."""
+    _mark_device_state_wanted()
+    try:
+        with open(DEVICE_STATE) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict):
+        return None
+    ts = state.get("ts")
+    if not isinstance(ts, (int, float)) or not (0 <= time.time() - ts <= max_age_s):
+        return None
+    if any(name not in state for name, _fn in GUARD_PROBES):
+        return None
+    return state
 
 
 # Removed: is_mic_busy(). The mic-probe approach was unreliable because
@@ -553,8 +671,14 @@ def wait_for_recording_grace(timeout_s: float = 0.6, step_s: float = 0.05) -> bo
     return False
 
 
-def load_state() -> dict:
-    """Read state with shared lock — safe against concurrent writers."""
+def load_state(conn=None) -> dict:
+    """Spoken-text state from the store (conn=tx joins a czytaj_store transaction);
+    the per-file fallback reads under a shared lock — safe against concurrent writers."""
+    try:
+        data = czytaj_store.get_json("state", conn)
+        return data if isinstance(data, dict) else {"last_uuid": "", "spoken_text": ""}
+    except czytaj_store.StoreError:
+        pass
     try:
         with open(STATE_FILE, "r") as f:
             try:
@@ -575,11 +699,12 @@ def load_state() -> dict:
         return {"last_uuid": "", "spoken_text": ""}
 
 
-def save_state(state: dict) -> None:
-    """Write state atomically (tempfile + os.replace) under exclusive lock: a
-    reader never sees a torn file. NOTE this is torn-write protection, NOT
-    lost-update prevention — the read-modify-write is not one critical section;
-    serialization of concurrent PreToolUse + Stop relies on SPEAK_LOCK (F45)."""
+def save_state(state: dict, conn=None) -> None:
+    """Write state to the store (conn=tx: inside the caller's transaction), else
+    atomically to STATE_FILE (tempfile + os.replace under exclusive lock: a reader
+    never sees a torn file). NOTE this is torn-write protection, NOT lost-update
+    prevention — the read-modify-write is not one critical section; serialization
+    of concurrent PreToolUse + Stop relies on SPEAK_LOCK (F45)."""
     spoken = state.get("spoken_text", "")
     if isinstance(spoken, str) and len(spoken.encode("utf-8")) > MAX_SPOKEN_TEXT_BYTES:
         encoded = spoken.encode("utf-8")[-MAX_SPOKEN_TEXT_BYTES:]
@@ -589,6 +714,11 @@ def save_state(state: dict) -> None:
             spoken = spoken[-MAX_SPOKEN_TEXT_BYTES:]
         state = dict(state)
         state["spoken_text"] = spoken
+    try:
+        czytaj_store.put_json("state", state, time.time(), conn)
+        return
+    except czytaj_store.StoreError:
+        pass
     tmp_path = STATE_FILE + ".tmp"
     try:
         flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
@@ -634,42 +764,20 @@ def _parse_current_turn(transcript_path: str) -> tuple[str, str, str]:
         return "", "", "no-transcript"
     if not path_real.startswith(home_real + os.sep):
         return "", "", "no-transcript"
+    # Incremental: the offset index (czytaj_transcript) scans only bytes appended since the
+    # previous hook, then we decode just the current turn — was readlines()+json.loads over
+    # the whole (tens-of-MB) transcript, up to 5x per hook on the retry path.
     try:
-        # F22: errors="replace" so a non-UTF8 byte can't raise UnicodeDecodeError
-        # (NOT an OSError) and crash the Stop/PreToolUse hook with a nonzero exit.
-        with open(transcript_path, encoding="utf-8", errors="replace") as f:
-            lines = f.readlines()
+        start = turn_start(transcript_path)
+        if start < 0:
+            return "", "", "no-user-msg"
+        turn = read_from(transcript_path, start)
     except OSError:
         return "", "", "no-transcript"
 
-    last_user_idx = -1
-    for i, line in enumerate(lines):
-        try:
-            msg = json.loads(line)
-        except Exception:
-            continue
-        if msg.get("type") != "user":
-            continue
-        content = msg.get("message", {}).get("content", [])
-        is_tool_result = False
-        if isinstance(content, list):
-            for c in content:
-                if isinstance(c, dict) and c.get("type") == "tool_result":
-                    is_tool_result = True
-                    break
-        if not is_tool_result:
-            last_user_idx = i
-
-    if last_user_idx < 0:
-        return "", "", "no-user-msg"
-
     texts: list[str] = []
     last_uuid = ""
-    for line in lines[last_user_idx + 1:]:
-        try:
-            msg = json.loads(line)
-        except Exception:
-            continue
+    for msg in turn:
         if msg.get("type") != "assistant":
             continue
         content = msg.get("message", {}).get("content", [])
@@ -719,29 +827,9 @@ def current_turn_text(transcript_path: str) -> tuple[str, str]:
 
 
 def strip_markdown(text: str) -> str:
-    t = text
-    # Match fenced code blocks even when they contain single backticks (was a
-    # bug: r'```[^`]*```' breaks on inline `code` inside fences).
-    t = re.sub(r"```.*?```", " ", t, flags=re.DOTALL)
-    t = re.sub(r"```.*$", " ", t, flags=re.DOTALL)  # F26: drop an unterminated/odd fence
-    t = re.sub(r"`([^`]+)`", r"\1", t)
-    # F28: treat * / ** as emphasis ONLY when not hugging a word char, so
-    # arithmetic/globs (a*b*c, 2*3*4, *.py) aren't fused into "abc"/"234".
-    t = re.sub(r"(?<!\w)\*\*([^*]+)\*\*(?!\w)", r"\1", t)
-    t = re.sub(r"(?<!\w)\*([^*]+)\*(?!\w)", r"\1", t)
-    t = re.sub(r"^#+\s*", "", t, flags=re.MULTILINE)
-    t = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", t)
-    # F30: drop horizontal rules, table pipes, and emoji so a reply that is only
-    # rules/pipes/emoji doesn't synthesize as noise (the lone "if not speakable"
-    # guard let "---" / "| a | b |" / "✅" through).
-    t = re.sub(r"(?m)^\s*[-=*_]{3,}\s*$", " ", t)
-    t = re.sub(r"\|", " ", t)
-    t = re.sub(r"[\U0001F000-\U0001FAFF\U00002600-\U000027BF\U0001F1E6-\U0001F1FF️←-⇿⌀-⏿]", "", t)
-    t = re.sub(r"^\s*[-*]\s+", ". ", t, flags=re.MULTILINE)
-    t = re.sub(r"^\s*\d+\.\s+", ". ", t, flags=re.MULTILINE)
-    t = re.sub(r"\n{2,}", ". ", t)
-    t = re.sub(r"\s+", " ", t)
-    return t.strip()
+    """Speakable text of a markdown reply — czytaj_text's single-pass normalizer (fences,
+    inline code, emphasis, links, headings, lists, rules, tables, emoji)."""
+    return czytaj_text.normalize(text)
 
 
 def _truncate_to_sentence(text: str, limit: int) -> str:
@@ -755,26 +843,33 @@ def _truncate_to_sentence(text: str, limit: int) -> str:
 
 
 def _kill_audio_chain() -> None:
-    # F21: anchor piper_stream to its python invocation so the pattern can't also
-    # match an editor/grep whose argv contains "piper_stream" (the binaries are
-    # specific enough). NEVER matches piper_server — the warm daemon must survive.
-    for pat in AUDIO_CLIENT_PATS:   # M13: SSOT — czytaj_paths.AUDIO_CLIENT_PATS (== czytaj-env.sh)
-        subprocess.run(
-            ["pkill", "-9", "-f", pat],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-    # paplay leaves audio in PulseAudio sink-input buffer that keeps playing
-    # for hundreds of ms after pkill. Forcibly drop all sink-inputs so the
-    # buffer is flushed.
+    # Registry kill (czytaj_pids): piper_stream records itself — its whole process group when
+    # started new-session, as every _speak spawn is — plus its paplay / wake-tone children, so
+    # this is a few kill() calls, no fork. Was one `pkill -9 -f` per AUDIO_CLIENT_PATS entry
+    # (a fork + full /proc scan each). piper_server never registers — the warm daemon survives.
+    if not czytaj_pids.kill_all():
+        return
+    # A paplay was killed: it leaves audio in the PulseAudio sink-input buffer that keeps
+    # playing for hundreds of ms. Forcibly drop all sink-inputs so the buffer is flushed —
+    # one list + ONE pacmd batch of kill-sink-input lines (per-id pactl only if pacmd fails).
     try:
         r = subprocess.run(
             ["pactl", "list", "short", "sink-inputs"],
             capture_output=True, text=True, timeout=1,
         )
-        for line in r.stdout.splitlines():
-            sid = line.split("\t", 1)[0].strip()
-            if sid.isdigit():
+        sids = [line.split("\t", 1)[0].strip() for line in r.stdout.splitlines()]
+        sids = [sid for sid in sids if sid.isdigit()]
+        if not sids:
+            return
+        try:
+            ok = subprocess.run(
+                ["pacmd"], input="".join(f"kill-sink-input {sid}\n" for sid in sids),
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, text=True, timeout=1,
+            ).returncode == 0
+        except FileNotFoundError:
+            ok = False
+        if not ok:
+            for sid in sids:
                 subprocess.run(
                     ["pactl", "kill-sink-input", sid],
                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
@@ -807,7 +902,7 @@ def _project_label(cwd: str, transcript_path: str) -> str:
     return ""
 
 
-def _ledger_claim(content_hash: str) -> bool:
+def _ledger_claim(content_hash: str, conn=None) -> bool:
     """Atomically claim a content hash in the cross-window spoken-ledger.
     Returns True if THIS caller may speak (nobody spoke this exact content
     within the sliding TTL), False if another pane/fire already spoke it.
@@ -816,10 +911,21 @@ def _ledger_claim(content_hash: str) -> bool:
     so a burst of N identical reads staggered over time stays suppressed as
     long as each gap is < TTL — this is what kills the X4 duplicate-read bug.
 
+    Constant cost whatever the history: each hash owns one fixed slot (store row or
+    record in the slot file, czytaj_store.ledger_slot) and expiry is lazy — a stale
+    slot is simply overwritten, nothing is parsed, pruned or rewritten wholesale.
+
     Fails OPEN (returns True) if the ledger can't be accessed — a broken
-    ledger must never silence TTS entirely. Self-contained flock, so it is
-    correct even on the rare path where SPEAK_LOCK failed to open."""
+    ledger must never silence TTS entirely. Atomic on its own (store transaction,
+    or the file path's flock), so it is correct even on the rare path where
+    SPEAK_LOCK failed to open; conn=tx joins the caller's transaction."""
     now = time.time()
+    try:
+        return czytaj_store.ledger_claim(content_hash, SPOKEN_LEDGER_TTL_S, now, conn)
+    except czytaj_store.StoreError:
+        pass
+    slot, digest = czytaj_store.ledger_slot(content_hash)
+    off = slot * _LEDGER_REC.size
     try:
         fd = os.open(SPOKEN_LEDGER, os.O_RDWR | os.O_CREAT, 0o600)
     except OSError:
@@ -829,38 +935,16 @@ def _ledger_claim(content_hash: str) -> bool:
             fcntl.flock(fd, fcntl.LOCK_EX)
         except OSError:
             pass
-        raw = b""
-        try:
-            while True:
-                chunk = os.read(fd, 65536)
-                if not chunk:
-                    break
-                raw += chunk
-        except OSError:
-            pass
-        try:
-            data = json.loads(raw.decode("utf-8")) if raw else {}
-            if not isinstance(data, dict):
-                data = {}
-        except (ValueError, UnicodeDecodeError):
-            data = {}
-        prev = data.get(content_hash)
         fresh = False
-        if prev is not None:
-            try:
-                fresh = (now - float(prev)) < SPOKEN_LEDGER_TTL_S
-            except (TypeError, ValueError):
-                fresh = False
-        pruned = {h: t for h, t in data.items()
-                  if isinstance(t, (int, float)) and (now - t) < SPOKEN_LEDGER_TTL_S}
-        pruned[content_hash] = now  # always refresh → sliding window
-        # F14: write THEN truncate-to-length (not truncate-first) so a failed write
-        # can't leave a guaranteed-empty ledger that silently resets the dedup window.
         try:
-            payload = json.dumps(pruned).encode("utf-8")
-            os.lseek(fd, 0, 0)
-            os.write(fd, payload)
-            os.ftruncate(fd, len(payload))
+            rec = os.pread(fd, _LEDGER_REC.size, off)
+            if len(rec) == _LEDGER_REC.size:
+                prev_digest, prev_ts = _LEDGER_REC.unpack(rec)
+                fresh = prev_digest == digest and 0 <= now - prev_ts < SPOKEN_LEDGER_TTL_S
+        except (OSError, struct.error):
+            fresh = False
+        try:
+            os.pwrite(fd, _LEDGER_REC.pack(digest, now), off)  # always refresh → sliding window
         except OSError:
             pass
         return not fresh
@@ -872,7 +956,25 @@ def _ledger_claim(content_hash: str) -> bool:
             pass
 
 
-def _maybe_folder_prefix(label: str) -> str:
+def _claim_and_save(content_hash: str, uuid: str, full_text: str, label: str,
+                    conn=None) -> tuple[bool, str]:
+    """_speak_inner's claim → save-state → folder-prefix step: (claimed, prefix)."""
+    claimed = _ledger_claim(content_hash, conn)
+    # Mark this suffix as "already spoken" BEFORE we kick off playback (and on a lost
+    # claim too, so this pane won't retry it). If a new user message arrives
+    # mid-speech and aborts the player, this suffix is intentionally lost (the new
+    # turn is more important than re-reading the previous one — the user can ask
+    # again if needed). Without this, interrupted playback caused the same message
+    # to be re-spoken next turn.
+    save_state({"last_uuid": uuid, "spoken_text": full_text}, conn)
+    # Folder announcement: prepend the project name when the reading channel
+    # switches context (different folder, or after a pause), so the user hears
+    # e.g. "Utility. <tekst>" and knows which window is talking.
+    prefix = _maybe_folder_prefix(label, conn) if claimed else ""
+    return claimed, prefix
+
+
+def _maybe_folder_prefix(label: str, conn=None) -> str:
     """Return 'Label. ' when the reading channel switches project context
     (different folder than last spoken, or after FOLDER_REANNOUNCE_S idle),
     else ''. The last-folder file is shared across panes, so switching to a
@@ -881,6 +983,13 @@ def _maybe_folder_prefix(label: str) -> str:
     if not label:
         return ""
     now = time.time()
+    try:
+        row = czytaj_store.get("last_folder", conn)
+        czytaj_store.put("last_folder", label, now, conn)
+        last_label, last_ts = row if row else ("", 0.0)
+        return f"{label}. " if label != last_label or (now - last_ts) > FOLDER_REANNOUNCE_S else ""
+    except czytaj_store.StoreError:
+        pass
     last_label, last_ts = "", 0.0
     try:
         with open(LAST_FOLDER_FILE) as f:
@@ -921,21 +1030,18 @@ _VOL_CACHE_TTL_S = 5.0
 def _music_volume() -> "int | None":
     """Current media (music) stream volume via termux-volume, cached 5s. None if
     unknown (Termux:API missing/erroring) — caller then skips the warning."""
-    try:
-        if time.time() - os.stat(_VOL_CACHE).st_mtime < _VOL_CACHE_TTL_S:
-            return int(open(_VOL_CACHE).read().strip())
-    except (OSError, ValueError):
-        pass
+    cached = _cache_get("volume", _VOL_CACHE, _VOL_CACHE_TTL_S)
+    if cached is not None:
+        try:
+            return int(cached)
+        except ValueError:
+            pass
     try:
         r = subprocess.run(["termux-volume"], capture_output=True, text=True, timeout=3)
         for s in json.loads(r.stdout):
             if s.get("stream") == "music":
                 vol = int(s.get("volume", -1))
-                try:
-                    with open(_VOL_CACHE, "w") as f:
-                        f.write(str(vol))
-                except OSError:
-                    pass
+                _cache_put("volume", _VOL_CACHE, str(vol))
                 return vol
     except (subprocess.SubprocessError, FileNotFoundError, OSError,
             ValueError, json.JSONDecodeError):
@@ -985,7 +1091,7 @@ def speak_new_text(transcript_path: str, kill_previous: bool, cwd: str = "") ->
         kill_previous = False  # a background pane must never cut off the active one
     _t_guard = time.monotonic()
     _other = is_other_audio_playing(check_self=not kill_previous)
-    _log("GUARD", caller, f"+{time.monotonic() - _t_guard:.2f}s", "skip" if _other else "pass")  # AR4: time the rish guard chain
+    _log("GUARD", caller, "skip" if _other else "pass", guard_s=round(time.monotonic() - _t_guard, 3))  # AR4: time the rish guard chain
     if _other:
         _log("SKIP", caller, "reason=other-audio")
         return 0
@@ -996,7 +1102,7 @@ def speak_new_text(transcript_path: str, kill_previous: bool, cwd: str = "") ->
     try:
         lock_fd = os.open(SPEAK_LOCK, os.O_CREAT | os.O_RDWR, 0o600)
     except OSError:
-        _log("LOCK", caller, "open-fail")
+        _log("LOCK", caller, "open-fail", level="warn")
         return _speak_inner(transcript_path, kill_previous, caller, cwd)
     try:
         deadline = time.monotonic() + 2.0
@@ -1069,28 +1175,25 @@ def _speak_inner(transcript_path: str, kill_previous: bool, caller: str = "?", c
     content_hash = hashlib.sha1(
         (label + "\x00" + speakable).encode("utf-8")
     ).hexdigest()
-    if not _ledger_claim(content_hash):
+    # Claim + save-state + folder-prefix are ONE czytaj_store transaction (was three
+    # separate file rewrites another pane could interleave); tx is None → per-file path.
+    # A failed COMMIT is rolled back and raises StoreError → redo the three one by one
+    # (each accessor then takes its own store-or-file path).
+    try:
+        with czytaj_store.transaction() as tx:
+            claimed, prefix = _claim_and_save(content_hash, uuid, full_text, label, tx)
+    except czytaj_store.StoreError as e:
+        _log("STORE", caller, "commit-fail", repr(e), level="warn")
+        claimed, prefix = _claim_and_save(content_hash, uuid, full_text, label, None)
+    if not claimed:
         _log("SKIP", caller, "reason=already-spoken-elsewhere", content_hash[:8])
-        save_state({"last_uuid": uuid, "spoken_text": full_text})
         return 0
-
-    # Mark this suffix as "already spoken" BEFORE we kick off playback. If a
-    # new user message arrives mid-speech and aborts the player, this suffix
-    # is intentionally lost (the new turn is more important than re-reading
-    # the previous one — the user can ask again if needed). Without this,
-    # interrupted playback caused the same message to be re-spoken next turn.
-    save_state({"last_uuid": uuid, "spoken_text": full_text})
-
-    # Folder announcement: prepend the project name when the reading channel
-    # switches context (different folder, or after a pause), so the user hears
-    # e.g. "Utility. <tekst>" and knows which window is talking.
-    prefix = _maybe_folder_prefix(label)
     audio_text = prefix + speakable if prefix else speakable
     _log("SPEAK", caller, "label=", label or "-", "len=", len(audio_text),
          "first40=", repr(audio_text[:40]))
 
     # Cross-window QUEUE model: NO global kill here. _kill_audio_chain stops the
-    # shared player + pkills piper_stream GLOBALLY, which cut OTHER windows' audio
+    # shared player + kills every registered piper_stream GLOBALLY, which cut OTHER windows' audio
     # mid-utterance. Within a window the new utterance replaces its own previous via
     # the single Android player's play (latest-wins); across windows piper_stream's
     # _reserve_channel makes a later window WAIT its turn (queue). The new-turn
@@ -1120,7 +1223,7 @@ def _speak_inner(transcript_path: str, kill_previous: bool, caller: str = "?", c
     # last-turn text read-back/precache use (_turn_texts[-1] + _readback_cache_path), so
     # the keys line up. Best-effort: any error just skips the cache populate.
     try:
-        _turns = _turn_texts(transcript_path)
+        _turns = _turn_texts(transcript_path, limit=1)
         # RG1: only PRE-FILL the read-back cache when the audio we're about to synth
         # EQUALS what a read-back of the last turn would say — i.e. no folder prefix AND
         # the new suffix IS the whole last turn. Otherwise a cache HIT would replay a stray
@@ -1144,7 +1247,7 @@ def _speak_inner(transcript_path: str, kill_previous: bool, caller: str = "?", c
             env=child_env,
         )
     except (FileNotFoundError, OSError) as e:
-        _log("ENGINE", "spawn-fail", repr(e))
+        _log("ENGINE", "spawn-fail", repr(e), level="warn")
         return 0
 
     try:
@@ -1160,7 +1263,7 @@ def _speak_inner(transcript_path: str, kill_previous: bool, caller: str = "?", c
         except OSError:
             pass
     except (BrokenPipeError, OSError) as e:
-        _log("ENGINE", "stdin-pipe-fail", repr(e))
+        _log("ENGINE", "stdin-pipe-fail", repr(e), level="warn")
 
     return 0
 
@@ -1220,9 +1323,11 @@ def _stop_previous_readback(stop_player: bool = True) -> None:
 
 
 def stop_now() -> None:
-    """Silence TTS immediately: stop the shared Android player and kill the
-    audio chain (piper_stream / paplay / termux-media-player). The warm
-    piper_server daemon is intentionally left alive. Bound to VolumeDown."""
+    """Silence TTS immediately: kill the audio chain (piper_stream / paplay /
+    termux-media-player — registry kills, milliseconds) and stop the shared Android
+    player. Killed first so nothing re-plays behind the ~1.7s `stop` round-trip. The
+    warm piper_server daemon is intentionally left alive. Bound to VolumeDown."""
+    _kill_audio_chain()
     try:
         subprocess.run(
             ["termux-media-player", "stop"],
@@ -1230,7 +1335,6 @@ def stop_now() -> None:
         )
     except (subprocess.SubprocessError, FileNotFoundError, OSError):
         pass
-    _kill_audio_chain()
     _log("ACTION", "stop_now")
 
 
@@ -1252,6 +1356,7 @@ def speak_text_now(text: str, owner: str = "manual", priority: str = "active",
     child_env = dict(os.environ)
     child_env["CZYTAJ_TID"] = owner or "manual"
     child_env["CZYTAJ_PRIORITY"] = priority
+    child_env["CZYTAJ_SYNTH_PRIORITY"] = "interactive"   # the user is waiting: jump queued precache
     if save_wav:                    # RC2: fill the read-back cache with THIS on-demand synth
         try:                        # so the next identical VolumeUp is an instant HIT. Keyed by
             os.makedirs(os.path.dirname(save_wav), exist_ok=True)  # the SAME raw turn text the
@@ -1268,7 +1373,7 @@ def speak_text_now(text: str, owner: str = "manual", priority: str = "active",
             env=child_env,
         )
     except (FileNotFoundError, OSError) as e:
-        _log("ACTION", "speak_text_now", "spawn-fail", repr(e))
+        _log("ACTION", "speak_text_now", "spawn-fail", repr(e), level="warn")
         return False
     if track:                       # read-back scrubbing: remember this child so the
         global _readback_proc       # NEXT VolumeUp can interrupt it (no concurrent reads)
@@ -1294,6 +1399,9 @@ def _transcript_for_project(proj_path: str) -> str:
     proj_path = (proj_path or "").strip()
     if not proj_path:
         return ""
+    t = czytaj_sessions.for_project(proj_path)   # UPS-maintained index: a few stats, no glob
+    if t:
+        return t
     encoded = "-" + proj_path.strip("/").replace("/", "-")
     cands = glob.glob(os.path.expanduser(f"~/.claude/projects/{encoded}/*.jsonl"))
     if not cands:  # fallback: match the encoded dir ending in the project basename
@@ -1381,6 +1489,8 @@ def _resolve_active_transcript() -> str:
        when tmux isn't in use / is unreachable.
     2) global active-session marker (last session that got a user prompt).
     3) most-recently-modified transcript anywhere.
+    Steps 1–3 consult the czytaj_sessions index first; the ~/.claude/projects globs are
+    only its cold-start fallback.
     Each step falls through, so it degrades cleanly when an earlier signal is absent."""
     import glob
     # 0) live tmux active window — read at press time, immune to the keyboard
@@ -1397,13 +1507,14 @@ def _resolve_active_transcript() -> str:
         t = _transcript_for_project(proj)
         if t:
             return t
-    # 2) active-session marker (basename), then 3) most-recent anywhere
-    tid = ""
-    try:
-        with open(ACTIVE_SESSION_FILE) as f:
-            tid = f.read().splitlines()[0].strip()
-    except (OSError, IndexError):
-        tid = ""
+    # 2) active-session marker (basename), then 3) most-recent anywhere. The session index
+    # holds the last-prompted transcript's full path — that IS the marker's session, so the
+    # globs below only run on a cold start (nothing recorded yet / store unavailable).
+    active = _active_session()
+    tid = active[0] if active else ""
+    t = czytaj_sessions.latest()
+    if t and (not tid or os.path.basename(t) == tid):
+        return t
     candidates: list[str] = []
     if tid:
         candidates = glob.glob(os.path.expanduser(f"~/.claude/projects/*/{tid}"))
@@ -1417,28 +1528,40 @@ def _resolve_active_transcript() -> str:
         return candidates[0]
 
 
-_turn_texts_cache = {"key": None, "ts": 0.0, "val": []}
+_turn_texts_cache = {"key": None, "ts": 0.0, "val": [], "limit": 0}
 _TURN_TEXTS_TTL_S = 2.5   # match the tmux active-window cache; covers a rapid VolumeUp scrub burst
 
 
-def _turn_texts(transcript_path: str) -> list[str]:
+def _claude_transcript(transcript_path: str) -> str:
+    """realpath of `transcript_path` if it is an existing file under ~/.claude, else ""."""
+    if not transcript_path or not os.path.isfile(transcript_path):
+        return ""
+    home_real = os.path.realpath(os.path.expanduser("~/.claude"))
+    try:
+        path_real = os.path.realpath(transcript_path)
+    except OSError:
+        return ""
+    return path_real if path_real.startswith(home_real + os.sep) else ""
+
+
+def _turn_texts(transcript_path: str, limit: int = 0) -> list[str]:
     """Each assistant message (one transcript entry's concatenated text), oldest→
     newest — the granularity VolumeUp steps back through (n-th from the end). Each
     reply bubble is its own entry even when several are emitted in one turn around
     tool calls, which matches how the user thinks of 'messages'.
 
+    limit>0 returns only the newest `limit` messages, each read with one pread via the
+    on-disk message index (czytaj_transcript.assistant_texts — shared by the watcher, the
+    precache worker and the hooks; only appended bytes are ever parsed). Callers that want
+    the n-th from the end pass limit=n; a shorter list means the transcript holds fewer,
+    exactly as before.
+
     M5 (audit 2026-06-15): memoized by (path, mtime, size) for a short TTL so a rapid VolumeUp
-    scrub burst — and precache.py's n=1..N loop (which calls this once per turn) — don't
-    re-readlines()+json.loads the whole, ever-growing transcript on every call before the
-    cached wav plays. Invalidates the instant the transcript grows (mtime or size changes)."""
-    if not transcript_path or not os.path.isfile(transcript_path):
-        return []
-    home_real = os.path.realpath(os.path.expanduser("~/.claude"))
-    try:
-        path_real = os.path.realpath(transcript_path)
-    except OSError:
-        return []
-    if not path_real.startswith(home_real + os.sep):
+    scrub burst doesn't re-scan the transcript on every call before the cached wav plays
+    (precache_turns parses once for all its turns anyway). A cached result
+    serves any limit it covers. Invalidates the instant the transcript grows."""
+    path_real = _claude_transcript(transcript_path)
+    if not path_real:
         return []
     try:
         st = os.stat(transcript_path)
@@ -1448,32 +1571,19 @@ def _turn_texts(transcript_path: str) -> list[str]:
     now = time.monotonic()
     if (key is not None and _turn_texts_cache["key"] == key
             and now - _turn_texts_cache["ts"] < _TURN_TEXTS_TTL_S):
-        return _turn_texts_cache["val"]
+        got, got_limit = _turn_texts_cache["val"], _turn_texts_cache["limit"]
+        # Covered: cached set was complete (no limit / ran out of messages) or big enough.
+        if not got_limit or len(got) < got_limit or (limit and limit <= got_limit):
+            return got[-limit:] if limit else got
     try:
-        with open(transcript_path, encoding="utf-8", errors="replace") as f:
-            lines = f.readlines()
+        msgs = assistant_texts(transcript_path, limit)
     except OSError:
         return []
-    msgs: list[str] = []
-    for line in lines:
-        try:
-            msg = json.loads(line)
-        except Exception:
-            continue
-        if msg.get("type") != "assistant":
-            continue
-        content = msg.get("message", {}).get("content", [])
-        if not isinstance(content, list):
-            continue
-        parts = [c["text"] for c in content
-                 if isinstance(c, dict) and c.get("type") == "text" and c.get("text")]
-        joined = "\n".join(parts).strip()
-        if joined:
-            msgs.append(joined)
     if key is not None:
         _turn_texts_cache["key"] = key
         _turn_texts_cache["ts"] = now
         _turn_texts_cache["val"] = msgs
+        _turn_texts_cache["limit"] = limit
     return msgs
 
 
@@ -1486,6 +1596,14 @@ def _turn_texts(transcript_path: str) -> list[str]:
 # termux-media-player can open (PRoot paths are invisible to it).
 READBACK_CACHE_MAX = 5             # wavs kept per session (oldest evicted)
 READBACK_CACHE_MAX_SESSIONS = 8    # session dirs kept (older pruned)
+PRECACHE_TAG = "precache:"         # server queue tag prefix; + "<session>:" per transcript
+
+
+def precache_tag(session: str) -> str:
+    """Queue tag for one transcript's precache jobs. precache.request drops the queued ones
+    with cancel_pending(precache_tag(s)) when a newer job for the transcript arrives while
+    the worker is busy; the worker then sees SynthCancelled and stops that transcript."""
+    return f"{PRECACHE_TAG}{session}:"
 
 
 def _safe_mtime(p: str) -> float:
@@ -1572,37 +1690,68 @@ def _readback_cache_prune_sessions() -> None:
         shutil.rmtree(old, ignore_errors=True)
 
 
-def precache_turn(transcript_path: str, n: int = 1) -> None:
-    """Pre-synthesise the n-th-from-last assistant turn into the read-back cache so the
-    next VolumeUp on it is instant. Run in the BACKGROUND (Stop hook when reading is on,
-    or after a read-back miss). No-op if already cached or nothing speakable."""
-    turns = _turn_texts(transcript_path)
-    if not turns:
-        return
-    n = max(1, min(int(n), len(turns)))
-    text = turns[-n]
+def _readback_in_flight(dst: str) -> bool:
+    """Is someone already writing `dst`? (A fresh per-pid tmp of it: the precache worker's,
+    or an on-demand read-back saving its synth via CZYTAJ_SAVE_WAV.)"""
+    d, base = os.path.split(dst)
+    now = time.time()
+    try:
+        names = os.listdir(d)
+    except OSError:
+        return False
+    return any(f.startswith(base + ".") and f.endswith(".tmp")
+               and now - _safe_mtime(os.path.join(d, f)) < 120 for f in names)
+
+
+def precache_turns(transcript_path: str, maxn: int, superseded=None) -> None:
+    """Pre-synthesise the last `maxn` assistant turns (newest first) into the read-back
+    cache so the next VolumeUp on them is instant. Run by the single precache.py worker.
+    The transcript is parsed ONCE for all of them; a turn already cached, being written
+    by someone else, or repeating an earlier turn's text (same cache key) is skipped.
+    Stops early when superseded() says a newer job for this transcript is queued, or
+    when the server cancelled a job as stale."""
+    turns = _turn_texts(transcript_path, limit=max(1, int(maxn)))
     session = os.path.basename(transcript_path)
-    if _readback_cache_get(session, text):
-        return  # already cached
-    dst = _readback_cache_path(session, text)
-    if not dst:
-        return
+    seen: set[str] = set()
+    for n in range(1, len(turns) + 1):
+        if superseded is not None and superseded():
+            _log("PRECACHE", "superseded", session[:20], "n=", n)
+            return
+        text = turns[-n]
+        dst = _readback_cache_path(session, text)
+        if not dst or dst in seen:
+            continue
+        seen.add(dst)
+        if _readback_cache_get(session, text) or _readback_in_flight(dst):
+            continue
+        if not _precache_one(session, text, dst, n):
+            return
+
+
+def _precache_one(session: str, text: str, dst: str, n: int) -> bool:
+    """Synth one turn's text into `dst` at "precache" priority (behind any live read).
+    No-op if nothing speakable. False only when the server cancelled the job as stale."""
     speakable = _truncate_to_sentence(strip_markdown(text or ""), 2000)
     if not speakable or not any(ch.isalnum() for ch in speakable):
-        return
+        return True
     try:
         os.makedirs(os.path.dirname(dst), exist_ok=True)
         sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
         import piper_stream
+        from piper_server import SynthCancelled
         from pathlib import Path
     except Exception as e:
-        _log("PRECACHE", "setup-fail", repr(e))
-        return
-    tmp = dst + ".%d.tmp" % os.getpid()   # per-process tmp: two concurrent precache.py
-    try:                                  # for the same turn must not clobber one shared tmp
-        ok = piper_stream.synthesize_warm(speakable, Path(tmp))
+        _log("PRECACHE", "setup-fail", repr(e), level="warn")
+        return True
+    tmp = dst + ".%d.tmp" % os.getpid()   # per-process tmp: also what _readback_in_flight sees
+    try:
+        ok = piper_stream.synthesize_warm(speakable, Path(tmp), priority="precache",
+                                          tag=precache_tag(session))
+    except SynthCancelled:
+        _log("PRECACHE", "cancelled", session[:20], "n=", n)
+        return False
     except Exception as e:
-        _log("PRECACHE", "synth-fail", repr(e))
+        _log("PRECACHE", "synth-fail", repr(e), level="warn")
         ok = False
     if ok and os.path.exists(tmp):
         try:
@@ -1617,6 +1766,7 @@ def precache_turn(transcript_path: str, n: int = 1) -> None:
             os.unlink(tmp)
         except OSError:
             pass
+    return True
 
 
 def _play_cached(wav_path: str, owner: str) -> bool:
@@ -1638,7 +1788,7 @@ def _play_cached(wav_path: str, owner: str) -> bool:
             stderr=subprocess.DEVNULL, start_new_session=True, env=child_env,
         )
     except (FileNotFoundError, OSError) as e:
-        _log("ACTION", "play_cached", "spawn-fail", repr(e))
+        _log("ACTION", "play_cached", "spawn-fail", repr(e), level="warn")
         return False
     _readback_proc = proc
     return True
@@ -1652,30 +1802,65 @@ def is_readback_playing() -> bool:
 
 
 def _spawn_precache(transcript_path: str, n: int = 1) -> None:
-    """Fire-and-forget background pre-synth of a turn into the cache."""
-    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "precache.py")
-    if not (transcript_path and os.path.isfile(script)):
+    """Fire-and-forget background pre-synth of turns 1..n into the cache (queued for the
+    single precache worker — see precache.py)."""
+    try:
+        import precache
+    except ImportError:
+        return
+    precache.request(transcript_path, n)
+
+
+# Predictive precache (PreToolUse): a turn that calls tools writes each finished text
+# bubble to the transcript before the next tool runs — those are the read-back messages
+# n=2,3,… by the time Stop fires. Queueing them here gets them synthesized WHILE the model
+# keeps working, so a VolumeUp right after a long multi-step answer is a hit, and Stop's
+# precache only has the final bubble left (whose sentences auto-read / earlier bubbles may
+# already have put in the per-sentence TTS cache — synthesize_warm stitches those in).
+# The memo is the newest message's hash in czytaj_store (kv "precache_queued:<realpath>"),
+# shared by every process — the warm server and a cold pre-tool-use.py alike — and it is the
+# message index's own digest, so a tool call that added no text costs no message read.
+def precache_in_progress(transcript_path: str) -> None:
+    """Queue a precache when the transcript gained a new assistant text since the last
+    PreToolUse and that text's read-back wav isn't cached yet."""
+    path_real = _claude_transcript(transcript_path)
+    if not path_real:
         return
     try:
-        subprocess.Popen(
-            [sys.executable or "python3", script, transcript_path, str(n)],
-            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL, start_new_session=True,
-        )
-    except (FileNotFoundError, OSError):
+        newest = newest_digest(transcript_path)
+    except OSError:
+        return
+    if not newest:
+        return
+    d = _readback_session_dir(os.path.basename(transcript_path))
+    try:
+        if d and os.path.getsize(os.path.join(d, newest + ".wav")) > 44:
+            return   # already cached (auto-read's save_wav, a read-back miss, Stop)
+    except OSError:
         pass
+    key = "precache_queued:" + path_real
+    try:
+        row = czytaj_store.get(key)
+        if row and row[0] == newest:
+            return
+        czytaj_store.put(key, newest, time.time())
+    except czytaj_store.StoreError:
+        pass   # no memo: queue anyway (the worker skips what is already cached)
+    _spawn_precache(transcript_path, READBACK_CACHE_MAX)
 
 
-def read_message_back(n: int = 1) -> bool:
+def read_message_back(n: int = 1, superseded=None) -> bool:
     """Read the n-th assistant turn counting back from the most recent (1 = last
     message, 2 = the one before, …). Clamped to the oldest available. Bound to VolumeUp.
     CACHE HIT → play a pre-synthesised wav instantly; MISS → synth on demand and
-    background-cache it for next time."""
+    background-cache it for next time. `superseded()` (the watcher's action queue) is
+    checked just before the prior read is stopped: True → a newer press will read instead,
+    so return without touching playback."""
     path = _resolve_active_transcript()
     if not path:
         _log("ACTION", "read_back", "no-active-transcript")
         return False
-    turns = _turn_texts(path)
+    turns = _turn_texts(path, limit=max(1, int(n)))
     if not turns:
         _log("ACTION", "read_back", "no-turns")
         return False
@@ -1687,6 +1872,9 @@ def read_message_back(n: int = 1) -> bool:
     # the ~1.7s `termux-media-player stop` am-boot at all.
     cached = _readback_cache_get(session, text)
     snippet = repr(text[:40])  # which message actually played, to compare vs press count
+    if superseded is not None and superseded():
+        _log("ACTION", "read_back", "n=", n, "superseded")
+        return False
     if cached:
         # HIT: kill the old wrapper but DON'T pay the stop am-boot — _play_cached's play
         # replaces the old audio (latest-wins) in ~0.3s. Saves ~1.7s per scrub press.
@@ -35,3 +35,25 @@ CZYTAJ_AUDIO_CLIENT_PATS=("termux-tts-speak" "termux-media-player" "paplay" 'pyt
 czytaj_project_key() {
   printf '%s' "$(realpath "$1" 2>/dev/null || echo "$1")" | sha1sum | cut -d' ' -f1
 }
+
+# czytaj_log TAG MSG [LEVEL]  ->  one JSON record in czytaj.log, the shape czytaj_log.py
+# writes ({"ts","pid","tag",["lvl"],"msg"}). EPOCHREALTIME (bash 5) avoids a `date` fork;
+# its decimal separator follows the locale, hence the comma swap. TAG is a literal; MSG is
+# escaped (quotes, backslashes, newlines, tabs) so captured stderr can go through it.
+# CZYTAJ_LOG_LEVEL applies here too (same names/threshold as czytaj_log.LEVELS).
+_CZYTAJ_LOG_MIN="${CZYTAJ_LOG_LEVEL:-info}"; _CZYTAJ_LOG_MIN="${_CZYTAJ_LOG_MIN//[[:space:]]/}"
+case "${_CZYTAJ_LOG_MIN,,}" in
+  debug) _CZYTAJ_LOG_MIN=10;; warn) _CZYTAJ_LOG_MIN=30;; error) _CZYTAJ_LOG_MIN=40;;
+  off) _CZYTAJ_LOG_MIN=100;; *) _CZYTAJ_LOG_MIN=20;;
+esac
+czytaj_log() {
+  local rank=20
+  case "$3" in debug) rank=10;; warn) rank=30;; error) rank=40;; esac
+  [ "$rank" -ge "$_CZYTAJ_LOG_MIN" ] || return 0
+  local ts="${EPOCHREALTIME:-$(date +%s)}" msg="$2" lvl=""
+  msg=${msg//\\/\\\\}; msg=${msg//\"/\\\"}
+  msg=${msg//$'\n'/\\n}; msg=${msg//$'\t'/\\t}; msg=${msg//$'\r'/}
+  [ -n "$3" ] && [ "$3" != info ] && lvl=",\"lvl\":\"$3\""
+  printf '{"ts":%s,"pid":%d,"tag":"%s"%s,"msg":"%s"}\n' "${ts/,/.}" "$$" "$1" "$lvl" "$msg" \
+    >> "$CZYTAJ_LOG" 2>/dev/null
+}
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Structured czytaj.log writer: one JSON record per line, one open fd per process.
+
+WHY: _speak._log and piper_stream._log opened czytaj.log, formatted a timestamp, wrote one
+line and closed it again on EVERY call — a single auto-read logs a dozen lines (ENTER,
+GUARD, STATE, SPEAK, …), each an open/close pair — and the file grew forever. Timings were
+baked into the text ("+1.23s"), so aggregating latency meant regex-scraping the log.
+
+Now:
+  - log() appends {"ts", "pid", "tag", "msg", [lvl], **fields} as one JSON line through a
+    per-process line-buffered handle (one write() per record, O_APPEND — records from
+    concurrent processes never interleave; nothing buffered is lost to a SIGKILL);
+  - numbers go in fields (log("GUARD", caller, guard_s=0.42)), not into msg;
+  - rotation: past CZYTAJ_LOG_MAX_KB (default 1024) the writer that notices renames the
+    file to czytaj.log.1 (one generation kept); writers holding the old file follow the
+    rename within LOG_RECHECK_S;
+  - CZYTAJ_LOG_LEVEL=debug|info|warn|error|off (default info) drops records below it.
+The shell hooks write the same shape via czytaj-env.sh's czytaj_log.
+
+    python3 czytaj_log.py [-n 50] [-f]   # the log as text: "HH:MM:SS.mmm pid=N TAG msg k=v"
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from czytaj_paths import LOG_FILE  # noqa: E402
+
+LEVELS = {"debug": 10, "info": 20, "warn": 30, "error": 40, "off": 100}
+LEVEL = LEVELS.get(os.environ.get("CZYTAJ_LOG_LEVEL", "info").strip().lower(), LEVELS["info"])
+try:
+    LOG_MAX_BYTES = int(os.environ.get("CZYTAJ_LOG_MAX_KB", "1024")) * 1024
+except ValueError:
+    LOG_MAX_BYTES = 1024 * 1024
+LOG_RECHECK_S = 60.0   # a long-lived writer re-stats the path this often (another writer rotated?)
+
+# One encoder for the process: json.dumps(**non-default kwargs) builds a new one per call.
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str).encode
+_RESERVED = frozenset(("ts", "pid", "tag", "lvl", "msg"))
+_lock = threading.Lock()   # volume_watcher / piper_server log from several threads
+_f = None
+_pid = 0
+_ino = 0
+_size = 0
+_checked = 0.0
+
+
+def _open() -> None:
+    global _f, _pid, _ino, _size, _checked
+    _f = open(LOG_FILE, "a", buffering=1, encoding="utf-8", errors="replace")
+    st = os.fstat(_f.fileno())
+    _pid, _ino, _size, _checked = os.getpid(), st.st_ino, st.st_size, time.monotonic()
+
+
+def _rotate() -> None:
+    """Move the full log aside (if the path still names the file we measured) and reopen."""
+    try:
+        if os.stat(LOG_FILE).st_ino == _ino:
+            os.replace(LOG_FILE, LOG_FILE + ".1")
+    except OSError:
+        pass
+    _f.close()
+    _open()
+
+
+def _handle():
+    """This process's log handle, (re)opened / rotated as needed. Caller holds _lock."""
+    global _size, _checked
+    if _f is None or _pid != os.getpid():   # first record, or a forked child
+        _open()
+        if 0 < LOG_MAX_BYTES < _size:
+            _rotate()
+        return _f
+    now = time.monotonic()
+    if _size <= LOG_MAX_BYTES and now - _checked < LOG_RECHECK_S:
+        return _f
+    try:
+        moved = os.stat(LOG_FILE).st_ino != _ino
+    except OSError:
+        moved = True
+    if moved:   # another writer rotated (or the file was removed) → follow the path
+        _f.close()
+        _open()
+    else:
+        _size, _checked = os.fstat(_f.fileno()).st_size, now   # everyone's writes, not just ours
+    if 0 < LOG_MAX_BYTES < _size:
+        _rotate()
+    return _f
+
+
+def log(tag: str, *parts: object, level: str = "info", **fields: object) -> None:
+    """Append one record: `tag` (SPEAK, VOLKEY, STREAM, …), the remaining parts joined as
+    "msg", numeric/extra data as fields (ts/pid/tag/lvl/msg are the record's own and are
+    dropped from fields). Never raises."""
+    global _size
+    if LEVELS.get(level, LEVELS["info"]) < LEVEL:
+        return
+    rec: dict = {"ts": round(time.time(), 3), "pid": os.getpid(), "tag": str(tag)}
+    if level != "info":
+        rec["lvl"] = level
+    if parts:
+        rec["msg"] = " ".join(str(p) for p in parts)
+    if fields:   # a field never overwrites the record's own keys
+        rec.update((k, v) for k, v in fields.items() if k not in _RESERVED)
+    try:
+        line = _encode(rec) + "\n"
+        with _lock:
+            _handle().write(line)
+            _size += len(line)
+    except (OSError, ValueError):
+        pass
+
+
+def format_record(line: str) -> str:
+    """One log line as text ("HH:MM:SS.mmm pid=N TAG msg k=v"); non-JSON lines verbatim."""
+    try:
+        rec = json.loads(line)
+        ts = float(rec.pop("ts"))
+    except (ValueError, TypeError, KeyError, AttributeError):
+        return line.rstrip("\n")
+    out = [time.strftime("%H:%M:%S", time.localtime(ts)) + f".{int(ts % 1 * 1000):03d}",
+           f"pid={rec.pop('pid', '?')}", str(rec.pop("tag", ""))]
+    lvl = rec.pop("lvl", "")
+    if lvl:
+        out.append(lvl.upper())
+    if "msg" in rec:
+        out.append(str(rec.pop("msg")))
+    out += [f"{k}={v}" for k, v in rec.items()]
+    return " ".join(out)
+
+
+def main() -> int:
+    import argparse
+    ap = argparse.ArgumentParser(description="Print czytaj.log as text.")
+    ap.add_argument("-n", type=int, default=50, help="last N records (0 = all)")
+    ap.add_argument("-f", action="store_true", help="keep following new records")
+    args = ap.parse_args()
+    try:
+        f = open(LOG_FILE, encoding="utf-8", errors="replace")
+    except OSError as e:
+        print(e, file=sys.stderr)
+        return 1
+    with f:
+        lines = f.readlines()
+        for line in lines[-args.n:] if args.n > 0 else lines:
+            print(format_record(line))
+        while args.f:
+            line = f.readline()
+            if line:
+                print(format_record(line), flush=True)
+            else:
+                time.sleep(0.5)
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except (KeyboardInterrupt, BrokenPipeError):
+        sys.exit(0)
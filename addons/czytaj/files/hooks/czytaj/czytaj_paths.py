@@ -76,6 +76,10 @@ READBACK_CACHE_DIRS = (os.path.join(TERMUX_HOME, ".cache", "czytaj", "readback")
 FLAG_DIR = _claude("czytaj-flags")            # dir of <sha1(realpath)>.flag
 
 # ── Shared runtime state (~/.claude/czytaj-*) ───────────────────────────────
+# czytaj_store (SQLite WAL) holds state/ledger/last-folder/active-session/probe caches; the
+# STATE_FILE, SPOKEN_LEDGER, LAST_FOLDER_FILE, ACTIVE_SESSION_FILE and *_CACHE files below
+# are only its per-file fallback now (store unavailable).
+STORE_DB = _claude("czytaj-store.db")
 STATE_FILE = _claude("czytaj-state.json")
 SPEAK_LOCK = _claude("czytaj-speak.lock")
 LOG_FILE = _claude("czytaj.log")
@@ -84,11 +88,13 @@ ADB_FLAG = _claude("czytaj-adb.flag")
 SHIZUKU_FLAG = _claude("czytaj-shizuku.flag")
 SCREEN_CACHE = _claude("czytaj-screen.cache")
 ACTIVE_SESSION_FILE = _claude("czytaj-active-session.txt")
-SPOKEN_LEDGER = _claude("czytaj-spoken-ledger.json")
+SPOKEN_LEDGER = _claude("czytaj-spoken-ledger.slots")   # fixed-slot records, not JSON
 LAST_FOLDER_FILE = _claude("czytaj-last-folder.txt")
 MIC_CACHE = _claude("czytaj-mic.cache")
 MEDIA_CACHE = _claude("czytaj-media.cache")
 VOL_CACHE = _claude("czytaj-vol.cache")
+DEVICE_STATE = _claude("czytaj-device-state.json")   # watcher sampler → guard snapshot
+DEVICE_STATE_WANTED = _claude("czytaj-device-state.wanted")   # hooks → sampler: demand (mtime)
 WATCHER_LOCK = _claude("czytaj-volume-watcher.lock")
 
 # Cross-process play/pause/heartbeat markers (written by one process, read by another —
@@ -97,11 +103,13 @@ PREHEAT_MARKER = _claude("czytaj-preheat.ts")
 KEYPAUSE_STATE = _claude("czytaj-keypause.state")
 PLAYING_MARKER = _claude("czytaj-playing.flag")
 CHANNEL_FILE = _claude("czytaj-channel")
+CHANNEL_QUEUE_DIR = os.path.expanduser("~/.cache/czytaj/channel-queue")   # waiters' wake-up FIFOs
 
 # ── In-turn audio-client kill patterns (M13 — was triplicated: toggle.sh/user-prompt-submit.sh/_speak.py) ─
 # The short-lived playback clients pkill'd on a new turn / teardown. NEVER piper_server/piper-daemon
 # (the warm daemon must survive — keepwarm). Mirrored by czytaj-env.sh's CZYTAJ_AUDIO_CLIENT_PATS
 # bash array; czytaj_selftest pins shell == python. F21: piper_stream anchored to its python invocation.
+# The python side kills by registry instead (czytaj_pids, AUDIO_PIDS_DIR) — no pkill scan.
 AUDIO_CLIENT_PATS = ("termux-tts-speak", "termux-media-player", "paplay", r"python.*piper_stream\.py")
 
 # ── Piper daemon run dir (S2 — the daemon-split landmine; ONE definition now) ─
@@ -115,6 +123,19 @@ SOCKET_PATH = os.path.join(RUN_DIR, "server.sock")
 PID_FILE = os.path.join(RUN_DIR, "server.pid")
 SERVER_LOCK = os.path.join(RUN_DIR, "server.lock")
 
+# ── Transcript offset index (czytaj_transcript; per-transcript JSON, sha1 of realpath) ─
+TURN_INDEX_DIR = os.path.expanduser("~/.cache/czytaj/turn-index")
+
+# ── Global TTS audio cache (czytaj_ttscache; content-addressed per-sentence wavs, LRU) ─
+TTS_CACHE_DIR = os.path.expanduser("~/.cache/czytaj/tts-cache")
+
+# ── Audio process registry (czytaj_pids; one file per pid, written by piper_stream) ─
+AUDIO_PIDS_DIR = os.path.expanduser("~/.cache/czytaj/audio-pids")
+
+# ── Read-back precache job queue (precache.py; one job file per transcript + worker lock) ─
+PRECACHE_QUEUE_DIR = os.path.expanduser("~/.cache/czytaj/precache-queue")
+PRECACHE_LOCK = os.path.join(PRECACHE_QUEUE_DIR, "worker.lock")
+
 # ── Synth config defaults (S5 — were duplicated server↔stream) ──────────────
 PIPER_VOICE = os.environ.get("PIPER_VOICE", "pl_PL-gosia-medium")
 try:
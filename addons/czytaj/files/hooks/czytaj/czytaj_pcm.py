@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Bulk float32 → int16 PCM conversion for czytaj (piper raw output → playable wav).
+
+WHY: piper emits raw little-endian float32; both synth paths in piper_stream converted it
+with struct.unpack into a tuple and a per-sample generator
+`max(-32767, min(32767, int(x * 32767)))` — ~600k Python-level iterations for a 27 s
+read-back at 22050 Hz on a phone CPU, on the critical path before playback.
+
+Now: NumPy when it's installed (one vectorized clip+cast), else stdlib `array` with the
+scale/clamp/int steps driven by C-level map() — no Python bytecode runs per sample. Piper
+output is almost always inside [-1, 1], so the clamp pass only runs on the 4096-sample
+blocks where the unclamped fast path overflows int16 (array('h') raises) or lands on
+-32768. Same rounding as the old code (int() truncates toward zero; numpy astype does
+too), so the bytes are identical — the NumPy product is taken in float64 like the Python
+one (float32 * 32767.0 stays float32 in NumPy and rounds differently before the cast).
+
+`python3 czytaj_pcm.py [seconds]` — micro-benchmark vs the old struct/generator path; exits
+non-zero if any path's bytes differ from it.
+"""
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from itertools import repeat
+from operator import mul
+
+try:
+    import numpy as _np
+except ImportError:   # optional — the stdlib path below is the default on Termux
+    _np = None
+
+_SCALE = 32767.0
+_BIG_ENDIAN = sys.byteorder == "big"
+_INT16_MIN = array("h", [-32768]).tobytes()   # native order, as searched before byteswap
+_BLOCK = 4096   # samples per fast-path attempt: a clipped peak only slows its own block
+
+
+def float32_to_int16(raw: bytes | bytearray | memoryview) -> bytes:
+    """Little-endian float32 samples → little-endian int16 bytes (clamped to ±32767).
+    A truncated trailing partial sample is ignored (never raises on an odd length)."""
+    mv = memoryview(raw).cast("B")
+    n = len(mv) // 4
+    if n == 0:
+        return b""
+    mv = mv[:n * 4]
+    if _np is not None:
+        x = _np.frombuffer(mv, dtype="<f4")
+        return _np.clip(x.astype("<f8") * _SCALE, -_SCALE, _SCALE).astype("<i2").tobytes()
+    f = array("f")
+    f.frombytes(mv)
+    if _BIG_ENDIAN:
+        f.byteswap()
+    out = array("h")
+    for i in range(0, n, _BLOCK):
+        out.extend(_block_to_int16(f[i:i + _BLOCK]))
+    if _BIG_ENDIAN:
+        out.byteswap()
+    return out.tobytes()
+
+
+def _block_to_int16(f: array) -> array:
+    try:
+        # Fast path: array('h') itself rejects anything outside int16 (OverflowError).
+        out = array("h", map(int, map(mul, f, repeat(_SCALE))))
+        # int16 admits -32768, which the clamp maps to -32767: a byte search (C speed;
+        # a misaligned hit just costs the exact count) decides whether to redo the block.
+        if out.tobytes().find(_INT16_MIN) < 0 or not out.count(-32768):
+            return out
+    except OverflowError:
+        pass
+    # A sample past ±1.0 in THIS block — clamp pass (builtin min/max per sample, so it
+    # runs only on the few blocks that actually clip).
+    return array("h", map(int, map(max, repeat(-_SCALE),
+                                   map(min, repeat(_SCALE), map(mul, f, repeat(_SCALE))))))
+
+
+def _legacy(raw: bytes) -> bytes:
+    """The pre-2026 per-sample path (kept for the benchmark / equivalence check only)."""
+    n = len(raw) // 4
+    floats = struct.unpack(f"<{n}f", raw[:n * 4])
+    return struct.pack(f"<{n}h", *(max(-32767, min(32767, int(x * 32767))) for x in floats))
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    secs = float(sys.argv[1]) if len(sys.argv) > 1 else 27.0
+    n = int(secs * 22050)
+    rnd = random.Random(7)
+    samples = [rnd.uniform(-0.9, 0.9) for _ in range(n)]
+    raw = struct.pack(f"<{n}f", *samples)
+    clipped = samples[:]
+    for start in range(0, n, n // 20):               # 20 short clipped peaks (loud plosives)
+        clipped[start:start + 50] = [1.3] * len(clipped[start:start + 50])
+    raw_clipped = struct.pack(f"<{n}f", *clipped)
+
+    def bench(fn, data, reps=3):
+        best = float("inf")
+        for _ in range(reps):
+            t = time.perf_counter()
+            out = fn(data)
+            best = min(best, time.perf_counter() - t)
+        return best, out
+
+    print(f"{n} samples ({secs:.0f}s @22050 Hz)")
+    mismatch = False
+    for label, data in (("in-range", raw), ("clipped", raw_clipped)):
+        t_old, ref = bench(_legacy, data)
+        print(f" {label}:")
+        print(f"  legacy struct+generator : {t_old * 1000:8.1f} ms")
+        saved, _np = _np, None
+        t_arr, arr_out = bench(float32_to_int16, data)
+        print(f"  array/map (stdlib)      : {t_arr * 1000:8.1f} ms  x{t_old / t_arr:.1f}"
+              f"  {'identical' if arr_out == ref else 'MISMATCH'}")
+        mismatch |= arr_out != ref
+        _np = saved
+        if _np is not None:
+            t_np, out = bench(float32_to_int16, data)
+            print(f"  numpy                   : {t_np * 1000:8.1f} ms  x{t_old / t_np:.1f}"
+                  f"  {'identical' if out == arr_out == ref else 'MISMATCH'}")
+            mismatch |= not out == arr_out == ref
+        else:
+            print("  numpy                   : not installed")
+    assert not mismatch, "float32_to_int16 output differs between paths"
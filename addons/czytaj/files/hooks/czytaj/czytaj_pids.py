@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Registry of czytaj-owned audio processes, so a stop is a few kill() calls.
+
+WHY: _kill_audio_chain ran `pkill -9 -f` once per AUDIO_CLIENT_PATS entry — four forks,
+each scanning all of /proc and matching every command line — then `pactl list short
+sink-inputs` plus one `pactl kill-sink-input` fork per stream. Hundreds of ms of forks
+before the audio actually stopped.
+
+Now the processes that make sound say so themselves: piper_stream registers its own pid
+(as a process group when it leads one — _speak starts it new-session, so the group holds
+its paplay / termux-media-player children too) and each paplay / wake-tone child it
+spawns. One file per process in AUDIO_PIDS_DIR:
+  <pid>   "<starttime> <kind>"   kind g = signal the whole group, p = the pid alone,
+                                 a = a pulse client (paplay) — pid alone, and its stream
+                                 must be flushed from pulse afterwards
+starttime (/proc/<pid>/stat field 22) guards against a recycled pid: an entry whose
+process is gone or is now someone else is pruned, never signalled. kill_all() signals
+every live entry and reports whether a pulse client was among them — the caller runs its
+one pactl pass only then (native PRoot has no pulse and never registers kind a).
+The shell hooks keep their pkill loops over AUDIO_CLIENT_PATS (a python start would cost
+more there than the forks it saves).
+"""
+from __future__ import annotations
+
+import os
+import signal
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from czytaj_paths import AUDIO_PIDS_DIR  # noqa: E402
+
+GROUP, PROC, PULSE = "g", "p", "a"
+_PRUNE_AT = 64   # entries left by SIGKILL'd writers; register() sweeps beyond this many
+
+
+def _starttime(pid: int) -> str:
+    """The process's start time in clock ticks since boot, or "" when it is gone."""
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read()
+    except OSError:
+        return ""
+    fields = stat[stat.rfind(b")") + 2:].split()   # comm may contain spaces / parens
+    return fields[19].decode() if len(fields) > 19 else ""
+
+
+def _entries() -> "list[tuple[int, str, str]]":
+    """(pid, starttime, kind) of every registry file; unreadable ones are removed."""
+    try:
+        names = os.listdir(AUDIO_PIDS_DIR)
+    except OSError:
+        return []
+    out = []
+    for name in names:
+        if not name.isdigit():
+            continue
+        path = os.path.join(AUDIO_PIDS_DIR, name)
+        try:
+            with open(path) as f:
+                start, kind = f.read().split()
+        except (OSError, ValueError):
+            _drop(int(name))
+            continue
+        out.append((int(name), start, kind))
+    return out
+
+
+def _drop(pid: int) -> None:
+    try:
+        os.unlink(os.path.join(AUDIO_PIDS_DIR, str(pid)))
+    except OSError:
+        pass
+
+
+def register(pid: int, kind: str = PROC) -> None:
+    """Record `pid` as a czytaj audio process. Never raises."""
+    start = _starttime(pid)
+    if not start:
+        return
+    try:
+        os.makedirs(AUDIO_PIDS_DIR, exist_ok=True)
+        with open(os.path.join(AUDIO_PIDS_DIR, str(pid)), "w") as f:
+            f.write(f"{start} {kind}\n")
+    except OSError:
+        return
+    try:
+        if len(os.listdir(AUDIO_PIDS_DIR)) > _PRUNE_AT:
+            for p, st, _kind in _entries():
+                if _starttime(p) != st:
+                    _drop(p)
+    except OSError:
+        pass
+
+
+def register_self() -> None:
+    """piper_stream's own entry: its group when it leads one, else just itself (a shell
+    started it in the caller's group — signalling that would hit the caller)."""
+    pid = os.getpid()
+    register(pid, GROUP if os.getpgrp() == pid else PROC)
+
+
+def unregister(pid: int) -> None:
+    _drop(pid)
+
+
+def kill_all(sig: int = signal.SIGKILL) -> bool:
+    """Signal every live registered audio process (groups first) and clear the registry.
+    True iff a pulse client was among them. Never raises; never signals this process or
+    its own group."""
+    me, my_group = os.getpid(), os.getpgrp()
+    live = []
+    for pid, start, kind in _entries():
+        _drop(pid)
+        if pid != me and _starttime(pid) == start:
+            live.append((pid, kind))
+    for pid, kind in sorted(live, key=lambda e: e[1] != GROUP):
+        try:
+            if kind == GROUP and pid != my_group:
+                os.killpg(pid, sig)
+            else:
+                os.kill(pid, sig)
+        except OSError:
+            pass   # already gone (e.g. taken down with its group above)
+    return any(kind == PULSE for _pid, kind in live)
@@ -10,7 +10,7 @@ Checks:
   2. czytaj_paths values are well-formed
   3. SHELL<->PYTHON parity (the S2/S3 drift guard): czytaj-env.sh czytaj_project_key equals
      czytaj_paths.project_key, and CZYTAJ_RUN_DIR/CZYTAJ_FLAG_DIR equal the python values
-  4. the gate hooks (stop.py, pre-tool-use.py) run with a fake OFF stdin and exit 0 cleanly
+  4. the gate hooks (stop.py, pre-tool-use.py, hook_client.py) run with a fake OFF stdin and exit 0
   5. bash -n on every shell script
 
 Exit 0 = all green; non-zero = a check failed (printed). This is intentionally a RUNTIME
@@ -19,6 +19,7 @@ canary (catches the str/Path + cross-language key drift that has no compile-time
 import hashlib
 import json
 import os
+import struct
 import subprocess
 import sys
 
@@ -40,7 +41,18 @@ try:
     import piper_server  # noqa: F401
     import piper_stream  # noqa: F401
     import volume_watcher  # noqa: F401
-    check("python modules import", True, "czytaj_paths/_speak/piper_server/piper_stream/volume_watcher")
+    import czytaj_transcript  # noqa: F401
+    import hook_client  # noqa: F401
+    import czytaj_pcm  # noqa: F401
+    import czytaj_ttscache  # noqa: F401
+    import czytaj_shell  # noqa: F401
+    import czytaj_store  # noqa: F401
+    import czytaj_text  # noqa: F401
+    import czytaj_sessions  # noqa: F401
+    import czytaj_pids  # noqa: F401
+    import czytaj_log  # noqa: F401
+    check("python modules import", True, "czytaj_paths/_speak/piper_server/piper_stream/"
+          "volume_watcher/czytaj_transcript/hook_client/czytaj_pcm/czytaj_ttscache/czytaj_shell/czytaj_store/czytaj_text/czytaj_sessions/czytaj_pids/czytaj_log")
 except Exception as e:  # pragma: no cover
     check("python modules import", False, repr(e))
     print("\nSELFTEST FAILED: imports broken — aborting")
@@ -53,6 +65,10 @@ check("czytaj_paths values well-formed",
            and cz.PIPER_VOICE and cz.PIPER_SAMPLE_RATE > 0 and cz.PIPER_LENGTH_SCALE),
       f"FLAG_DIR={cz.FLAG_DIR} RUN_DIR={cz.RUN_DIR} voice={cz.PIPER_VOICE} rate={cz.PIPER_SAMPLE_RATE}")
 
+# bulk PCM conversion must stay byte-identical to the old per-sample clamp (incl. clipping)
+_pcm = struct.pack("<9f", 0.0, 0.5, -0.5, 1.0, -1.0, 1.2, -1.2, -1.00001, 0.99999) + b"\x01"
+check("czytaj_pcm float32->int16 == legacy", czytaj_pcm.float32_to_int16(_pcm) == czytaj_pcm._legacy(_pcm))
+
 # 3. shell<->python parity (the SSOT drift guard) ----------------------------
 env_sh = os.path.join(HOOK_DIR, "czytaj-env.sh")
 if os.path.isfile(env_sh):
@@ -123,6 +139,12 @@ for hook in ("stop.py", "pre-tool-use.py"):
                            capture_output=True, text=True, timeout=30)
         check(f"{hook} OFF-stdin exit 0", r.returncode == 0,
               f"rc={r.returncode} err={r.stderr.strip()[:120]}")
+# the thin client the .sh wrappers exec (python3 -S; server hand-off or in-process fallback)
+for hook in ("stop", "pre-tool-use"):
+    r = subprocess.run([sys.executable or "python3", "-S", os.path.join(HOOK_DIR, "hook_client.py"), hook],
+                       input=fake, capture_output=True, text=True, timeout=30)
+    check(f"hook_client.py {hook} OFF-stdin exit 0", r.returncode == 0,
+          f"rc={r.returncode} err={r.stderr.strip()[:120]}")
 
 # 5. bash -n on every shell script -------------------------------------------
 for sh in ("czytaj-env.sh", "toggle.sh", "user-prompt-submit.sh", "stop.sh", "pre-tool-use.sh"):
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Project → transcript index for read-back's active-window resolution.
+
+WHY: _resolve_active_transcript / _transcript_for_project found "the transcript of this
+project" (and "the newest transcript anywhere") with glob.glob over ~/.claude/projects plus
+a max() over getmtime — a stat of EVERY session file on every VolumeUp whose earlier signals
+(tmux window, keyboard flag) came up empty. With hundreds of sessions on shared storage
+that alone took seconds.
+
+Now the UserPromptSubmit hook records each prompt's (project dir, transcript) in
+czytaj_store — for every project, reading on or off, since read-back works in both:
+  sessions:<realpath(dir)>  JSON list of that project's transcripts, newest prompt first
+                            (≤ MAX_PER_PROJECT; two panes in one dir → two entries)
+  sessions:latest           the transcript that got the last prompt anywhere
+for_project() picks the most recently modified of a project's few entries — the same
+answer the glob gave, for a handful of stats. latest() is the last-prompted transcript.
+Both return "" when the index has nothing usable (cold start, store unavailable, files
+gone), and the caller keeps the glob as that fallback.
+
+    python3 czytaj_sessions.py record <project dir>   < hook JSON  (user-prompt-submit.sh)
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import czytaj_store  # noqa: E402
+
+MAX_PER_PROJECT = 8
+_LATEST = "sessions:latest"
+
+
+def _key(proj_dir: str) -> str:
+    return "sessions:" + os.path.realpath(proj_dir)
+
+
+def _usable(path: str) -> bool:
+    return bool(path) and path.endswith(".jsonl") and os.path.isfile(path)
+
+
+def record(proj_dir: str, transcript: str) -> None:
+    """Note that `transcript` just got a prompt in project `proj_dir`. Never raises."""
+    if not (proj_dir and transcript.endswith(".jsonl")):
+        return
+    now = time.time()
+    try:
+        with czytaj_store.transaction() as tx:
+            if tx is None:
+                return
+            known = czytaj_store.get_json(_key(proj_dir), tx)
+            known = [p for p in known if isinstance(p, str) and p != transcript] \
+                if isinstance(known, list) else []
+            czytaj_store.put_json(_key(proj_dir), [transcript] + known[:MAX_PER_PROJECT - 1],
+                                  now, tx)
+            czytaj_store.put(_LATEST, transcript, now, tx)
+    except czytaj_store.StoreError:
+        pass
+
+
+def for_project(proj_dir: str) -> str:
+    """The project's most recently modified indexed transcript, or ""."""
+    try:
+        known = czytaj_store.get_json(_key(proj_dir))
+    except czytaj_store.StoreError:
+        return ""
+    best, best_mtime = "", -1.0
+    for p in known if isinstance(known, list) else []:
+        try:
+            m = os.path.getmtime(p)
+        except (OSError, TypeError):
+            continue
+        if m > best_mtime and _usable(p):
+            best, best_mtime = p, m
+    return best
+
+
+def latest() -> str:
+    """The transcript that received the last user prompt, or ""."""
+    try:
+        row = czytaj_store.get(_LATEST)
+    except czytaj_store.StoreError:
+        return ""
+    return row[0] if row and _usable(row[0]) else ""
+
+
+def main() -> int:
+    if len(sys.argv) >= 3 and sys.argv[1] == "record":
+        try:
+            data = json.load(sys.stdin)
+        except Exception:
+            return 0
+        if isinstance(data, dict):
+            record(sys.argv[2], data.get("transcript_path") or "")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""Resident privileged-shell session for czytaj's Shizuku/ADB probes.
+
+WHY: _speak._run_shell started a fresh `rish -c …` / `adb shell …` for EVERY probe (screen
+wakefulness, mic, media session, IME list, window focus, bluetooth). Under PRoot each of
+those is a JVM boot (app_process) plus Android-14's writable-dex check — ~1.2–8 s per probe,
+paid again on every hook fire and watcher press. The shell itself answers in milliseconds.
+
+Now one long-lived `rish` / `adb shell` per (process, helper) reads commands on stdin, and
+every probe is multiplexed over it with a sentinel framing:
+
+    { <cmd>
+    } </dev/null 2>/dev/null; printf '\\n%s %d\\n' <marker> "$?"
+
+The reply is everything up to "\\n<marker> ", and the number after it is the exit status.
+Stdin is redirected for the command itself, so nothing it does can eat the protocol.
+
+Per-command timeout: a command that overruns is NOT killed. Its marker is remembered, the
+caller fails open, and the next call first drains up to that marker. So a cold session (the
+one-off JVM boot) finishes warming in the background instead of being killed and re-paid
+on every short-timeout probe. A session that stays wedged past STUCK_S, or whose process
+died, is discarded, and the next call respawns it (auto-reconnect).
+
+Only long-lived processes (piper_server, which serves the hooks now, and volume_watcher)
+keep the session warm. They call reap_idle() from their housekeeping loops. A short-lived
+hook pays one spawn, the same as before. CZYTAJ_SHELL_SESSION=0 restores one process per
+probe.
+"""
+from __future__ import annotations
+
+import os
+import select
+import subprocess
+import threading
+import time
+
+ENABLED = os.environ.get("CZYTAJ_SHELL_SESSION", "1") != "0"
+IDLE_S = 600.0      # reap_idle(): close a session unused this long (rish holds a JVM)
+STUCK_S = 30.0      # a command still unanswered after this → discard the session
+
+
+class _Dead(Exception):
+    """The session's process exited or its pipes broke."""
+
+
+class ShellSession:
+    """One coprocess running a shell on stdin. Not thread-safe on its own — the module
+    level run() serializes callers on the session's `lock`."""
+
+    def __init__(self, argv: list[str]):
+        self.argv = argv
+        self.pid = os.getpid()
+        self.proc = subprocess.Popen(
+            argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        self.lock = threading.Lock()
+        self.seq = 0
+        self.token = os.urandom(6).hex()
+        self.buf = b""
+        self.pending = b""          # marker of a command whose reply is still owed
+        self.pending_since = 0.0
+        self.last_used = time.monotonic()
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def close(self) -> None:
+        if self.pid != os.getpid():
+            return                  # a forked child must not kill its parent's session
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.proc.kill()
+            self.proc.wait(timeout=1)
+        except (OSError, subprocess.SubprocessError):
+            pass
+
+    def _read_until(self, marker: bytes, deadline: float) -> tuple[bytes, int] | None:
+        """(output, status) once `marker` arrives, or None at the deadline."""
+        fd = self.proc.stdout.fileno()
+        needle = b"\n" + marker + b" "
+        while True:
+            i = self.buf.find(needle)
+            if i >= 0:
+                j = self.buf.find(b"\n", i + len(needle))
+                if j >= 0:
+                    out = self.buf[:i]
+                    status = self.buf[i + len(needle):j]
+                    self.buf = self.buf[j + 1:]
+                    try:
+                        return out, int(status)
+                    except ValueError:
+                        return out, 1
+            left = deadline - time.monotonic()
+            if left <= 0:
+                return None
+            r, _, _ = select.select([fd], [], [], left)
+            if not r:
+                return None
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise _Dead()
+            self.buf += chunk
+
+    def run(self, cmd: str, timeout_s: float) -> tuple[bool, str]:
+        deadline = time.monotonic() + timeout_s
+        self.last_used = time.monotonic()
+        if self.pending:
+            if self._read_until(self.pending, deadline) is None:
+                if time.monotonic() - self.pending_since > STUCK_S:
+                    raise _Dead()
+                return False, ""
+            self.pending = b""
+        self.seq += 1
+        marker = f"__czytaj_{self.token}_{self.seq}__".encode("ascii")
+        frame = (f"{{ {cmd}\n}} </dev/null 2>/dev/null; "
+                 f"printf '\\n%s %d\\n' {marker.decode()} \"$?\"\n").encode("utf-8")
+        try:
+            self.proc.stdin.write(frame)
+            self.proc.stdin.flush()
+        except (OSError, ValueError):
+            raise _Dead()
+        got = self._read_until(marker, deadline)
+        if got is None:
+            self.pending = marker
+            self.pending_since = time.monotonic()
+            return False, ""
+        out, status = got
+        text = out.decode("utf-8", "replace")
+        return status == 0, text
+
+
+_sessions: dict[tuple[str, ...], ShellSession] = {}
+_sessions_lock = threading.Lock()
+
+
+def _get(argv: list[str]) -> ShellSession:
+    key = tuple(argv)
+    with _sessions_lock:
+        s = _sessions.get(key)
+        if s is not None and (s.pid != os.getpid() or not s.alive()):
+            s.close()
+            s = None
+        if s is None:
+            s = ShellSession(argv)
+            _sessions[key] = s
+        return s
+
+
+def _drop(s: ShellSession) -> None:
+    with _sessions_lock:
+        if _sessions.get(tuple(s.argv)) is s:
+            del _sessions[tuple(s.argv)]
+    s.close()
+
+
+def run(argv: list[str], cmd: str, timeout_s: float) -> tuple[bool, str]:
+    """Run `cmd` in the resident shell started by `argv` (["rish"] / ["adb", "shell"]).
+    Returns (ok, stdout); ok is False on a non-zero status, a timeout, or a dead helper —
+    callers fail OPEN exactly as with the one-shot path. Concurrent callers share the
+    session one command at a time (waiting counts against their own timeout)."""
+    deadline = time.monotonic() + timeout_s
+    try:
+        s = _get(argv)
+    except (OSError, ValueError):
+        return False, ""
+    if not s.lock.acquire(timeout=max(0.0, deadline - time.monotonic())):
+        return False, ""
+    try:
+        return s.run(cmd, max(0.0, deadline - time.monotonic()))
+    except (_Dead, OSError):
+        _drop(s)
+        return False, ""
+    finally:
+        s.lock.release()
+
+
+def reap_idle(max_idle_s: float = IDLE_S) -> None:
+    """Close sessions unused for `max_idle_s` (next probe respawns one)."""
+    now = time.monotonic()
+    with _sessions_lock:
+        idle = [s for s in _sessions.values() if now - s.last_used > max_idle_s]
+    for s in idle:
+        if s.lock.acquire(blocking=False):   # never close one mid-command
+            try:
+                _drop(s)
+            finally:
+                s.lock.release()
+
+
+def close_all() -> None:
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for s in sessions:
+        s.close()
@@ -0,0 +1,216 @@
+"""Consolidated czytaj hook state — one SQLite (WAL) store instead of a file per value.
+
+WHY: every auto-read touched a handful of tiny ~/.claude/czytaj-* files — the spoken-text
+state (flock + tmp + replace), the cross-window spoken ledger (flock + read + rewrite),
+the last-folder file (tmp + replace), the active-session marker, and the screen/mic/media/
+volume probe caches — each its own open/lock/write/rename, and the claim → save-state →
+folder-prefix step of _speak_inner was three separate rewrites that another pane could
+interleave. Now they are rows in STORE_DB, and _speak_inner does the three in ONE
+transaction (transaction() below).
+
+Layout:
+  kv(key PRIMARY KEY, value TEXT, ts REAL)   state / active_session / last_folder /
+                                             probe caches (value + write time → TTL)
+  spoken_slots(slot PRIMARY KEY, hash, ts)   cross-window spoken-content claims, a fixed
+                                             LEDGER_SLOTS-row hash table (see ledger_claim)
+
+WAL + synchronous=NORMAL: readers never block the writer, and a commit is an append to
+the WAL without an fsync (the data is a few hundred bytes of soft state — losing the last
+commit on a power cut is harmless). busy_timeout covers concurrent hooks across panes.
+
+Fail-open: connect() returns None when the store can't be opened (no sqlite3 module,
+unwritable dir, corrupt db), and every accessor raises StoreError on a runtime failure, so
+_speak falls back to its per-file path instead of silently losing dedup state. Not
+covered on purpose: the markers other processes/shell watch by existence or mtime
+(KEYPAUSE_STATE, PLAYING_MARKER, PREHEAT_MARKER, CHANNEL_FILE, PAUSE_FLAG) and the
+watcher's DEVICE_STATE snapshot.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    import sqlite3
+except ImportError:   # stripped-down python builds: callers keep the per-file path
+    sqlite3 = None
+_DBError = sqlite3.Error if sqlite3 is not None else OSError
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from czytaj_paths import STORE_DB  # noqa: E402
+
+BUSY_TIMEOUT_MS = 2000
+LEDGER_SLOTS = 1024   # spoken-ledger capacity; live claims (45 s TTL) are a handful at most
+_local = threading.local()   # one connection per thread (sqlite3 objects aren't shareable)
+
+
+class StoreError(Exception):
+    """A store read/write failed — the caller takes its fallback path."""
+
+
+# Run once per db, not per connect(): PRAGMA user_version records the layout it is at, so a
+# warm connect is one pragma read. Bump SCHEMA_VERSION with every change below (statements
+# stay idempotent — a db at any older version just runs them all).
+SCHEMA_VERSION = 2   # 1: kv + ledger   2: ledger → spoken_slots
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value TEXT NOT NULL, ts REAL NOT NULL)",
+    "DROP TABLE IF EXISTS ledger",   # pre-slot layout: one row per hash, pruned by scan
+    "CREATE TABLE IF NOT EXISTS spoken_slots "
+    "(slot INTEGER PRIMARY KEY, hash TEXT NOT NULL, ts REAL NOT NULL)",
+)
+
+
+def _ensure_schema(conn) -> None:
+    """Bring the db to SCHEMA_VERSION (one transaction; a concurrent first connect waits on
+    BEGIN IMMEDIATE, then re-runs the idempotent statements harmlessly)."""
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for stmt in _SCHEMA:
+            conn.execute(stmt)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.execute("COMMIT")
+    except _DBError:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def connect():
+    """This thread's connection, opened (and the schema ensured) on first use; None if the
+    store is unavailable. Re-opened after a fork (a connection must not cross processes)."""
+    if sqlite3 is None:
+        return None
+    conn = getattr(_local, "conn", None)
+    if conn is not None and getattr(_local, "pid", None) == os.getpid():
+        return conn
+    try:
+        conn = sqlite3.connect(STORE_DB, timeout=BUSY_TIMEOUT_MS / 1000.0,
+                               isolation_level=None)   # autocommit; transaction() opens one
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        _ensure_schema(conn)
+        try:
+            os.chmod(STORE_DB, 0o600)
+        except OSError:
+            pass
+    except _DBError:
+        return None
+    _local.conn = conn
+    _local.pid = os.getpid()
+    return conn
+
+
+@contextmanager
+def transaction() -> Iterator[object]:
+    """`with transaction() as tx:` — one BEGIN IMMEDIATE … COMMIT spanning every accessor
+    called with conn=tx. Yields None when the store is unavailable (accessors then take the
+    caller's fallback path one by one). Rolls back if the block raises; a COMMIT that fails
+    (e.g. busy past BUSY_TIMEOUT_MS, disk full) is rolled back and raises StoreError, so
+    the caller redoes the block on its fallback path instead of losing it silently."""
+    conn = connect()
+    if conn is None:
+        yield None
+        return
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+    except _DBError:
+        yield None
+        return
+    try:
+        yield conn
+    except BaseException:
+        try:
+            conn.execute("ROLLBACK")
+        except _DBError:
+            pass
+        raise
+    try:
+        conn.execute("COMMIT")
+    except _DBError as e:
+        try:
+            conn.execute("ROLLBACK")
+        except _DBError:
+            pass
+        raise StoreError(e)
+
+
+def _conn(conn):
+    c = conn if conn is not None else connect()
+    if c is None:
+        raise StoreError("store unavailable")
+    return c
+
+
+# ── kv ──────────────────────────────────────────────────────────────────────
+def get(key: str, conn=None) -> tuple[str, float] | None:
+    """(value, ts) or None if absent."""
+    try:
+        row = _conn(conn).execute("SELECT value, ts FROM kv WHERE key = ?", (key,)).fetchone()
+    except _DBError as e:
+        raise StoreError(e)
+    return (row[0], row[1]) if row else None
+
+
+def put(key: str, value: str, ts: float, conn=None) -> None:
+    try:
+        _conn(conn).execute("INSERT OR REPLACE INTO kv (key, value, ts) VALUES (?, ?, ?)",
+                            (key, value, ts))
+    except _DBError as e:
+        raise StoreError(e)
+
+
+def get_json(key: str, conn=None):
+    row = get(key, conn)
+    if row is None:
+        return None
+    try:
+        return json.loads(row[0])
+    except ValueError:
+        return None
+
+
+def put_json(key: str, obj, ts: float, conn=None) -> None:
+    put(key, json.dumps(obj), ts, conn)
+
+
+def cache_get(key: str, ttl_s: float, now: float, conn=None) -> str | None:
+    """A probe-cache value written less than ttl_s ago, else None."""
+    row = get(key, conn)
+    if row is None or not (0 <= now - row[1] < ttl_s):
+        return None
+    return row[0]
+
+
+# ── spoken ledger ───────────────────────────────────────────────────────────
+def ledger_slot(content_hash: str, slots: int = LEDGER_SLOTS) -> tuple[int, bytes]:
+    """(slot index, 20-byte digest) of a claim — shared with _speak's slot-file fallback."""
+    digest = hashlib.sha1(content_hash.encode("utf-8", "replace")).digest()
+    return int.from_bytes(digest[:4], "little") % slots, digest
+
+
+def ledger_claim(content_hash: str, ttl_s: float, now: float, conn=None) -> bool:
+    """True if nobody claimed `content_hash` within ttl_s. The claim's time is ALWAYS
+    refreshed (sliding window). Direct-mapped: the hash owns one of LEDGER_SLOTS rows, read
+    and overwritten by primary key, so a claim costs the same however long the history.
+    Expiry is lazy (a stale row is just overwritten); a colliding hash evicts the other's
+    claim, which can only let a duplicate through, never silence a new text. Runs in its
+    own transaction unless the caller passes conn=tx."""
+    if conn is None:
+        with transaction() as tx:
+            if tx is None:
+                raise StoreError("store unavailable")
+            return ledger_claim(content_hash, ttl_s, now, tx)
+    slot, _digest = ledger_slot(content_hash)
+    try:
+        row = conn.execute("SELECT hash, ts FROM spoken_slots WHERE slot = ?", (slot,)).fetchone()
+        conn.execute("INSERT OR REPLACE INTO spoken_slots (slot, hash, ts) VALUES (?, ?, ?)",
+                     (slot, content_hash, now))
+    except _DBError as e:
+        raise StoreError(e)
+    return not (row and row[0] == content_hash and 0 <= now - row[1] < ttl_s)
@@ -0,0 +1,94 @@
+"""Markdown → speakable text for czytaj, in one tokenizing pass, plus its sentence split.
+
+WHY: _speak.strip_markdown ran ~15 sequential re.sub passes over the whole reply, each
+walking the full text again (and looking its pattern up in re's cache on every call), for
+auto-read, read-back and precache alike. The sentence split that followed (piper_stream's
+stream chunks, czytaj_ttscache's per-sentence keys) was a third copy of the same regex.
+
+Now normalize() is:
+  1. fences — text.split("```"): the odd parts are fenced code (an unterminated fence runs
+     to the end), dropped exactly like the old r"```.*?```" + r"```.*$" pair;
+  2. ONE scan of _TOKEN (precompiled alternation) over what remains; only markdown
+     constructs match, so the callback runs per construct, not per character:
+       blank-line run → ". "     horizontal rule → " "    "# " heading marker → ""
+       "- " / "* " / "1. " list marker → ". "             `code` / **bold** / *em* /
+       [label](url) → their text (itself re-scanned for inline constructs only)
+       table pipe → " "          emoji / pictographs / arrows → ""
+  3. whitespace collapse (str.split — C speed).
+
+Same output as the old passes on real replies (bench/text_bench.py diffs the two over
+~/.claude transcripts); the known differences are edge cases the sequential passes got
+wrong by accident — a whitespace-only line now ends a paragraph like an empty one, and an
+emphasis/code span is not re-read as a heading or list marker after being unwrapped.
+
+split_sentences() is the one sentence-boundary rule (after . ! ? … followed by whitespace)
+the streaming chunker and the TTS cache share.
+"""
+from __future__ import annotations
+
+import re
+
+# Inline constructs — also used to re-scan the text INSIDE a one-line code/emphasis/link span.
+# F28: * / ** are emphasis ONLY when not hugging a word char, so arithmetic/globs
+# (a*b*c, 2*3*4, *.py) aren't fused into "abc"/"234".
+_INLINE = (
+    r"`(?P<code>[^`]+)`"
+    r"|(?<!\w)\*\*(?P<bold>[^*]+)\*\*(?!\w)"
+    r"|(?<!\w)\*(?P<em>[^*]+)\*(?!\w)"
+    r"|\[(?P<link>[^\]]+)\]\([^)]+\)"
+)
+# Line-level constructs first (they only match at a line start), then the inline ones.
+# F30: rules, table pipes and emoji go, so a reply that is only "---" / "| a | b |" / "✅"
+# is empty. A table's |---|:--:| delimiter row is a rule too (it used to be read out as
+# "------ -----").
+_TOKEN = re.compile(
+    r"(?P<para>\n(?:[^\S\n]*\n)+)"
+    r"|^(?P<rule>[^\S\n]*(?:[-=*_]{3,}|(?=\|?[^\S\n]*:?-)[|:\- \t]*\|[|:\- \t]*)[^\S\n]*$(?:\n[^\S\n]*(?=\n))*)"
+    r"|^(?P<head>#+[^\S\n]*)"
+    r"|^(?P<item>[^\S\n]*(?:[-*]|\d+\.)[^\S\n]+)"
+    r"|" + _INLINE,
+    re.MULTILINE,
+)
+_INLINE_TOKEN = re.compile(_INLINE)
+_ITEM_AHEAD = re.compile(r"[^\S\n]*(?:[-*]|\d+\.)[^\S\n]+")
+# Pipes and emoji are plain character deletes — done at C speed after the scan instead of
+# costing a callback per table cell.
+_EMOJI = re.compile(
+    "[\U0001F000-\U0001FAFF\U00002600-\U000027BF\U0001F1E6-\U0001F1FF\uFE0F\u2190-\u21FF\u2300-\u23FF]+")
+_SENTENCE_END = re.compile(r"(?<=[.!?…])\s+")
+
+_MARKERS = {"head": "", "rule": " ", "item": ". "}
+
+
+def _inline(m: re.Match) -> str:
+    kind = m.lastgroup
+    if kind in _MARKERS:
+        return _MARKERS[kind]
+    inner = m.group(kind)
+    if "\n" in inner:   # a span over several lines still has its lines' markers
+        return _TOKEN.sub(_token, inner)
+    if "*" in inner or "`" in inner or "[" in inner:
+        return _INLINE_TOKEN.sub(_inline, inner)
+    return inner
+
+
+def _token(m: re.Match) -> str:
+    if m.lastgroup == "para":
+        # A list right after a blank line already says ". " — don't double the pause.
+        return " " if _ITEM_AHEAD.match(m.string, m.end()) else ". "
+    return _inline(m)
+
+
+def normalize(text: str) -> str:
+    """Speakable plain text of a markdown reply (whitespace-collapsed, stripped)."""
+    if not text:
+        return ""
+    if "```" in text:
+        text = " ".join(text.split("```")[::2])
+    text = _TOKEN.sub(_token, text).replace("|", " ")
+    return " ".join(_EMOJI.sub("", text).split())
+
+
+def split_sentences(text: str) -> list[str]:
+    """Sentences of already-normalized text, split after . ! ? … followed by whitespace."""
+    return [s for s in _SENTENCE_END.split(text) if s.strip()]
@@ -0,0 +1,360 @@
+"""Incremental transcript scanning for czytaj — persistent per-transcript offset index.
+
+WHY: every Stop/PreToolUse hook located the current turn by readlines() + json.loads over
+the WHOLE transcript JSONL (up to 5× per hook on the current_turn_text retry path). Long
+sessions reach tens of MB, so that re-parse was the dominant per-tool-call CPU cost on the
+phone. The index remembers, per transcript, how far it has been scanned (`pos`, always a
+complete-line boundary) and where the current turn starts (`user_off`, the byte right
+after the last real user message), so a hook only reads + decodes the bytes appended
+since the previous call, then the current turn itself.
+
+Index file: TURN_INDEX_DIR/<sha1(realpath)>.json = {dev, ino, pos, user_off, tail}.
+`tail` is a sha1 of the 64 bytes before `pos` — a cheap fingerprint that catches an
+in-place rewrite with the same inode that grew past the old size. Any mismatch (inode
+change, file shrank, fingerprint differs, unreadable index) → rescan (see below).
+Fail-open everywhere: an index that can't be read or written just means a rescan.
+
+A cold/invalid index is rebuilt by a REVERSE block scan (os.pread fixed-size chunks from
+EOF, stopping at the first real user line), so even a first hook on a huge transcript costs
+O(current turn), not O(transcript). iter_reverse() exposes the same reader for callers that
+want the last few messages of a kind.
+
+Message index (the read-back side): the newest MSG_INDEX_MAX assistant text messages as
+[offset, length, sha1-of-text], in TURN_INDEX_DIR/<sha1(realpath)>.msgs.json =
+{dev, ino, pos, tail, full, msgs}, validated and extended exactly like the turn index
+(forward scan of the appended bytes; reverse scan when cold). assistant_texts() then reads
+the n-th-from-last message with ONE pread, in any process — the watcher's read-back, the
+precache worker and the hooks all share it instead of each re-parsing the transcript tail.
+A stored hash that no longer matches the bytes at its offset → rebuild.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from typing import Iterator
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from czytaj_paths import TURN_INDEX_DIR  # noqa: E402
+
+TAIL_PROBE = 64             # bytes fingerprinted before `pos`
+SCAN_CHUNK = 1 << 20        # forward-scan read size
+REVERSE_BLOCK = 64 * 1024   # reverse-scan pread size
+MSG_INDEX_MAX = 64          # assistant messages kept in the message index (VolumeUp depth)
+
+
+def is_real_user(msg: dict) -> bool:
+    """A user line that starts a turn — i.e. NOT a tool_result echo (those are type=user
+    too, and appear after every tool call inside the same turn)."""
+    if msg.get("type") != "user":
+        return False
+    content = msg.get("message", {}).get("content", [])
+    if isinstance(content, list):
+        for c in content:
+            if isinstance(c, dict) and c.get("type") == "tool_result":
+                return False
+    return True
+
+
+def message_text(msg: dict) -> str:
+    """One transcript entry's text blocks, joined — a read-back 'message' ('' if none)."""
+    content = msg.get("message", {}).get("content", [])
+    if not isinstance(content, list):
+        return ""
+    parts = [c["text"] for c in content
+             if isinstance(c, dict) and c.get("type") == "text" and c.get("text")]
+    return "\n".join(parts).strip()
+
+
+def _index_path(path: str, suffix: str = ".json") -> str:
+    key = hashlib.sha1(os.path.realpath(path).encode("utf-8")).hexdigest()
+    return os.path.join(TURN_INDEX_DIR, key + suffix)
+
+
+def _load_index(path: str, suffix: str = ".json") -> dict:
+    try:
+        with open(_index_path(path, suffix)) as f:
+            idx = json.load(f)
+        if isinstance(idx, dict):
+            return idx
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def _save_index(path: str, idx: dict, suffix: str = ".json") -> None:
+    """Atomic tmp+replace (concurrent hooks may race; last writer wins — every writer
+    derived its values from the same append-only file, so any winner is correct)."""
+    dest = _index_path(path, suffix)
+    tmp = f"{dest}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(TURN_INDEX_DIR, exist_ok=True)
+        with open(tmp, "w") as f:
+            json.dump(idx, f)
+        os.replace(tmp, dest)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def _tail_sig(fd: int, pos: int) -> str:
+    start = max(0, pos - TAIL_PROBE)
+    try:
+        return hashlib.sha1(os.pread(fd, pos - start, start)).hexdigest()
+    except OSError:
+        return ""
+
+
+def _parse_line(raw: bytes) -> dict | None:
+    # F22: decode with errors="replace" — a non-UTF8 byte must not raise (it's not an OSError).
+    try:
+        msg = json.loads(raw.decode("utf-8", errors="replace"))
+    except ValueError:
+        return None
+    return msg if isinstance(msg, dict) else None
+
+
+def _type_hint(line: bytes, kind: bytes) -> bool:
+    """Substring pre-filter before json.loads: can this line's type be `kind`? Nested
+    strings are JSON-escaped (\\"type\\"), so a miss here is a definite miss; a hit is
+    confirmed by the real parse."""
+    return (b'"type":"' + kind + b'"') in line or (b'"type": "' + kind + b'"') in line
+
+
+def _iter_lines_reverse(fd: int, end: int) -> Iterator[tuple[int, bytes]]:
+    """Yield (offset, line) newest→oldest for [0, end), reading REVERSE_BLOCK chunks with
+    os.pread from EOF. The first item is the segment after the last newline ('' when the
+    file ends with one) — i.e. a possibly-partial line; its offset is the complete-line end."""
+    pos = end
+    carry = b""
+    while pos > 0:
+        n = min(REVERSE_BLOCK, pos)
+        pos -= n
+        buf = os.pread(fd, n, pos) + carry
+        parts = buf.split(b"\n")
+        carry = parts[0]            # may start mid-line — completed by the next block
+        off = pos + len(buf)
+        for line in reversed(parts[1:]):
+            off -= len(line)
+            yield off, line
+            off -= 1
+    yield 0, carry
+
+
+def _scan_reverse(fd: int, size: int) -> tuple[int, int]:
+    """Cold path: (complete_end, user_off) found from EOF backwards — stops at the first
+    real user line instead of decoding the whole transcript."""
+    complete_end = -1
+    for off, line in _iter_lines_reverse(fd, size):
+        if complete_end < 0:
+            complete_end = off      # trailing partial (or empty) segment — not a line yet
+            continue
+        if _type_hint(line, b"user"):
+            msg = _parse_line(line)
+            if msg is not None and is_real_user(msg):
+                return complete_end, off + len(line) + 1
+    return max(complete_end, 0), -1
+
+
+def iter_reverse(path: str, kind: str) -> Iterator[dict]:
+    """Parsed messages of type `kind`, newest→oldest. Stop iterating early to read only
+    the tail of the transcript. Raises OSError if the file can't be opened."""
+    k = kind.encode("ascii")
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        for _off, line in _iter_lines_reverse(fd, os.fstat(fd).st_size):
+            if line and _type_hint(line, k):
+                msg = _parse_line(line)
+                if msg is not None and msg.get("type") == kind:
+                    yield msg
+    finally:
+        os.close(fd)
+
+
+def _iter_lines_forward(fd: int, pos: int, size: int) -> Iterator[tuple[int, bytes]]:
+    """Yield (offset, line) for the complete lines in [pos, size). A trailing partial line
+    (writer mid-append) is not yielded — it is left for the next call."""
+    carry = b""
+    base = pos           # file offset of carry[0]
+    while pos < size:
+        try:
+            chunk = os.pread(fd, min(SCAN_CHUNK, size - pos), pos)
+        except OSError:
+            break
+        if not chunk:
+            break
+        pos += len(chunk)
+        buf = carry + chunk
+        start = 0
+        while True:
+            nl = buf.find(b"\n", start)
+            if nl < 0:
+                break
+            yield base + start, buf[start:nl]
+            start = nl + 1
+        carry = buf[start:]
+        base += start
+
+
+def _scan_forward(fd: int, pos: int, size: int, user_off: int) -> tuple[int, int]:
+    """Scan complete lines in [pos, size); return (new_pos, new_user_off)."""
+    for off, line in _iter_lines_forward(fd, pos, size):
+        pos = off + len(line) + 1
+        # Cheap pre-filter: only user lines can move user_off.
+        if _type_hint(line, b"user"):
+            msg = _parse_line(line)
+            if msg is not None and is_real_user(msg):
+                user_off = pos
+    return pos, user_off
+
+
+def turn_start(path: str) -> int:
+    """Byte offset where the current turn begins (right after the last real user message),
+    or -1 if the transcript has no user message yet. Raises OSError if unreadable."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        st = os.fstat(fd)
+        idx = _load_index(path)
+        pos = idx.get("pos", 0)
+        user_off = idx.get("user_off", -1)
+        valid = (isinstance(pos, int) and isinstance(user_off, int)
+                 and idx.get("dev") == st.st_dev and idx.get("ino") == st.st_ino
+                 and 0 <= pos <= st.st_size and user_off <= pos
+                 and idx.get("tail") == _tail_sig(fd, pos))
+        if valid and pos == st.st_size:
+            return user_off
+        if valid:
+            new_pos, new_user_off = _scan_forward(fd, pos, st.st_size, user_off)
+        else:
+            new_pos, new_user_off = _scan_reverse(fd, st.st_size)
+        if not valid or new_pos != pos:
+            _save_index(path, {"dev": st.st_dev, "ino": st.st_ino, "pos": new_pos,
+                               "user_off": new_user_off, "tail": _tail_sig(fd, new_pos)})
+        return new_user_off
+    finally:
+        os.close(fd)
+
+
+def read_from(path: str, offset: int) -> list[dict]:
+    """Decode every parseable JSON line from `offset` to EOF (the current turn)."""
+    with open(path, "rb") as f:
+        f.seek(max(0, offset))
+        data = f.read()
+    out = []
+    for line in data.split(b"\n"):
+        if not line.strip():
+            continue
+        msg = _parse_line(line)
+        if msg is not None:
+            out.append(msg)
+    return out
+
+
+# ── Message index (read-back: n-th-from-last assistant message with one pread) ──
+def _text_entry(off: int, line: bytes) -> list | None:
+    """[offset, length, sha1(text)] for an assistant line that has text, else None."""
+    if not _type_hint(line, b"assistant"):
+        return None
+    msg = _parse_line(line)
+    if msg is None or msg.get("type") != "assistant":
+        return None
+    text = message_text(msg)
+    if not text:
+        return None
+    return [off, len(line), hashlib.sha1(text.encode("utf-8", "replace")).hexdigest()]
+
+
+def _msgs_reverse(fd: int, size: int) -> tuple[int, list, bool]:
+    """Cold path: (complete_end, newest MSG_INDEX_MAX entries oldest→newest, full) — full
+    means the scan reached the start of the file, i.e. these are ALL the messages."""
+    complete_end = -1
+    found: list = []
+    for off, line in _iter_lines_reverse(fd, size):
+        if complete_end < 0:
+            complete_end = off
+            continue
+        entry = _text_entry(off, line)
+        if entry is not None:
+            found.append(entry)
+            if len(found) >= MSG_INDEX_MAX:
+                return complete_end, found[::-1], False
+    return max(complete_end, 0), found[::-1], True
+
+
+def _message_index(fd: int, path: str) -> dict:
+    """The current message index for the open transcript — extended with the bytes
+    appended since it was saved, or rebuilt when it no longer matches the file."""
+    st = os.fstat(fd)
+    idx = _load_index(path, ".msgs.json")
+    pos = idx.get("pos", 0)
+    msgs = idx.get("msgs")
+    valid = (isinstance(pos, int) and isinstance(msgs, list)
+             and idx.get("dev") == st.st_dev and idx.get("ino") == st.st_ino
+             and 0 <= pos <= st.st_size and idx.get("tail") == _tail_sig(fd, pos))
+    if valid and pos == st.st_size:
+        return idx
+    full = bool(idx.get("full")) if valid else False
+    if valid:
+        new_pos = pos
+        for off, line in _iter_lines_forward(fd, pos, st.st_size):
+            new_pos = off + len(line) + 1
+            entry = _text_entry(off, line)
+            if entry is not None:
+                msgs.append(entry)
+        if len(msgs) > MSG_INDEX_MAX:
+            msgs = msgs[-MSG_INDEX_MAX:]
+            full = False
+    else:
+        new_pos, msgs, full = _msgs_reverse(fd, st.st_size)
+    idx = {"dev": st.st_dev, "ino": st.st_ino, "pos": new_pos,
+           "tail": _tail_sig(fd, new_pos), "full": full, "msgs": msgs}
+    if not valid or new_pos != pos:
+        _save_index(path, idx, ".msgs.json")
+    return idx
+
+
+def newest_digest(path: str) -> str:
+    """sha1 of the newest assistant text message (= its read-back cache key), straight from
+    the message index — no message is read back. "" if there is none. Raises OSError if
+    the file can't be read."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        msgs = _message_index(fd, path)["msgs"]
+    finally:
+        os.close(fd)
+    return msgs[-1][2] if msgs else ""
+
+
+def assistant_texts(path: str, limit: int = 0) -> list[str]:
+    """Assistant text messages (message_text of each entry), oldest→newest; limit>0 → only
+    the newest `limit` (fewer = the transcript holds fewer). Served from the message index
+    with one pread per message; a request deeper than the index (or limit=0 on a long
+    transcript) falls back to a reverse scan. Raises OSError if the file can't be read."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        idx = _message_index(fd, path)
+        msgs = idx["msgs"]
+        if (limit and len(msgs) >= limit) or idx["full"]:
+            out = []
+            for off, length, digest in (msgs[-limit:] if limit else msgs):
+                msg = _parse_line(os.pread(fd, length, off))
+                text = message_text(msg) if msg is not None else ""
+                if hashlib.sha1(text.encode("utf-8", "replace")).hexdigest() != digest:
+                    _save_index(path, {}, ".msgs.json")   # stale — rebuild next time
+                    break
+                out.append(text)
+            else:
+                return out
+    finally:
+        os.close(fd)
+    newest_first: list[str] = []
+    for msg in iter_reverse(path, "assistant"):
+        text = message_text(msg)
+        if text:
+            newest_first.append(text)
+            if limit and len(newest_first) >= limit:
+                break
+    return newest_first[::-1]
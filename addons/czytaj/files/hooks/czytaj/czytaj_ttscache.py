@@ -0,0 +1,235 @@
+"""Content-addressed global TTS audio cache for czytaj — one wav per spoken sentence.
+
+WHY: the read-back cache (_speak._readback_cache_path) is keyed per SESSION by sha1 of the
+raw turn text, so it only ever hits on "read this exact turn again in this pane". Auto-read
+synthesizes suffixes and folder-prefixed text ("Projekt. …"), precache a different pane's
+copy of the same words, and the short repeated phrases ("Gotowe.", project labels, status
+lines) were re-synthesized by the daemon every single time — ~0.3–0.7 s of warm inference
+each, on the path before the first sample plays.
+
+Now synthesize_warm() splits its text into sentences and looks each one up here first:
+key = sha1(voice | length_scale | rate | whitespace-normalized sentence), value = a 16-bit
+mono wav in TTS_CACHE_DIR. Only the misses go to the daemon (and are stored); the hits and
+the fresh sentences are concatenated into the caller's wav with a short gap between them
+(piper puts its own inter-sentence silence only INSIDE one request). Shared by auto-read,
+read-back and precache across every session and pane.
+
+Eviction: LRU by total size — a hit touches the entry's mtime, and the oldest entries go
+until the dir is under TTS_CACHE_MAX_MB. The full scandir+stat pass only runs when the
+running total kept in SIZE_FILE ("<bytes> <puts since the last scan>", bumped by each
+store) crosses the limit, or every EVICT_EVERY stores to re-sync a drifted total (two
+writers racing on the bump lose one add — the next scan corrects it). Everything fails open: an
+unreadable / mismatched entry is a miss, an unwritable dir just means no caching.
+CZYTAJ_TTS_CACHE=0 disables it (synthesize_warm then sends the whole text in one request).
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import sys
+import wave
+from typing import Callable
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import czytaj_paths as cz  # noqa: E402
+import czytaj_text  # noqa: E402
+
+ENABLED = os.environ.get("CZYTAJ_TTS_CACHE", "1") != "0"
+try:
+    MAX_BYTES = int(float(os.environ.get("CZYTAJ_TTS_CACHE_MAX_MB", "64")) * 1024 * 1024)
+except ValueError:
+    MAX_BYTES = 64 * 1024 * 1024   # ≈ 25 min of 22050 Hz 16-bit mono
+SENTENCE_GAP_S = 0.2               # silence between concatenated sentences (piper's own default)
+EVICT_EVERY = 256                  # stores between full re-scans even while under the limit
+SIZE_FILE = ".size"                # in TTS_CACHE_DIR: running total, see the module docstring
+_WS = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    """Whitespace-collapsed text — the part of the key that varies. Case and punctuation
+    stay: both change the prosody piper produces."""
+    return _WS.sub(" ", text or "").strip()
+
+
+def split_sentences(text: str) -> list[str]:
+    """Normalized sentences (czytaj_text's sentence boundaries)."""
+    return czytaj_text.split_sentences(normalize(text))
+
+
+def key(sentence: str) -> str:
+    ident = f"{cz.PIPER_VOICE}|{cz.PIPER_LENGTH_SCALE}|{cz.PIPER_SAMPLE_RATE}|{normalize(sentence)}"
+    return hashlib.sha1(ident.encode("utf-8", "replace")).hexdigest()
+
+
+def _entry_path(sentence: str) -> str:
+    return os.path.join(cz.TTS_CACHE_DIR, key(sentence) + ".wav")
+
+
+def _read_frames(path: str) -> bytes | None:
+    """PCM frames of a cache entry, or None if it's absent or not our format (a torn or
+    foreign file is a miss, never an error)."""
+    try:
+        with wave.open(path, "rb") as w:
+            if (w.getnchannels() != 1 or w.getsampwidth() != 2
+                    or w.getframerate() != cz.PIPER_SAMPLE_RATE):
+                return None
+            frames = w.readframes(w.getnframes())
+    except (OSError, EOFError, wave.Error):
+        return None
+    return frames or None
+
+
+def get(sentence: str) -> bytes | None:
+    """Cached PCM for `sentence`, touching the entry so eviction is LRU."""
+    if not ENABLED:
+        return None
+    path = _entry_path(sentence)
+    frames = _read_frames(path)
+    if frames is not None:
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+    return frames
+
+
+def put(sentence: str, frames: bytes) -> None:
+    """Store PCM for `sentence` (atomic per-pid tmp + replace), then trim to MAX_BYTES."""
+    if not ENABLED or not frames:
+        return
+    dest = _entry_path(sentence)
+    tmp = f"{dest}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cz.TTS_CACHE_DIR, exist_ok=True)
+        with wave.open(tmp, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(cz.PIPER_SAMPLE_RATE)
+            w.writeframes(frames)
+        os.replace(tmp, dest)
+    except (OSError, wave.Error):
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return
+    total, puts = _read_size()
+    if total < 0 or total + len(frames) > MAX_BYTES or puts + 1 >= EVICT_EVERY:
+        evict()
+    else:
+        _write_size(total + len(frames) + 44, puts + 1)   # + the wav header
+
+
+def _read_size() -> tuple[int, int]:
+    """(bytes, puts) from SIZE_FILE; (-1, 0) when it's missing or garbled (→ rescan)."""
+    try:
+        with open(os.path.join(cz.TTS_CACHE_DIR, SIZE_FILE)) as f:
+            total, puts = f.read().split()
+        return int(total), int(puts)
+    except (OSError, ValueError):
+        return -1, 0
+
+
+def _write_size(total: int, puts: int) -> None:
+    path = os.path.join(cz.TTS_CACHE_DIR, SIZE_FILE)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w") as f:
+            f.write(f"{total} {puts}\n")
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def evict(max_bytes: int | None = None) -> None:
+    """Drop least-recently-used entries until the cache is under `max_bytes`, and record
+    the real total in SIZE_FILE."""
+    limit = MAX_BYTES if max_bytes is None else max_bytes
+    entries = []
+    total = 0
+    try:
+        with os.scandir(cz.TTS_CACHE_DIR) as it:
+            for e in it:
+                if not e.name.endswith(".wav"):
+                    continue
+                try:
+                    st = e.stat()
+                except OSError:
+                    continue
+                total += st.st_size
+                entries.append((st.st_mtime, st.st_size, e.path))
+    except OSError:
+        return
+    if total > limit:
+        entries.sort()
+        for _mtime, size, path in entries:
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= limit:
+                break
+    _write_size(total, 0)
+
+
+def _synth_frames(synth: Callable[[str, str], bool], text: str, tmp: str) -> bytes | None:
+    """PCM of synth(text, tmp), or None if it failed; `tmp` is always removed."""
+    try:
+        return _read_frames(tmp) if synth(text, tmp) else None
+    finally:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def synthesize(text: str, out_wav: str, synth: Callable[[str, str], bool],
+               fallback: Callable[[str, str], bool] | None = None) -> bool:
+    """Build `out_wav` from per-sentence cache entries, calling synth(sentence, wav_path)
+    only for the misses (the fresh wav is read back, stored, and then removed). Sentences
+    synth fails on are not redone with the rest: each run of consecutive failed sentences
+    goes to fallback(run_text, wav_path) as one request (default: synth), not stored.
+    Returns False only if a fallback fails too — the caller then synthesizes the whole
+    text. Exceptions from `synth` / `fallback` (e.g. SynthCancelled) propagate."""
+    sentences = split_sentences(text)
+    if not sentences:
+        return False
+    parts: list[bytes | None] = []
+    for i, sent in enumerate(sentences):
+        frames = get(sent)
+        if frames is None:
+            frames = _synth_frames(synth, sent, f"{out_wav}.s{i}.{os.getpid()}.wav")
+            if frames is not None:
+                put(sent, frames)
+        parts.append(frames)
+    out: list[bytes] = []
+    i = 0
+    while i < len(parts):
+        if parts[i] is not None:
+            out.append(parts[i])
+            i += 1
+            continue
+        j = i
+        while j < len(parts) and parts[j] is None:
+            j += 1
+        frames = _synth_frames(fallback or synth, " ".join(sentences[i:j]),
+                               f"{out_wav}.f{i}.{os.getpid()}.wav")
+        if frames is None:
+            return False
+        out.append(frames)
+        i = j
+    gap = b"\x00\x00" * int(cz.PIPER_SAMPLE_RATE * SENTENCE_GAP_S)
+    try:
+        with wave.open(out_wav, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(cz.PIPER_SAMPLE_RATE)
+            w.writeframes(gap.join(out))
+    except (OSError, wave.Error):
+        return False
+    return True
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Thin Stop/PreToolUse client: hand the hook payload to the warm piper_server.
+
+WHY: every hook fire used to boot `python3 stop.py`, import _speak (+ czytaj_paths and the
+rest) and only then do the work — hundreds of ms of interpreter start + imports on PRoot,
+on EVERY tool call. The server is already resident (keepwarm) with those modules loaded,
+so this client only reads stdin, sends {"hook": name, "data": payload} over the socket and
+exits on the ack; the server runs the hook body (stop.py/pre-tool-use.py `handle`) in a
+thread. Run as `python3 -S` (no site import): stdlib socket/json only, nothing else loaded.
+
+Fallback: server not up / no ack → run the same `handle(data)` in-process, exactly the old
+path (which also (re)starts the server via piper_stream for the next fire).
+"""
+import importlib.util
+import json
+import os
+import socket
+import sys
+
+HOOK_DIR = os.path.dirname(os.path.abspath(__file__))
+HOOK_SCRIPTS = {"stop": "stop.py", "pre-tool-use": "pre-tool-use.py"}
+ACK_TIMEOUT_S = 0.5
+_loaded: dict = {}
+
+
+def load_hook(name: str):
+    """Import a hook script by name (hyphenated filenames aren't importable normally).
+    Cached — the server loads each once and then reuses the warm module."""
+    mod = _loaded.get(name)
+    if mod is None:
+        path = os.path.join(HOOK_DIR, HOOK_SCRIPTS[name])
+        spec = importlib.util.spec_from_file_location("czytaj_hook_" + name.replace("-", "_"), path)
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+        _loaded[name] = mod
+    return mod
+
+
+def _socket_path() -> str:
+    # czytaj-env.sh exports CZYTAJ_RUN_DIR (pinned == czytaj_paths.RUN_DIR by the selftest);
+    # importing czytaj_paths is the fallback when run outside the shell wrapper.
+    run_dir = os.environ.get("CZYTAJ_RUN_DIR")
+    if not run_dir:
+        sys.path.insert(0, HOOK_DIR)
+        from czytaj_paths import RUN_DIR as run_dir
+    return os.path.join(run_dir, "server.sock")
+
+
+def _send(name: str, data: dict) -> bool:
+    """True once the server has ACKED the hook (it then runs it on its own)."""
+    s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    s.settimeout(ACK_TIMEOUT_S)
+    try:
+        s.connect(_socket_path())
+        s.sendall(json.dumps({"hook": name, "data": data}).encode("utf-8") + b"\n\n")
+        resp = b""
+        while b"\n" not in resp:
+            chunk = s.recv(256)
+            if not chunk:
+                break
+            resp += chunk
+        return bool(json.loads(resp.decode("utf-8", "ignore").strip() or "{}").get("ok"))
+    except (OSError, ValueError):
+        return False
+    finally:
+        try:
+            s.close()
+        except OSError:
+            pass
+
+
+def main() -> int:
+    name = sys.argv[1] if len(sys.argv) > 1 else ""
+    if name not in HOOK_SCRIPTS:
+        return 0
+    try:
+        data = json.load(sys.stdin)
+    except Exception:
+        return 0
+    if not isinstance(data, dict):
+        return 0
+    # The server is shared by every project: resolve the per-hook project dir HERE (the
+    # hook's CLAUDE_PROJECT_DIR, F1/F5 order) and ship it as data['cwd'], since the
+    # server's own environment belongs to whichever process spawned it.
+    data["cwd"] = os.environ.get("CLAUDE_PROJECT_DIR") or data.get("cwd", "")
+    if _send(name, data):
+        return 0
+    import site   # -S skipped it; the in-process path may want site-packages
+    site.main()
+    return load_hook(name).handle(data)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,24 @@
 #!/usr/bin/env python3
 """Long-lived Piper TTS server.
 
-Spawns piper-daemon (C++) once with model preloaded, then listens on a UNIX
-socket. Each client connection sends text and receives the path to a generated
+Spawns piper-daemon (C++) with model preloaded — a small RAM-bounded pool of them
+(PIPER_POOL_SIZE, default 2) so background precache never blocks a live read —
+then listens on a UNIX socket. Each client connection sends text and receives the path to a generated
 WAV file. This eliminates the ~5s cold-start cost of loading the ONNX model
 on every speak operation.
 
 Auto-starts itself: clients call ensure_running() which double-forks the
 server if no PID is alive.
+
+Also serves the Stop/PreToolUse hooks: hook_client.py sends {"hook": name, "data": ...}
+and the hook body runs in a server thread with _speak already imported, instead of a
+fresh `python3 stop.py` + import chain per tool call.
 """
 from __future__ import annotations
 
 import errno
 import fcntl
+import heapq
 import json
 import os
 import signal
@@ -29,6 +35,8 @@ from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 import czytaj_paths as cz  # noqa: E402  — SSOT for paths/config (audit 2026-06-15)
+from czytaj_pcm import float32_to_int16  # noqa: E402
+import czytaj_shell  # noqa: E402
 
 # Piper install layout + daemon RUN_DIR + synth defaults now come from czytaj_paths.
 # S2/S4/S5: RUN_DIR used to be hardcoded HERE and in toggle.sh and install.sh (kept aligned
@@ -50,6 +58,7 @@ DEFAULT_VOICE = cz.PIPER_VOICE
 DEFAULT_LENGTH = cz.PIPER_LENGTH_SCALE
 DEFAULT_SAMPLE_RATE = cz.PIPER_SAMPLE_RATE
 SERVER_IDLE_TIMEOUT_S = int(os.environ.get("PIPER_IDLE_TIMEOUT", "1800"))
+HOOK_DRAIN_S = 30.0   # shutdown waits this long for in-flight (already-acked) hook bodies
 DAEMON_READ_TIMEOUT_S = float(os.environ.get("PIPER_DAEMON_TIMEOUT", "40"))  # 2026-06-15: was 10.
 # SD1 set 10 assuming "a 2000-char read-back is a few seconds" — MEASURED WRONG on this device:
 # 147 chars synth in ~2s, so a full ~2000-char read-back is ~27s, which the 10s cap KILLED
@@ -58,7 +67,25 @@ DAEMON_READ_TIMEOUT_S = float(os.environ.get("PIPER_DAEMON_TIMEOUT", "40"))  # 2
 # 40s, but server_alive()'s PING already catches a DEAD daemon before synth, so the only exposure
 # is a mid-synth hang (rare). speak_raw's socket timeout stays above this so the server's own
 # kill+respond fires first.
-_daemon_err_count = 0  # FD4: consecutive synth-failure counter; recycle the daemon after 2 (below)
+_daemon_err_counts: dict[int, int] = {}  # FD4: consecutive synth failures per daemon pid; recycle after 2 (below)
+# ── Daemon pool (was ONE daemon behind one lock — a precache burst blocked a live read) ─
+# Each piper-daemon holds the model (~100 MB RSS), so the pool is bounded by RAM: at most
+# PIPER_POOL_SIZE workers, and never more than MemAvailable / POOL_WORKER_RAM_MB allows.
+# Worker 0 starts with the server; extras spawn lazily only when every live worker is busy
+# and a request is waiting, and are reaped after POOL_IDLE_REAP_S without work.
+try:
+    PIPER_POOL_SIZE = max(1, int(os.environ.get("PIPER_POOL_SIZE", "2")))
+except ValueError:
+    PIPER_POOL_SIZE = 2
+POOL_WORKER_RAM_MB = 150        # per-daemon budget incl. headroom (measured ~100 MB RSS)
+POOL_IDLE_REAP_S = 120.0        # extra (non-first) workers idle this long are stopped
+# ── Synth priority (request "priority" field; lower value is served first) ──
+# interactive = a VolumeUp read-back miss the user is waiting on; auto = the Stop/PreToolUse
+# auto-read; precache = background read-back cache fill. Requests without the field (older
+# clients) count as auto. With >1 worker slot, worker 0 never takes precache work, so a
+# foreground synth always has a warm daemon free within one in-flight request.
+SYNTH_PRIORITIES = {"interactive": 0, "auto": 1, "precache": 2}
+PRIO_PRECACHE = SYNTH_PRIORITIES["precache"]
 
 
 def _is_alive(pid: int) -> bool:
@@ -183,6 +210,18 @@ def ensure_running() -> bool:
             pass
 
 
+def _log_daemon_stderr(stream) -> None:
+    """Copy a piper-daemon's stderr into czytaj.log, one record per line, until it exits."""
+    import czytaj_log
+    try:
+        for raw in iter(stream.readline, b""):
+            line = raw.decode("utf-8", errors="replace").rstrip()
+            if line:
+                czytaj_log.log("DAEMON", line, level="warn")
+    except (OSError, ValueError):
+        pass
+
+
 def _spawn_daemon() -> subprocess.Popen | None:
     env = os.environ.copy()
     env["LD_LIBRARY_PATH"] = f"{PIPER_LIB}:{env.get('LD_LIBRARY_PATH', '')}"
@@ -190,19 +229,19 @@ def _spawn_daemon() -> subprocess.Popen | None:
     env["PIPER_VOICE_PATH"] = str(PIPER_VOICES)
     env["PIPER_LENGTH_SCALE"] = DEFAULT_LENGTH
     try:
-        # F13: route the long-lived daemon's stderr to czytaj.log instead of
-        # /dev/null so synth failures are diagnosable. The child keeps its own
-        # dup of the fd, so closing our handle after spawn is fine.
-        with open(cz.LOG_FILE, "a") as _errlog:
-            d = subprocess.Popen(
-                [str(PIPER_DAEMON), "-m", DEFAULT_VOICE],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=_errlog,
-                env=env,
-            )
+        # F13: the long-lived daemon's stderr goes to czytaj.log instead of /dev/null so
+        # synth failures are diagnosable — line by line through czytaj_log (a reader
+        # thread), not as a raw fd on the file, which rotation could never move.
+        d = subprocess.Popen(
+            [str(PIPER_DAEMON), "-m", DEFAULT_VOICE],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+        )
     except (FileNotFoundError, OSError):
         return None
+    threading.Thread(target=_log_daemon_stderr, args=(d.stderr,), daemon=True).start()
     ready = d.stdout.readline().decode("utf-8", errors="ignore").strip()
     if ready != "READY":
         try:
@@ -235,19 +274,20 @@ def synthesize_via_daemon(daemon: subprocess.Popen, text: str, raw_path: Path) -
             break
         line_bytes += chunk
         if b"\n" in line_bytes:
-            global _daemon_err_count
             line = line_bytes.split(b"\n", 1)[0].decode("utf-8", errors="ignore").strip()
             ok = line == "OK" and raw_path.exists()
             if ok:
-                _daemon_err_count = 0
+                _daemon_err_counts.pop(daemon.pid, None)
             else:
                 # FD4: a persistent synth fault (ERR / missing out file) used to return False
                 # WITHOUT recycling the daemon, so every later read failed silently. Recycle after
-                # 2 consecutive failures (get_daemon respawns a clean one); a single transient ERR
-                # keeps the warm daemon — no ~5s cold respawn for a one-off bad path.
-                _daemon_err_count += 1
-                if _daemon_err_count >= 2:
-                    _daemon_err_count = 0
+                # 2 consecutive failures (the pool respawns a clean one); a single transient ERR
+                # keeps the warm daemon — no ~5s cold respawn for a one-off bad path. Counted per
+                # daemon pid so one faulty pool worker can't recycle a healthy sibling.
+                errs = _daemon_err_counts.get(daemon.pid, 0) + 1
+                _daemon_err_counts[daemon.pid] = errs
+                if errs >= 2:
+                    _daemon_err_counts.pop(daemon.pid, None)
                     try:
                         daemon.kill()
                     except OSError:
@@ -260,6 +300,362 @@ def synthesize_via_daemon(daemon: subprocess.Popen, text: str, raw_path: Path) -
     return False
 
 
+def _mem_available_mb() -> int | None:
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+class _Worker:
+    __slots__ = ("idx", "proc", "busy", "spawning", "last_used")
+
+    def __init__(self, idx: int) -> None:
+        self.idx = idx
+        self.proc: subprocess.Popen | None = None
+        self.busy = False
+        self.spawning = False
+        self.last_used = time.monotonic()
+
+    def alive(self) -> bool:
+        # Health check before every hand-out: a daemon that died (crash, or FD4 recycle
+        # kill in synthesize_via_daemon) is seen here and respawned by the pool.
+        return self.proc is not None and self.proc.poll() is None
+
+
+def _stop_daemon(d: subprocess.Popen | None) -> None:
+    if d is None:
+        return
+    try:
+        if d.stdin:
+            d.stdin.close()
+    except OSError:
+        pass
+    try:
+        d.wait(timeout=2)
+    except Exception:
+        try:
+            d.kill()
+        except OSError:
+            pass
+
+
+class _Waiter:
+    __slots__ = ("prio", "tag", "t0", "worker", "done")
+
+    def __init__(self, prio: int, tag: str) -> None:
+        self.prio = prio
+        self.tag = tag
+        self.t0 = time.monotonic()
+        self.worker: _Worker | None = None
+        self.done = ""           # "" waiting | "cancelled" | "timeout"
+
+
+class DaemonPool:
+    """N warm piper-daemon workers behind a priority queue. acquire() enqueues a waiter
+    (heap keyed by (priority, arrival)); _dispatch() hands idle live workers to waiters in
+    that order, so interactive/auto synth jumps every queued precache job. A worker carries
+    exactly one synth at a time (the daemon's stdin/stdout protocol is strictly
+    request→reply), so the pool replaces the old single daemon_lock. Queued jobs can be
+    cancelled by tag prefix (stale precache after the transcript moved on)."""
+
+    def __init__(self, size: int) -> None:
+        self.workers = [_Worker(i) for i in range(max(1, size))]
+        self.cond = threading.Condition()
+        self.closed = False
+        self._spawn_fail_ts = 0.0
+        self._heap: list[tuple[int, int, _Waiter]] = []
+        self._seq = 0
+        names = list(SYNTH_PRIORITIES)
+        self.served = dict.fromkeys(names, 0)
+        self.max_wait_s = dict.fromkeys(names, 0.0)
+        self.cancelled = 0
+        self.timeouts = 0
+        self.dropped = 0         # dropped unserved: no worker alive and a respawn failed
+
+    def start(self) -> bool:
+        """Spawn worker 0 synchronously (server startup — no daemon, no server)."""
+        w = self.workers[0]
+        w.proc = _spawn_daemon()
+        return w.alive()
+
+    def _room_for(self, w: _Worker) -> bool:
+        if w.idx == 0:
+            return True          # the first worker is always allowed (it IS the old daemon)
+        avail = _mem_available_mb()
+        return avail is None or avail >= POOL_WORKER_RAM_MB
+
+    def _spawn_into(self, w: _Worker) -> None:
+        """Background spawn (cond held by caller): waiters keep waiting on cond and take
+        whichever comes first — a busy worker freeing up or this one becoming READY."""
+        w.spawning = True
+
+        def run() -> None:
+            proc = _spawn_daemon()
+            with self.cond:
+                w.spawning = False
+                if self.closed:
+                    _stop_daemon(proc)
+                    return
+                w.proc = proc
+                w.last_used = time.monotonic()
+                if proc is None:
+                    self._spawn_fail_ts = time.monotonic()
+                self._dispatch()
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def _reserve_first(self) -> bool:
+        """Keep worker 0 off precache work — only when a second worker can exist."""
+        if len(self.workers) < 2:
+            return False
+        return (any(w.alive() or w.spawning for w in self.workers[1:])
+                or self._room_for(self.workers[1]))
+
+    def _allowed(self, w: _Worker, prio: int, reserve: bool) -> bool:
+        return not (reserve and prio >= PRIO_PRECACHE and w.idx == 0)
+
+    def _dispatch(self) -> None:
+        """Assign idle live workers to waiters in (priority, arrival) order; spawn a worker
+        in the background for the best still-unserved waiter. cond must be held."""
+        reserve = self._reserve_first()
+        waiting = False
+        best_unserved = None
+        for _prio, _seq, waiter in sorted(self._heap):
+            for w in self.workers:
+                if not w.busy and w.alive() and self._allowed(w, waiter.prio, reserve):
+                    w.busy = True
+                    waiter.worker = w
+                    break
+            else:
+                waiting = True
+                if best_unserved is None:
+                    best_unserved = waiter
+        if waiting:
+            self._heap = [e for e in self._heap if e[2].worker is None]
+            heapq.heapify(self._heap)
+        else:
+            self._heap = []
+        # One failed spawn per waiter: one that already saw a spawn fail is dropped by
+        # acquire() (counted in `dropped`) instead of retrying in a tight respawn loop.
+        if (best_unserved is not None and self._spawn_fail_ts <= best_unserved.t0
+                and not any(w.spawning for w in self.workers)):
+            for w in self.workers:
+                if (not w.busy and not w.alive() and self._room_for(w)
+                        and self._allowed(w, best_unserved.prio, reserve)):
+                    self._spawn_into(w)
+                    break
+        self.cond.notify_all()
+
+    def _drop(self, waiter: _Waiter, why: str) -> None:
+        waiter.done = why
+        self._heap = [e for e in self._heap if e[2] is not waiter]
+        heapq.heapify(self._heap)
+
+    def acquire(self, timeout_s: float, priority: str = "auto", tag: str = "") -> _Waiter:
+        """Block until a worker is assigned (waiter.worker) or the job ends unserved
+        (waiter.done = "cancelled" / "timeout")."""
+        prio = SYNTH_PRIORITIES.get(priority, SYNTH_PRIORITIES["auto"])
+        waiter = _Waiter(prio, tag)
+        deadline = waiter.t0 + timeout_s
+        with self.cond:
+            self._seq += 1
+            heapq.heappush(self._heap, (prio, self._seq, waiter))
+            self._dispatch()
+            while waiter.worker is None and not waiter.done:
+                if self.closed:
+                    self._drop(waiter, "cancelled")
+                    break
+                if (self._spawn_fail_ts > waiter.t0 and not any(
+                        w.alive() or w.spawning for w in self.workers)):
+                    self.dropped += 1
+                    self._drop(waiter, "timeout")    # nothing alive and a respawn failed
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.timeouts += 1
+                    self._drop(waiter, "timeout")
+                    break
+                self.cond.wait(min(remaining, 0.5))
+                if waiter.worker is None and not waiter.done:
+                    self._dispatch()   # a spawn finished / a worker died since the last pass
+            if waiter.worker is not None:
+                name = next(k for k, v in SYNTH_PRIORITIES.items() if v == prio)
+                self.served[name] += 1
+                self.max_wait_s[name] = max(self.max_wait_s[name],
+                                            round(time.monotonic() - waiter.t0, 2))
+            return waiter
+
+    def cancel(self, prefix: str) -> int:
+        """Cancel QUEUED (not in-flight) jobs whose tag starts with `prefix`."""
+        if not prefix:
+            return 0
+        with self.cond:
+            hit = [e[2] for e in self._heap if e[2].tag.startswith(prefix)]
+            for waiter in hit:
+                waiter.done = "cancelled"
+            if hit:
+                self._heap = [e for e in self._heap if not e[2].done]
+                heapq.heapify(self._heap)
+                self.cancelled += len(hit)
+                self.cond.notify_all()
+            return len(hit)
+
+    def release(self, w: _Worker) -> None:
+        with self.cond:
+            w.busy = False
+            w.last_used = time.monotonic()
+            self._dispatch()
+
+    def reap_idle(self) -> None:
+        """Stop extra workers idle for POOL_IDLE_REAP_S (worker 0 stays warm)."""
+        stale = []
+        with self.cond:
+            now = time.monotonic()
+            for w in self.workers[1:]:
+                if not w.busy and w.alive() and now - w.last_used > POOL_IDLE_REAP_S:
+                    stale.append(w.proc)
+                    w.proc = None
+        for d in stale:
+            _stop_daemon(d)
+
+    def stats(self) -> dict:
+        with self.cond:
+            queued = dict.fromkeys(SYNTH_PRIORITIES, 0)
+            for prio, _seq, _w in self._heap:
+                queued[next(k for k, v in SYNTH_PRIORITIES.items() if v == prio)] += 1
+            return {"workers": sum(w.alive() for w in self.workers),
+                    "busy": sum(w.busy for w in self.workers),
+                    "size": len(self.workers),
+                    "queued": queued, "served": dict(self.served),
+                    "max_wait_s": dict(self.max_wait_s),
+                    "cancelled": self.cancelled, "timeouts": self.timeouts,
+                    "dropped": self.dropped}
+
+    def close(self) -> None:
+        with self.cond:
+            self.closed = True
+            procs = [w.proc for w in self.workers]
+            for w in self.workers:
+                w.proc = None
+            self.cond.notify_all()
+        for d in procs:
+            _stop_daemon(d)
+
+
+def _pool_size() -> int:
+    """PIPER_POOL_SIZE, capped by what MemAvailable can hold right now."""
+    avail = _mem_available_mb()
+    if avail is None:
+        return PIPER_POOL_SIZE
+    return max(1, min(PIPER_POOL_SIZE, avail // POOL_WORKER_RAM_MB))
+
+
+WAV_PUMP_CHUNK = 64 * 1024   # bytes of float32 read per conversion step (≈0.75 s of audio)
+
+
+def _pump_wav(src, wav_path: str, rate: int) -> int:
+    """Stream raw float32 from `src` into a 16-bit mono wav, converting block by block
+    (czytaj_pcm) — never holds the whole utterance in RAM. The wave module writes a
+    placeholder header and patches the frame count on close. Returns frames written."""
+    frames = 0
+    carry = b""
+    with wave.open(wav_path, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        while True:
+            chunk = src.read(WAV_PUMP_CHUNK)
+            if not chunk:
+                break
+            buf = carry + chunk
+            whole = len(buf) // 4 * 4
+            carry = buf[whole:]
+            if whole:
+                w.writeframes(float32_to_int16(buf[:whole]))
+                frames += whole // 4
+    return frames
+
+
+def synthesize_wav_via_daemon(daemon: subprocess.Popen, text: str, wav_out: Path) -> bool:
+    """Synth straight to a playable 16-bit wav at wav_out (one hop for the client).
+    The daemon writes float32 into a FIFO in RUN_DIR that a pump thread converts into
+    `<wav_out>.<pid>-<thread>.part` as it arrives (per pool worker thread: a precache job and
+    a read-back miss can target the same wav_out at once), renamed over wav_out on success —
+    no raw file on slow shared storage, no read-back of it, no second whole-file copy in
+    RAM. If a FIFO can't be made, the raw goes to a RUN_DIR file and is pumped from there instead."""
+    tag = f"{os.getpid()}-{threading.get_ident()}"
+    part = f"{wav_out}.{tag}.part"
+    fifo = RUN_DIR / f"wav-{tag}.fifo"
+    try:
+        os.mkfifo(str(fifo), 0o600)
+    except OSError:
+        fifo = None
+    try:
+        if fifo is None:
+            raw = RUN_DIR / f"wav-{tag}.raw"
+            try:
+                if not synthesize_via_daemon(daemon, text, raw):
+                    return False
+                with open(raw, "rb") as src:
+                    frames = _pump_wav(src, part, DEFAULT_SAMPLE_RATE)
+            finally:
+                try:
+                    raw.unlink()
+                except OSError:
+                    pass
+        else:
+            result: dict = {}
+
+            def pump() -> None:
+                try:
+                    with open(fifo, "rb") as src:   # blocks until the daemon opens it
+                        try:
+                            result["frames"] = _pump_wav(src, part, DEFAULT_SAMPLE_RATE)
+                        except (OSError, wave.Error) as e:
+                            result["err"] = e
+                            # Keep reading to EOF: closing the read end now would leave the
+                            # daemon writing into a reader-less FIFO (SIGPIPE/EPIPE) and take
+                            # a healthy worker down over our failed .part.
+                            while src.read(WAV_PUMP_CHUNK):
+                                pass
+                except (OSError, wave.Error) as e:
+                    result.setdefault("err", e)
+
+            t = threading.Thread(target=pump, daemon=True)
+            t.start()
+            ok = synthesize_via_daemon(daemon, text, fifo)
+            if not ok:
+                # The daemon may never have opened the FIFO: pair the pump's blocked open
+                # with a throwaway writer so it sees EOF (non-blocking: ENXIO = no reader left).
+                try:
+                    os.close(os.open(str(fifo), os.O_WRONLY | os.O_NONBLOCK))
+                except OSError:
+                    pass
+            t.join(timeout=10)
+            if not ok or t.is_alive() or "err" in result:
+                return False
+            frames = result.get("frames", 0)
+        if not frames:
+            return False
+        os.replace(part, wav_out)
+        return True
+    except (OSError, wave.Error):
+        return False
+    finally:
+        for leftover in (part, fifo):
+            if leftover is None:
+                continue
+            try:
+                os.unlink(leftover)
+            except OSError:
+                pass
+
+
 def _wav_out_safe(wav_out: str) -> bool:
     try:
         p = Path(wav_out).resolve()
@@ -267,7 +663,10 @@ def _wav_out_safe(wav_out: str) -> bool:
         return False
     home = Path.home().resolve()
     tmp = Path(tempfile.gettempdir()).resolve()
-    for base in (home, tmp, RUN_DIR.resolve()):
+    # + the Termux-side audio dirs: a wav the server writes for termux-media-player (or the
+    # read-back cache) lives there, outside PRoot's ~.
+    extra = [Path(d).resolve() for d in cz.AUDIO_SCRATCH_DIRS + cz.READBACK_CACHE_DIRS]
+    for base in (home, tmp, RUN_DIR.resolve(), *extra):
         try:
             p.relative_to(base)
             return True
@@ -276,52 +675,73 @@ def _wav_out_safe(wav_out: str) -> bool:
     return False
 
 
+def _run_hook(name: str, data: dict) -> None:
+    """Run a hook body in-process (the warm path for hook_client.py). Never raises —
+    a crash here must not take down the accept loop."""
+    try:
+        import hook_client
+        hook_client.load_hook(name).handle(data)
+    except Exception as e:
+        import czytaj_log
+        czytaj_log.log("HOOK", name, level="error", error=repr(e))
+
+
+def _prewarm_hooks() -> None:
+    """Import the hook modules (and with them _speak) right after bind, so even the
+    first hook fire after a server (re)start skips the import cost."""
+    try:
+        import hook_client
+        for name in hook_client.HOOK_SCRIPTS:
+            hook_client.load_hook(name)
+    except Exception:
+        pass
+
+
 def run_server() -> None:
     try:
         RUN_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
     except OSError:
         return
+    for stale in RUN_DIR.glob("wav-*"):   # FIFO/raw leftovers of a SIGKILL'd generation
+        try:
+            stale.unlink()
+        except OSError:
+            pass
+    # Hooks are served for EVERY project: project_dir() must come from each request's
+    # data['cwd'] (hook_client resolves the hook's CLAUDE_PROJECT_DIR into it), not from
+    # whichever process happened to spawn this server.
+    os.environ.pop("CLAUDE_PROJECT_DIR", None)
 
-    env = os.environ.copy()
-    env["LD_LIBRARY_PATH"] = f"{PIPER_LIB}:{env.get('LD_LIBRARY_PATH', '')}"
-    env["ESPEAK_DATA_PATH"] = str(PIPER_ESPEAK)
-    env["PIPER_VOICE_PATH"] = str(PIPER_VOICES)
-    env["PIPER_LENGTH_SCALE"] = DEFAULT_LENGTH
-
-    daemon_holder = {"d": None}
-    daemon = _spawn_daemon()
-    daemon_holder["d"] = daemon
+    pool = DaemonPool(_pool_size())
+    started = pool.start()
 
     sock = None
-    daemon_lock = threading.Lock()
     shutdown_done = threading.Event()
+    # Hook bodies run after the ack, when the client has already exited — nobody else
+    # will fall back if this process dies under them, so shutdown waits for them.
+    hooks_running: set = set()
+    hooks_lock = threading.Lock()
 
-    def get_daemon():
-        d = daemon_holder["d"]
-        if d is None or d.poll() is not None:
-            d = _spawn_daemon()
-            daemon_holder["d"] = d
-        return d
+    def drain_hooks() -> None:
+        deadline = time.monotonic() + HOOK_DRAIN_S
+        with hooks_lock:
+            running = [t for t in hooks_running if t is not threading.current_thread()]
+        for t in running:
+            t.join(max(0.0, deadline - time.monotonic()))
+        left = [t.name for t in running if t.is_alive()]
+        if left:
+            try:
+                import czytaj_log
+                czytaj_log.log("SERVER", "exit with hooks running", level="warn", hooks=left)
+            except Exception:
+                pass
 
     def shutdown(*_):
         if shutdown_done.is_set():
             return
         shutdown_done.set()
-        with daemon_lock:
-            d = daemon_holder.get("d")
-            if d is not None:
-                try:
-                    if d.stdin:
-                        d.stdin.close()
-                except OSError:
-                    pass
-                try:
-                    d.wait(timeout=2)
-                except Exception:
-                    try:
-                        d.kill()
-                    except OSError:
-                        pass
+        drain_hooks()   # before pool.close(): the hook bodies still speak through the pool
+        pool.close()
         if sock is not None:
             try:
                 sock.close()
@@ -342,7 +762,7 @@ def run_server() -> None:
         sys.exit(0)
 
     try:
-        if daemon is None:
+        if not started:
             shutdown()
             return
 
@@ -363,6 +783,14 @@ def run_server() -> None:
 
         signal.signal(signal.SIGTERM, shutdown)
         signal.signal(signal.SIGINT, shutdown)
+        threading.Thread(target=_prewarm_hooks, daemon=True).start()
+
+        def reaper() -> None:
+            while not shutdown_done.wait(POOL_IDLE_REAP_S / 4):
+                pool.reap_idle()
+                czytaj_shell.reap_idle()   # the hooks' resident rish/adb session
+
+        threading.Thread(target=reaper, daemon=True).start()
 
         def handle(conn: socket.socket) -> None:
             try:
@@ -381,7 +809,30 @@ def run_server() -> None:
                     conn.sendall(b'{"ok":false,"error":"bad-json"}\n')
                     return
                 if req.get("ping"):   # S6: liveness probe — answer without synth
+                    conn.sendall(json.dumps({"ok": True, **pool.stats()}).encode() + b"\n")
+                    return
+                if "cancel" in req:   # drop queued jobs by tag prefix (stale precache)
+                    n = pool.cancel(str(req.get("cancel") or ""))
+                    conn.sendall(json.dumps({"ok": True, "cancelled": n}).encode() + b"\n")
+                    return
+                hook = req.get("hook")
+                if hook:
+                    import hook_client
+                    data = req.get("data")
+                    if hook not in hook_client.HOOK_SCRIPTS or not isinstance(data, dict):
+                        conn.sendall(b'{"ok":false,"error":"hook"}\n')
+                        return
+                    # Ack first: the client exits now; the hook body runs on in this thread.
                     conn.sendall(b'{"ok":true}\n')
+                    conn.close()
+                    me = threading.current_thread()
+                    with hooks_lock:
+                        hooks_running.add(me)
+                    try:
+                        _run_hook(hook, data)
+                    finally:
+                        with hooks_lock:
+                            hooks_running.discard(me)
                     return
                 text = req.get("text", "")
                 wav_out = req.get("wav_out", "")
@@ -391,18 +842,31 @@ def run_server() -> None:
                 if not _wav_out_safe(wav_out):
                     conn.sendall(b'{"ok":false,"error":"path"}\n')
                     return
-                with daemon_lock:
-                    d = get_daemon()
-                    if d is None:
+                job = pool.acquire(DAEMON_READ_TIMEOUT_S, str(req.get("priority") or "auto"),
+                                   str(req.get("tag") or ""))
+                w = job.worker
+                if w is None:
+                    # A cancelled job must be told so — the client then skips its cold
+                    # fallback (stale precache is dropped, not re-synthesized the slow way).
+                    if job.done == "cancelled":
+                        conn.sendall(b'{"ok":false,"error":"cancelled"}\n')
+                    else:
                         conn.sendall(b'{"ok":false,"error":"daemon-spawn"}\n')
-                        return
-                    ok = synthesize_via_daemon(d, text, Path(wav_out))
+                    return
+                fmt = "wav" if req.get("format") == "wav" else "raw"
+                try:
+                    if fmt == "wav":
+                        ok = synthesize_wav_via_daemon(w.proc, text, Path(wav_out))
+                    else:
+                        ok = synthesize_via_daemon(w.proc, text, Path(wav_out))
+                finally:
+                    pool.release(w)
                 if not ok:
                     conn.sendall(b'{"ok":false,"error":"synth"}\n')
                     return
                 conn.sendall(
                     json.dumps(
-                        {"ok": True, "raw": wav_out, "rate": DEFAULT_SAMPLE_RATE}
+                        {"ok": True, fmt: wav_out, "format": fmt, "rate": DEFAULT_SAMPLE_RATE}
                     ).encode() + b"\n"
                 )
             except Exception as e:
@@ -451,11 +915,13 @@ def run_server() -> None:
         shutdown()
 
 
-def speak_raw(text: str, raw_out: Path, timeout_s: float = 45.0) -> int | None:  # 2026-06-15: was 12; must exceed DAEMON_READ_TIMEOUT_S so the server kills+responds first
-    """Synthesize text into raw float32 PCM at raw_out via the daemon.
-    Returns the sample rate on success, None on failure."""
-    if not ensure_running():
-        return None
+class SynthCancelled(Exception):
+    """The server dropped this queued job (cancel by tag) — callers must NOT fall back to a
+    cold one-shot synth: the work was deliberately abandoned as stale."""
+
+
+def _request(req: dict, timeout_s: float) -> dict | None:
+    """One JSON request/response round-trip on the server socket; None on any failure."""
     s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
     s.settimeout(timeout_s)
     try:
@@ -464,8 +930,7 @@ def speak_raw(text: str, raw_out: Path, timeout_s: float = 45.0) -> int | None:
         except OSError:
             return None
         try:
-            req = json.dumps({"text": text, "wav_out": str(raw_out)}).encode("utf-8")
-            s.sendall(req + b"\n\n")
+            s.sendall(json.dumps(req).encode("utf-8") + b"\n\n")
             data = b""
             while True:
                 chunk = s.recv(4096)
@@ -475,12 +940,9 @@ def speak_raw(text: str, raw_out: Path, timeout_s: float = 45.0) -> int | None:
                 if b"\n" in data:
                     break
             try:
-                resp = json.loads(data.decode("utf-8", errors="ignore").strip())
+                return json.loads(data.decode("utf-8", errors="ignore").strip())
             except json.JSONDecodeError:
                 return None
-            if not resp.get("ok"):
-                return None
-            return int(resp.get("rate") or DEFAULT_SAMPLE_RATE)
         except OSError:
             return None
     finally:
@@ -490,7 +952,80 @@ def speak_raw(text: str, raw_out: Path, timeout_s: float = 45.0) -> int | None:
             pass
 
 
-def speak(text: str, wav_out: Path, timeout_s: float = 45.0) -> bool:  # 2026-06-15: was 12
+def speak_raw(text: str, raw_out: Path, timeout_s: float | None = None,
+              priority: str = "auto", tag: str = "") -> int | None:
+    """Synthesize text into raw float32 PCM at raw_out via the daemon pool.
+    Returns the sample rate on success, None on failure; raises SynthCancelled if the
+    job was cancelled while queued. `priority` is a SYNTH_PRIORITIES name; `tag` makes
+    the job cancellable via cancel_pending(prefix).
+    Default timeout = worst case server-side: queue wait (≤ DAEMON_READ_TIMEOUT_S) + synth
+    (≤ DAEMON_READ_TIMEOUT_S) + margin — must exceed both so the server's own
+    kill+respond fires first (was a flat 45 s with the single FIFO daemon)."""
+    if not ensure_running():
+        return None
+    if timeout_s is None:
+        timeout_s = 2 * DAEMON_READ_TIMEOUT_S + 5.0
+    req = {"text": text, "wav_out": str(raw_out), "priority": priority}
+    if tag:
+        req["tag"] = tag
+    resp = _request(req, timeout_s)
+    if not resp:
+        return None
+    if not resp.get("ok"):
+        if resp.get("error") == "cancelled":
+            raise SynthCancelled(tag)
+        return None
+    return int(resp.get("rate") or DEFAULT_SAMPLE_RATE)
+
+
+def speak_wav(text: str, wav_out: Path, timeout_s: float | None = None,
+              priority: str = "auto", tag: str = "") -> bool:
+    """Synthesize text into a ready-to-play 16-bit wav at wav_out (server-side conversion,
+    one hop). Same priority/tag/SynthCancelled contract as speak_raw. A server from before
+    this protocol field ignores "format" and writes raw float32 there — detected by the
+    missing "format" in its reply and converted in place, so a stale server still works."""
+    if not ensure_running():
+        return False
+    if timeout_s is None:
+        timeout_s = 2 * DAEMON_READ_TIMEOUT_S + 5.0
+    req = {"text": text, "wav_out": str(wav_out), "priority": priority, "format": "wav"}
+    if tag:
+        req["tag"] = tag
+    resp = _request(req, timeout_s)
+    if not resp:
+        return False
+    if not resp.get("ok"):
+        if resp.get("error") == "cancelled":
+            raise SynthCancelled(tag)
+        return False
+    if resp.get("format") == "wav":
+        return True
+    part = f"{wav_out}.{os.getpid()}.part"
+    try:
+        with open(wav_out, "rb") as src:
+            frames = _pump_wav(src, part, int(resp.get("rate") or DEFAULT_SAMPLE_RATE))
+        if frames:
+            os.replace(part, wav_out)
+            return True
+    except (OSError, wave.Error):
+        pass
+    try:
+        os.unlink(part)
+    except OSError:
+        pass
+    return False
+
+
+def cancel_pending(prefix: str) -> int:
+    """Cancel queued synth jobs whose tag starts with `prefix`. Returns how many were
+    dropped (0 if the server is down — nothing queued then anyway)."""
+    if not prefix or not server_alive():
+        return 0
+    resp = _request({"cancel": prefix}, 1.0) or {}
+    return int(resp.get("cancelled") or 0)
+
+
+def speak(text: str, wav_out: Path, timeout_s: float | None = None) -> bool:  # 2026-06-15: was 12
     return speak_raw(text, wav_out, timeout_s) is not None
 
 
@@ -7,12 +7,17 @@ near-real-time playback without intermediate WAV conversion.
 
 Falls back to a one-shot synthesize() of the bundled `piper` binary if the
 server is unavailable (e.g. during install before daemon comes up).
+
+Native PRoot (no pulse, termux-media-player only) streams per sentence: chunk N+1
+is synthesized while chunk N plays (_stream_native).
 """
 from __future__ import annotations
 
+import atexit
 import json
 import os
-import struct
+import queue
+import select
 import subprocess
 import sys
 import tempfile
@@ -23,6 +28,11 @@ from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 import czytaj_paths as cz  # noqa: E402  — SSOT for paths/config (audit 2026-06-15)
+from czytaj_pcm import float32_to_int16  # noqa: E402
+import czytaj_ttscache as ttscache  # noqa: E402
+import czytaj_text  # noqa: E402
+import czytaj_log  # noqa: E402
+import czytaj_pids  # noqa: E402
 
 # Piper install layout + synth defaults from czytaj_paths (S4/S5: were copy-pasted from
 # piper_server.py). Wrapped in Path() where this module uses the Path API.
@@ -35,6 +45,9 @@ PIPER_VOICE = cz.PIPER_VOICE
 PIPER_SAMPLE_RATE = cz.PIPER_SAMPLE_RATE
 VOICE_TYPER_FLAG = cz.VOICE_TYPER_FLAG
 VOICE_TYPER_STALE_S = cz.VOICE_TYPER_STALE_S  # keyboard heartbeats ≤1s (now SSOT, was a mirror)
+# Server queue priority for this process's synth (piper_server.SYNTH_PRIORITIES): _speak sets
+# "interactive" for an on-demand read-back; auto-read leaves the default.
+SYNTH_PRIORITY = os.environ.get("CZYTAJ_SYNTH_PRIORITY", "auto")
 
 
 def _vt_recording() -> bool:
@@ -161,13 +174,14 @@ def unlock_audio_routing() -> None:
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
         pass
     try:
-        subprocess.Popen(
+        proc = subprocess.Popen(
             ["termux-media-player", "play", str(tone)],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
             stdin=subprocess.DEVNULL,
             start_new_session=True,
         )
+        czytaj_pids.register(proc.pid, czytaj_pids.GROUP)   # own session → not in our group
         # was 0.9s — just enough for the tone to start and wake BT/Android Auto routing;
         # the tone keeps playing (Popen) and the real message replaces it right after.
         time.sleep(0.3)
@@ -221,26 +235,21 @@ def synthesize_one_shot(text: str, out_wav: Path) -> bool:
         )
         if proc.returncode != 0 or not raw_path.exists():
             _log("SYNTH-FAIL rc=", proc.returncode, "stderr=",
-                 (proc.stderr or b"").decode("utf-8", "replace")[-200:])
+                 (proc.stderr or b"").decode("utf-8", "replace")[-200:], level="warn")
             return False
         with open(raw_path, "rb") as f:
             raw = f.read()
-        n = len(raw) // 4
-        if n == 0:
+        shorts = float32_to_int16(raw)   # bulk (array/numpy); a truncated odd tail is dropped
+        if not shorts:
             return False
-        floats = struct.unpack(f"<{n}f", raw[:n * 4])   # slice: a truncated/odd tail must not raise struct.error
-        shorts = struct.pack(
-            f"<{n}h",
-            *(max(-32767, min(32767, int(x * 32767))) for x in floats),
-        )
         with wave.open(str(out_wav), "wb") as w:
             w.setnchannels(1)
             w.setsampwidth(2)
             w.setframerate(PIPER_SAMPLE_RATE)
             w.writeframes(shorts)
         return True
-    except (subprocess.TimeoutExpired, OSError, struct.error) as exc:
-        _log("SYNTH-FAIL exception:", exc)
+    except (subprocess.TimeoutExpired, OSError, wave.Error) as exc:
+        _log("SYNTH-FAIL exception:", exc, level="warn")
         return False
     finally:
         try:
@@ -249,51 +258,85 @@ def synthesize_one_shot(text: str, out_wav: Path) -> bool:
             pass
 
 
-def synthesize_warm(text: str, out_wav: Path) -> bool:
+def synthesize_warm(text: str, out_wav: Path, priority: str | None = None, tag: str = "") -> bool:
+    """Synthesise `text` to a playable 16-bit wav, sentence by sentence through the global
+    TTS cache (czytaj_ttscache): cached sentences come from disk, only the misses go to the
+    daemon. The daemon is checked ONCE here (ensure_running can fork a server and wait for
+    it): unavailable → one whole-text synth, no per-sentence loop. A sentence the daemon
+    fails is redone together with its failed neighbours (warm, then cold) without
+    resynthesizing the rest; once a miss finds the server gone, the remaining misses skip
+    the daemon and go cold in those runs. If the cache path fails for any other reason
+    (disabled, unwritable) the whole text is synthesized in one request. SynthCancelled
+    propagates either way."""
+    if not ttscache.ENABLED:
+        return _synthesize_uncached(text, out_wav, priority, tag)
+    try:
+        from piper_server import speak_wav, ensure_running, server_alive, SynthCancelled
+        warm = ensure_running()
+    except Exception:
+        warm = False
+    if not warm:
+        return synthesize_one_shot(text, out_wav)
+    _ensure_voice_length_scale()   # F9 (see _synthesize_uncached)
+    down = False       # a miss found the server gone — the rest go straight to the fallback
+    fell_back = False  # a fallback run was synthesized — a whole-text retry would redo it
+
+    def one(sentence: str, wav: str) -> bool:
+        nonlocal down
+        if down:
+            return False
+        try:
+            if speak_wav(sentence, Path(wav), priority=priority or SYNTH_PRIORITY, tag=tag):
+                return True
+        except SynthCancelled:
+            raise
+        except Exception as exc:
+            _log("WARM-SYNTH-FAIL", exc, level="warn")
+        down = not server_alive()
+        return False
+
+    def run(sentences: str, wav: str) -> bool:
+        nonlocal fell_back
+        fell_back = True
+        if down:
+            return synthesize_one_shot(sentences, Path(wav))
+        return _synthesize_uncached(sentences, Path(wav), priority, tag)
+    try:
+        if ttscache.synthesize(text, str(out_wav), one, run):
+            return True
+    except OSError as exc:
+        _log("TTS-CACHE-FAIL", exc, level="warn")
+    if fell_back:
+        return False   # warm and cold both failed on part of the text already
+    return _synthesize_uncached(text, out_wav, priority, tag)
+
+
+def _synthesize_uncached(text: str, out_wav: Path, priority: str | None = None,
+                         tag: str = "") -> bool:
     """Synthesise `text` to a playable 16-bit wav via the WARM piper daemon (model
-    already loaded → ~0.7s, NO per-call cold start). The daemon emits raw float32, so
-    convert it to wav exactly like synthesize_one_shot. Falls back to the cold one-shot
-    binary if the daemon is unavailable — so callers always get a wav."""
+    already loaded → ~0.7s, NO per-call cold start). The server writes the final wav at
+    out_wav itself (speak_wav: float32 streamed through a FIFO and converted on the fly —
+    was a .srv.raw file written next to out_wav, read back whole and converted here).
+    Falls back to the cold one-shot binary if the daemon is unavailable — so callers
+    always get a wav. `priority`/`tag` go to the server's queue (default SYNTH_PRIORITY).
+    A job cancelled while queued raises piper_server.SynthCancelled instead of falling
+    back cold."""
     try:
-        from piper_server import speak_raw, ensure_running
+        from piper_server import speak_wav, ensure_running, SynthCancelled
         if not ensure_running():
             return synthesize_one_shot(text, out_wav)
     except Exception:
         return synthesize_one_shot(text, out_wav)
     _ensure_voice_length_scale()   # F9: keep length_scale patched in the voice .onnx.json on
     #                                the WARM path too, else a re-downloaded voice loses the tempo fix
-    raw_path = out_wav.with_suffix(".srv.raw")
     try:
-        rate = speak_raw(text, raw_path)
-    except Exception:
-        rate = None
-    try:
-        if not rate or not raw_path.exists():
-            return synthesize_one_shot(text, out_wav)
-        with open(raw_path, "rb") as f:
-            raw = f.read()
-        n = len(raw) // 4
-        if n == 0:
-            return synthesize_one_shot(text, out_wav)
-        floats = struct.unpack(f"<{n}f", raw[:n * 4])   # slice: a truncated/odd tail must not raise struct.error
-        shorts = struct.pack(
-            f"<{n}h",
-            *(max(-32767, min(32767, int(x * 32767))) for x in floats),
-        )
-        with wave.open(str(out_wav), "wb") as w:
-            w.setnchannels(1)
-            w.setsampwidth(2)
-            w.setframerate(int(rate))
-            w.writeframes(shorts)
-        return True
+        if speak_wav(text, out_wav, priority=priority or SYNTH_PRIORITY, tag=tag):
+            return True
+    except SynthCancelled:
+        raise
     except Exception as exc:
-        _log("WARM-SYNTH-FAIL", exc)
-        return synthesize_one_shot(text, out_wav)
-    finally:
-        try:
-            raw_path.unlink()
-        except OSError:
-            pass
+        _log("WARM-SYNTH-FAIL", exc, level="warn")
+    return synthesize_one_shot(text, out_wav)
 
 
 _PULSE_CACHE: "bool | None" = None
@@ -329,12 +372,37 @@ def _wav_duration_s(audio: Path) -> float:
         return 0.0
 
 
+# Playback tracking for _play_via_termux_blocking (seconds).
+PLAY_TICK_S = 0.3          # local-signal cadence (Voice Typer / KEYPAUSE_STATE) — no forks
+PLAY_CONFIRM_S = 1.0       # the one early `info`: did playback start?
+PLAY_PROBE_MAX_S = 8.0     # mid-play `info` backoff cap
+PLAY_TAIL_PROBE_S = 0.25   # first `info` interval once the expected end has passed
+PLAY_TAIL_MAX_S = 2.0      # tail (and player-side pause) backoff cap
+PLAY_OVERRUN_S = 3.0       # give up waiting this long past the expected end
+
+
+def _player_state() -> str | None:
+    """One `termux-media-player info` round-trip → "playing" / "paused" / "stopped";
+    None if the call itself failed."""
+    try:
+        r = subprocess.run(
+            ["termux-media-player", "info"],
+            capture_output=True, text=True, timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    out = r.stdout or ""
+    if "Paused" in out:
+        return "paused"
+    return "playing" if "Playing" in out else "stopped"
+
+
 def _play_via_termux_blocking(audio: Path) -> None:
     """Play a wav through termux-media-player (Termux:API -> Android
     MediaPlayer) and BLOCK until it finishes. This is the ONLY working route on
     native PRoot Debian and keeps playing with the screen off / phone locked.
-    termux-media-player returns immediately, so poll `info` until not Playing
-    (bounded by wav duration) to preserve the one-utterance-at-a-time contract
+    termux-media-player returns immediately, so wait out the wav's duration (with
+    a few sparse `info` confirmations) to preserve the one-utterance-at-a-time contract
     and stop the caller from deleting the temp wav mid-playback. Raw float32
     can't be fed to MediaPlayer, so this path is wav-only."""
     try:
@@ -345,7 +413,7 @@ def _play_via_termux_blocking(audio: Path) -> None:
     except (OSError, subprocess.SubprocessError) as exc:
         # F13: don't swallow a missing/broken termux-media-player silently —
         # the Termux bridge is intermittently "command not found" on PRoot.
-        _log("PLAY-FAIL termux-media-player:", exc)
+        _log("PLAY-FAIL termux-media-player:", exc, level="warn")
         return
     # The play command has fired and returned → audible playback is starting NOW. Logged
     # AFTER the command (so the log write can't delay the sound), giving the true
@@ -359,15 +427,29 @@ def _play_via_termux_blocking(audio: Path) -> None:
         PLAYING_MARKER.touch()  # signal "czytaj audio playing now" for the watcher's lock-screen gate
     except OSError:
         pass
-    # Pause-aware poll. VolumeDown pauses via termux-media-player, flipping `info`
-    # to "Paused" — that must NOT read as "finished" (else we'd release the channel
-    # + delete the wav, and resume would break). While paused we keep holding and
-    # FREEZE the play-budget so a long pause can't trip the duration deadline; a
-    # hard cap bounds a pause the user never resumes.
-    play_budget = _wav_duration_s(audio) + 3.0
-    hard_cap = time.monotonic() + 1800.0
-    last = time.monotonic()
-    time.sleep(0.3)  # let `info` flip to Playing before we poll
+    # Duration-tracked wait (was: fork `termux-media-player info` every 0.3s for the whole
+    # utterance — each one an `am` round-trip that can take seconds, dozens per read-back).
+    # The wav's own duration says when the audio should end; `info` is only asked:
+    #   - once after PLAY_CONFIRM_S (did playback actually start? a failed/very short play
+    #     reads "not Playing" → done),
+    #   - sparsely mid-play on a doubling schedule capped at PLAY_PROBE_MAX_S (catches an
+    #     external stop / player-side pause without hammering am),
+    #   - from the expected end on a short doubling tail (PLAY_TAIL_PROBE_S → PLAY_TAIL_MAX_S)
+    #     until it reports finished — the am boot skews the real end a little either way.
+    # Local signals stay per-tick (no fork): Voice Typer stops at once, and a VolumeDown
+    # pause (KEYPAUSE_STATE) freezes the clock instantly — the expected end moves by however
+    # long the pause lasted. An `info` "Paused" (no marker) freezes it the same way.
+    # Overrun guard as before: still "Playing" PLAY_OVERRUN_S past the (pause-adjusted) end.
+    dur = _wav_duration_s(audio)
+    t0 = time.monotonic()
+    end = t0 + dur
+    hard_cap = t0 + 1800.0
+    next_probe = t0 + max(PLAY_TICK_S, min(PLAY_CONFIRM_S, dur))
+    mid_gap = PLAY_CONFIRM_S
+    tail_gap = PLAY_TAIL_PROBE_S
+    probes = 0
+    held_since = None      # KEYPAUSE_STATE pause start
+    paused_since = None    # player-reported ("Paused") pause start
     while time.monotonic() < hard_cap:
         try:
             PLAYING_MARKER.touch()  # heartbeat — a SIGKILL'd play stops touching → marker goes stale in ~6s
@@ -383,34 +465,45 @@ def _play_via_termux_blocking(audio: Path) -> None:
             except (OSError, subprocess.SubprocessError):
                 pass
             break
-        # FD2: fast local pause signal (the watcher's VolumeDown marker) — freeze the
-        # play-budget WITHOUT a ~3s `termux-media-player info` round-trip, so a pause is
-        # honored instantly and we stop hammering `info` while the user is paused.
-        if KEYPAUSE_STATE.exists():
-            last = time.monotonic()
-            time.sleep(0.3)
-            continue
-        try:
-            r = subprocess.run(
-                ["termux-media-player", "info"],
-                capture_output=True, text=True, timeout=5,
-            )
-        except (OSError, subprocess.SubprocessError):
-            break
-        out = r.stdout or ""
         now = time.monotonic()
-        if "Paused" in out:
-            last = now          # freeze the budget while paused (VolumeDown)
-            time.sleep(0.3)
+        # FD2: fast local pause signal (the watcher's VolumeDown marker) — freeze the clock
+        # WITHOUT any `info` round-trip, so a pause is honored instantly.
+        if KEYPAUSE_STATE.exists():
+            if held_since is None:
+                held_since = now
+            time.sleep(PLAY_TICK_S)
             continue
-        if "Playing" not in out:
-            break               # finished or stopped
-        play_budget -= now - last
-        last = now
-        if play_budget <= 0:
-            break
-        time.sleep(0.3)
-    _log("AUDIO-END")  # playback finished/stopped — diff vs AUDIO-START = play duration
+        if held_since is not None:
+            end += now - held_since
+            next_probe += now - held_since
+            held_since = None
+        if now >= next_probe:
+            probes += 1
+            state = _player_state()
+            now = time.monotonic()
+            if state is None or state == "stopped":
+                break               # finished or stopped (or the probe broke — as before)
+            if state == "paused":
+                if paused_since is None:
+                    paused_since = now
+                tail_gap = PLAY_TAIL_PROBE_S
+                mid_gap = min(mid_gap * 2, PLAY_TAIL_MAX_S)
+                next_probe = now + mid_gap
+                continue
+            if paused_since is not None:
+                end += now - paused_since
+                paused_since = None
+            if now < end:
+                mid_gap = min(mid_gap * 2, PLAY_PROBE_MAX_S)
+                next_probe = min(now + mid_gap, end)
+            elif now - end > PLAY_OVERRUN_S:
+                break
+            else:
+                next_probe = now + tail_gap
+                tail_gap = min(tail_gap * 2, PLAY_TAIL_MAX_S)
+        time.sleep(max(0.0, min(PLAY_TICK_S, next_probe - now)))
+    # playback finished/stopped — diff vs AUDIO-START = play duration; probes = `info` forks spent
+    _log("AUDIO-END", probes=probes, dur_s=round(dur, 2))
     try:
         PLAYING_MARKER.unlink()  # clean finish → clear the playing signal at once (don't wait for staleness)
     except OSError:
@@ -429,38 +522,27 @@ def play_blocking(audio: Path, raw_rate: int | None = None) -> None:
         # raw float32 + no pulse: nothing can play it; caller's wav fallback
         # (synthesize_one_shot -> play_blocking(wav)) covers the native path.
         return
+    if raw_rate:
+        cmd = ["paplay", "--raw", f"--rate={raw_rate}", "--channels=1",
+               "--format=float32le", str(audio)]
+    else:
+        cmd = ["paplay", str(audio)]
     try:
-        if raw_rate:
-            subprocess.run(
-                [
-                    "paplay", "--raw",
-                    f"--rate={raw_rate}",
-                    "--channels=1",
-                    "--format=float32le",
-                    str(audio),
-                ],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                timeout=120,
-            )
-        else:
-            subprocess.run(
-                ["paplay", str(audio)],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                timeout=120,
-            )
-    except (FileNotFoundError, subprocess.TimeoutExpired):
+        proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError:
         return
+    czytaj_pids.register(proc.pid, czytaj_pids.PULSE)   # stop_now kills it without pkill
+    try:
+        proc.wait(timeout=120)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+    finally:
+        czytaj_pids.unregister(proc.pid)
 
 
-def _log(*parts: object) -> None:
-    try:
-        with open(cz.LOG_FILE, "a") as f:
-            ts = time.strftime("%H:%M:%S") + f".{int((time.time() % 1) * 1000):03d}"
-            f.write(f"{ts} pid={os.getpid()} STREAM {' '.join(str(p) for p in parts)}\n")
-    except OSError:
-        pass
+def _log(*parts: object, **fields: object) -> None:
+    czytaj_log.log("STREAM", *parts, **fields)
 
 
 # ── F3/F6/F7: cross-window channel reservation (native single-player only) ──
@@ -471,14 +553,26 @@ def _log(*parts: object) -> None:
 # resolves to "play", so the worst case is the old behaviour, never silence.
 CHANNEL_FILE = cz.CHANNEL_FILE
 CHANNEL_STALE_S = 30.0  # a claim older than this is ignored (crashed/killed owner)
+CHANNEL_WAIT_MAX_S = 45.0   # hard cap so one window can't wedge another forever
+# Waiting windows queue as FIFOs in CHANNEL_QUEUE_DIR, named "<time_ns>-<pid>.fifo" so a
+# sorted listing is arrival order. A waiter sleeps in select() on its own FIFO (opened
+# O_RDWR: it is its own writer, so no EOF storm) until either the current claim's end_ts /
+# stale point passes or someone writes a wake-up byte: the owner when it exits
+# (_release_channel), and each waiter as it leaves the queue (so the next re-checks at once).
+# Only the queue HEAD may claim a free channel — windows play in arrival order. Was: every
+# waiter re-read CHANNEL_FILE in 0.3s sleeps and the owner never released, so the next
+# window started only at the owner's ESTIMATED end (+1s slack) plus up to 0.3s of poll lag.
+CHANNEL_QUEUE_DIR = cz.CHANNEL_QUEUE_DIR
+_channel_claimed = False
 
 
 def _read_channel():
-    """(end_ts, owner, priority, claim_ts) or None. None on any error (fail-open)."""
+    """(end_ts, owner, priority, claim_ts, pid) or None. None on any error (fail-open).
+    pid is 0 for a claim written before the pid field existed."""
     try:
         with open(CHANNEL_FILE) as f:
             p = f.read().split()
-        return float(p[0]), p[1], p[2], float(p[3])
+        return float(p[0]), p[1], p[2], float(p[3]), int(p[4]) if len(p) > 4 else 0
     except (OSError, ValueError, IndexError):
         return None
 
@@ -487,7 +581,7 @@ def _write_channel(end_ts: float, owner: str, priority: str) -> None:
     tmp = CHANNEL_FILE + ".tmp"
     try:
         with open(tmp, "w") as f:
-            f.write(f"{end_ts} {owner or 'pane'} {priority} {time.time()}")
+            f.write(f"{end_ts} {owner or 'pane'} {priority} {time.time()} {os.getpid()}")
         os.replace(tmp, CHANNEL_FILE)
     except OSError:
         try:
@@ -496,30 +590,148 @@ def _write_channel(end_ts: float, owner: str, priority: str) -> None:
             pass
 
 
+def _queue_join() -> "tuple[str, int] | None":
+    """Enter the channel queue: (fifo path, read fd), or None (the caller falls back to a
+    plain timed wait)."""
+    path = os.path.join(CHANNEL_QUEUE_DIR, f"{time.time_ns():020d}-{os.getpid()}.fifo")
+    try:
+        os.makedirs(CHANNEL_QUEUE_DIR, exist_ok=True)
+        os.mkfifo(path, 0o600)
+    except OSError:
+        return None
+    try:
+        return path, os.open(path, os.O_RDWR | os.O_NONBLOCK)
+    except OSError:
+        _unlink_quiet(path)
+        return None
+
+
+def _unlink_quiet(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _queue_members() -> list[str]:
+    """Live waiters' FIFOs in arrival order; a dead waiter's (SIGKILL skips its cleanup)
+    is removed on sight."""
+    try:
+        names = sorted(n for n in os.listdir(CHANNEL_QUEUE_DIR) if n.endswith(".fifo"))
+    except OSError:
+        return []
+    live = []
+    for name in names:
+        path = os.path.join(CHANNEL_QUEUE_DIR, name)
+        try:
+            os.kill(int(name[:-5].rsplit("-", 1)[1]), 0)
+        except (ValueError, IndexError, ProcessLookupError):
+            _unlink_quiet(path)
+            continue
+        except OSError:
+            pass   # EPERM: alive, just not ours to signal
+        live.append(path)
+    return live
+
+
+def _fifo_writer(path: str) -> "int | None":
+    """A non-blocking write fd on a waiter's FIFO, or None — ENXIO: nobody holds it open,
+    so its waiter is dead (even when its pid was reused and fooled _queue_members); such
+    a FIFO is unlinked."""
+    try:
+        return os.open(path, os.O_WRONLY | os.O_NONBLOCK)
+    except OSError:
+        _unlink_quiet(path)
+        return None
+
+
+def _queue_wake_head() -> None:
+    """Wake the longest waiter so it re-checks the channel now."""
+    for path in _queue_members():
+        fd = _fifo_writer(path)
+        if fd is None:
+            continue
+        try:
+            os.write(fd, b"\n")
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+        return
+
+
+def _release_channel() -> None:
+    """At exit: free the channel if our claim still holds it, and wake the next window."""
+    ch = _read_channel()
+    if ch is not None and ch[4] == os.getpid() and time.time() < ch[0]:
+        _unlink_quiet(CHANNEL_FILE)
+    _queue_wake_head()
+
+
 def _reserve_channel(wav: Path) -> None:
     """Cross-window QUEUE on the shared single Android player: if ANOTHER window
     currently owns the channel, WAIT until its utterance ends, then claim+play — so
     two windows with czytaj on read one-after-another and never cut each other.
     The SAME window never waits (a newer utterance just replaces its own previous
     via termux-media-player's single-player play = latest-wins within a window).
-    FAIL-OPEN: unreadable channel / 45s cap → play anyway (never block into silence)."""
+    Waiters queue in arrival order and are woken the moment the owner exits (see
+    CHANNEL_QUEUE_DIR above). FAIL-OPEN: unreadable channel / no FIFO support (timed
+    waits instead) / CHANNEL_WAIT_MAX_S cap → play anyway (never block into silence)."""
+    global _channel_claimed
     owner = os.environ.get("CZYTAJ_TID", "") or "pane"
     try:
         dur = _wav_duration_s(wav)
     except Exception:
         dur = 0.0
     dur = dur if dur > 0 else 8.0
-    deadline = time.time() + 45.0   # hard cap so one window can't wedge another forever
-    while time.time() < deadline:
-        ch = _read_channel()
-        if ch is None:
-            break                                    # free
-        c_end, c_owner, _c_prio, c_claim = ch
-        now = time.time()
-        if c_owner == owner or now >= c_end or (now - c_claim) > CHANNEL_STALE_S:
-            break                                    # mine (replace) / expired / stale
-        time.sleep(0.3)                              # ANOTHER window busy → queue (wait)
-    _write_channel(time.time() + dur + 1.0, owner, "active")
+    deadline = time.time() + CHANNEL_WAIT_MAX_S
+    waiter = None
+    try:
+        while True:
+            now = time.time()
+            if now >= deadline:
+                break
+            ch = _read_channel()
+            wait = deadline - now
+            if ch is not None:
+                c_end, c_owner, _c_prio, c_claim, _c_pid = ch
+                if c_owner != owner and now < c_end and (now - c_claim) <= CHANNEL_STALE_S:
+                    wait = min(wait, c_end - now, c_claim + CHANNEL_STALE_S - now)
+                    ch = None if wait <= 0 else ch   # busy → queue (wait)
+                else:
+                    ch = None                        # mine (replace) / expired / stale
+            if ch is None:
+                if waiter is None:
+                    break                            # free, nobody waiting ahead of us
+                head = _queue_members()
+                if not head or head[0] == waiter[0]:
+                    break                            # free and our turn
+                fd = _fifo_writer(head[0])
+                if fd is None:
+                    continue                         # a dead waiter's FIFO (gone now) — re-check
+                os.close(fd)
+                wait = min(wait, 1.0)                # an earlier waiter is claiming — it wakes us
+            elif waiter is None:
+                waiter = _queue_join()
+                if waiter is not None:
+                    continue                         # re-check: a release may have just happened
+            if waiter is None:
+                time.sleep(min(wait, 0.3))           # no FIFO: the old timed poll
+                continue
+            if select.select([waiter[1]], [], [], max(0.0, wait))[0]:
+                try:
+                    os.read(waiter[1], 512)
+                except OSError:
+                    pass
+    finally:
+        _write_channel(time.time() + dur + 1.0, owner, "active")
+        if waiter is not None:
+            os.close(waiter[1])
+            _unlink_quiet(waiter[0])
+            _queue_wake_head()                       # next in line re-checks (and sees our claim)
+        if not _channel_claimed:
+            _channel_claimed = True
+            atexit.register(_release_channel)
 
 
 def _prune_scratch(max_age_s: float = 120.0) -> None:
@@ -531,8 +743,8 @@ def _prune_scratch(max_age_s: float = 120.0) -> None:
         return
     try:
         now = time.time()
-        for pat in ("tmp*.wav", "*.raw", "*.srv.raw"):   # also reap raw intermediates a
-            for p in d.glob(pat):                        # SIGKILL'd synth left behind
+        for pat in ("tmp*.wav", "*.raw", "*.part"):   # also reap raw/partial-wav intermediates
+            for p in d.glob(pat):                     # a SIGKILL'd synth left behind
                 try:
                     if now - p.stat().st_mtime > max_age_s:
                         p.unlink()
@@ -565,6 +777,167 @@ def _play_cached_wav(path: str) -> int:
     return 0
 
 
+# ── Sentence-level pipeline (native termux-media-player path) ──────────────
+# The native path used to synth the WHOLE message (up to 2000 chars ≈ 27s on the warm
+# daemon) before the first sample played. Now a producer thread synthesizes chunk N+1
+# while chunk N plays (synth keeps well ahead of playback — see
+# thoughts/shared/petla/stream-feasibility-test.py), so time-to-first-audio is ~one
+# sentence. The FIRST chunk is a single sentence (fast start); later ones are grouped up
+# to STREAM_CHUNK_CHARS, because every chunk is a separate `termux-media-player play`
+# with an audible seam — fewer, longer chunks after the first keep the seams rare.
+# CZYTAJ_STREAM_CHUNKS=0 restores whole-message synth (one chunk).
+STREAM_CHUNKS = os.environ.get("CZYTAJ_STREAM_CHUNKS", "1") != "0"
+STREAM_FIRST_MIN_CHARS = 40    # merge tiny leading sentences ("Utility. Tak.") into chunk 1
+STREAM_CHUNK_CHARS = 300
+
+
+def _split_chunks(text: str) -> list[str]:
+    """Split into playback chunks: first ≈ one sentence, the rest ≤ STREAM_CHUNK_CHARS
+    (a single over-long sentence stays whole — never cut mid-sentence)."""
+    if not STREAM_CHUNKS:
+        return [text]
+    sentences = czytaj_text.split_sentences(text)
+    if len(sentences) <= 1:
+        return [text]
+    chunks: list[str] = []
+    cur = ""
+    for sent in sentences:
+        if not chunks:
+            cur = f"{cur} {sent}" if cur else sent
+            if len(cur) >= STREAM_FIRST_MIN_CHARS:   # first chunk closes at the first
+                chunks.append(cur)                    # sentence end past the minimum
+                cur = ""
+        elif cur and len(cur) + 1 + len(sent) > STREAM_CHUNK_CHARS:
+            chunks.append(cur)
+            cur = sent
+        else:
+            cur = f"{cur} {sent}" if cur else sent
+    if cur:
+        chunks.append(cur)
+    return chunks
+
+
+def _save_readback(frames: list[bytes], params, save: str) -> None:
+    """Write the concatenated chunks to CZYTAJ_SAVE_WAV (read-back cache populate). Atomic
+    via a per-pid tmp + rename so a supersede-kill never leaves a torn cache entry."""
+    tmp = f"{save}.{os.getpid()}.tmp"
+    try:
+        with wave.open(tmp, "wb") as w:
+            w.setnchannels(params.nchannels)
+            w.setsampwidth(params.sampwidth)
+            w.setframerate(params.framerate)
+            for fr in frames:
+                w.writeframes(fr)
+        os.replace(tmp, save)
+        _log("CACHED-READBACK", os.path.basename(save))
+    except (OSError, wave.Error) as e:
+        _log("CACHE-SAVE-FAIL", repr(e), level="warn")
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def _stream_native(text: str, scratch: Path) -> int:
+    """Producer/consumer: synth chunks into Android-readable scratch wavs on a thread,
+    play them in order here. Keeps the single-wav path's semantics per chunk — the
+    cross-window channel queue, the routing wake tone (once), the pause-aware play poll,
+    the Voice Typer interrupt — and between chunks waits out a VolumeDown pause and
+    stops for good if Voice Typer started recording."""
+    chunks = _split_chunks(text)
+    ready: "queue.Queue[Path | None]" = queue.Queue()
+    made: list[Path] = []
+    t0 = time.monotonic()
+    save = os.environ.get("CZYTAJ_SAVE_WAV", "")
+    abort = threading.Event()
+
+    def produce() -> None:
+        frames: list[bytes] = []
+        params = None
+        try:
+            for i, chunk in enumerate(chunks):
+                if abort.is_set():
+                    return
+                fd, name = tempfile.mkstemp(suffix=".wav", dir=str(scratch))
+                os.close(fd)
+                wav = Path(name)
+                ok = False
+                try:
+                    ok = synthesize_warm(chunk, wav)   # warm daemon; cold fallback inside
+                finally:
+                    # Only a wav handed to `made` is the player's to delete: one whose synth
+                    # failed, or outlived the player's join (abort) — its cleanup has already
+                    # run — is deleted here.
+                    if not ok or abort.is_set():
+                        _unlink_quiet(str(wav))
+                if not ok:
+                    _log("SYNTH-FAIL chunk=", f"{i + 1}/{len(chunks)}", level="warn")
+                    return
+                if abort.is_set():
+                    return
+                made.append(wav)
+                _log("SYNTH-DONE", chunk=f"{i + 1}/{len(chunks)}", t_s=round(time.monotonic() - t0, 3))
+                if save:
+                    try:
+                        with wave.open(str(wav), "rb") as wf:
+                            params = params or wf.getparams()
+                            frames.append(wf.readframes(wf.getnframes()))
+                    except (OSError, wave.Error):
+                        frames = []
+                        params = None
+                ready.put(wav)
+            # Auto-read populates the read-back cache with the WHOLE message so a later
+            # VolumeUp on it is an instant cache HIT (key precomputed by _speak).
+            if save and params is not None and len(frames) == len(chunks):
+                _save_readback(frames, params, save)
+        finally:
+            ready.put(None)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    played = 0
+    try:
+        while True:
+            try:
+                wav = ready.get(timeout=120)
+            except queue.Empty:
+                _log("STREAM-STALL")
+                break
+            if wav is None:
+                break
+            if played:
+                # Between chunks: honor a VolumeDown pause (don't start the next chunk
+                # over it) and a Voice Typer stop (the play poll already cut the audio).
+                hard_cap = time.monotonic() + 1800.0
+                while KEYPAUSE_STATE.exists() and time.monotonic() < hard_cap:
+                    time.sleep(0.3)
+                if _vt_recording():
+                    _log("STREAM-ABORT voice-typer")
+                    break
+            # Cross-window QUEUE: the first chunk waits until no OTHER window owns the
+            # shared player; later chunks only refresh our own claim (same owner → no wait).
+            _reserve_channel(wav)
+            if not played:
+                _log("CHANNEL-OK", t_s=round(time.monotonic() - t0, 3))   # + any channel-queue wait
+                unlock_audio_routing()
+                _log("UNLOCK-DONE", t_s=round(time.monotonic() - t0, 3))   # BT/Auto routing-wake tone cost
+            play_blocking(wav)  # blocks until this chunk is done, then we delete it
+            played += 1
+            try:
+                wav.unlink()
+            except OSError:
+                pass
+        return 0 if played else 1
+    finally:
+        abort.set()
+        producer.join(timeout=1)
+        for wav in made:
+            try:
+                wav.unlink()
+            except OSError:
+                pass
+
+
 def main() -> int:
     # Read-back CACHE HIT: a pre-synthesised wav path is handed in via env — skip synth
     # entirely and just play it (instant). stdin is /dev/null in this mode.
@@ -613,6 +986,7 @@ def main() -> int:
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL,
                 )
+                czytaj_pids.register(paplay.pid, czytaj_pids.PULSE)
                 stop_event = threading.Event()
                 watcher = threading.Thread(
                     target=watch_and_kill, args=(paplay, fifo, stop_event), daemon=True
@@ -620,7 +994,7 @@ def main() -> int:
                 watcher.start()
                 got_rate = None
                 try:
-                    got_rate = server_speak_raw(text, fifo)
+                    got_rate = server_speak_raw(text, fifo, priority=SYNTH_PRIORITY)
                 finally:
                     if not got_rate:
                         try:
@@ -641,12 +1015,13 @@ def main() -> int:
                             pass
                     stop_event.set()
                     watcher.join(timeout=1)
+                    czytaj_pids.unregister(paplay.pid)
                 if got_rate:
                     return 0
 
         if pulse and server_speak_raw is not None and ensure_running is not None:
             out = Path(td) / "out.raw"
-            rate = server_speak_raw(text, out)
+            rate = server_speak_raw(text, out, priority=SYNTH_PRIORITY)
             if rate:
                 unlock_audio_routing()
                 play_blocking(out, raw_rate=rate)
@@ -670,55 +1045,14 @@ def main() -> int:
             _log("EXIT no-android-readable-scratch")  # F11: don't stage a PRoot path
             return 3
         _prune_scratch()  # F34: clear tmp*.wav leaked by a SIGKILL'd prior run
-        fd, name = tempfile.mkstemp(suffix=".wav", dir=str(scratch))
-        os.close(fd)
-        wav = Path(name)
-        _t0 = time.monotonic()
-        try:
-            if synthesize_warm(text, wav):   # warm daemon (~0.7s) → wav; cold fallback inside
-                _log(f"SYNTH-DONE +{time.monotonic() - _t0:.2f}s")   # how long synth took
-                # Auto-read populates the read-back cache here: COPY the just-synthesized
-                # wav to the path _speak precomputed (sha1 of the raw last turn) so a later
-                # VolumeUp on this message is an INSTANT cache HIT instead of a re-synth.
-                # Copy, not move — we still play `wav` below. Best-effort; never blocks audio.
-                _save = os.environ.get("CZYTAJ_SAVE_WAV", "")
-                if _save:
-                    # FD5: hardlink (instant, same FS — no read-into-RAM) so the populate
-                    # completes before a supersede-kill can interrupt it; the link keeps the
-                    # cached wav alive after the source `wav` is unlinked below (same inode).
-                    # Copy only as a cross-FS fallback. Atomic rename via a per-pid tmp.
-                    _tmp = f"{_save}.{os.getpid()}.tmp"
-                    try:
-                        try:
-                            os.unlink(_tmp)
-                        except OSError:
-                            pass
-                        try:
-                            os.link(str(wav), _tmp)
-                        except OSError:
-                            import shutil
-                            shutil.copyfile(str(wav), _tmp)
-                        os.replace(_tmp, _save)
-                        _log("CACHED-READBACK", os.path.basename(_save))
-                    except OSError as e:
-                        _log("CACHE-SAVE-FAIL", repr(e))
-                # Cross-window QUEUE: wait here until no OTHER window owns the shared
-                # player, then claim it. Same window / free channel → no wait.
-                _reserve_channel(wav)
-                _log(f"CHANNEL-OK +{time.monotonic() - _t0:.2f}s")   # + any channel-queue wait
-                unlock_audio_routing()
-                _log(f"UNLOCK-DONE +{time.monotonic() - _t0:.2f}s")   # BT/Auto routing-wake tone cost
-                play_blocking(wav)  # blocks until done, then we delete
-                return 0
-            return 1
-        finally:
-            try:
-                wav.unlink()
-            except OSError:
-                pass
+        return _stream_native(text, scratch)
 
 
 if __name__ == "__main__":
+    # Audio-process registry entry (czytaj_pids) so _speak._kill_audio_chain can stop this
+    # run — and, as a group leader, its players — without a pkill scan.
+    czytaj_pids.register_self()
+    atexit.register(czytaj_pids.unregister, os.getpid())
     if len(sys.argv) > 1 and sys.argv[1] == "warmup":
         # FD1: prime the session at /czytaj ON so the FIRST read-back isn't a cold JIT
         # inference + a routing-wake tone. (1) Synthesize a throwaway through the warm
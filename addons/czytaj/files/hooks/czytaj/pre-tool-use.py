@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
-"""Voice reader PreToolUse hook: speak any text added since the last hook run."""
+"""Voice reader PreToolUse hook: speak any text added since the last hook run, and
+queue the turn's finished text bubbles for read-back precache while the model works."""
 import json
 import os
 import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from _speak import is_active, is_recording, is_in_call, speak_new_text  # noqa: E402
+from _speak import (  # noqa: E402
+    is_active, is_recording, is_in_call, speak_new_text, precache_in_progress,
+)
 
 
 def main() -> int:
@@ -13,6 +16,14 @@ def main() -> int:
         data = json.load(sys.stdin)
     except Exception:
         return 0
+    return handle(data)
+
+
+def handle(data: dict) -> int:
+    """Hook body — also run in-process by the warm piper_server (hook_client.py)."""
+    # Like stop.py's precache: independent of THIS project's reading mode (read-back is
+    # always on demand) — though pre-tool-use.sh only gets here while some project reads.
+    precache_in_progress(data.get("transcript_path", ""))
     # F2: gate on the per-project flag keyed by the hook's project dir (data['cwd']
     # / CLAUDE_PROJECT_DIR), not os.getcwd() — read data BEFORE the is_active check.
     if not is_active(data.get("cwd", "")) or is_recording() or is_in_call():
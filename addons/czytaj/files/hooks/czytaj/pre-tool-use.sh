@@ -7,9 +7,11 @@ source "$HOME/.claude/hooks/czytaj/czytaj-env.sh" 2>/dev/null || exit 0   # SSOT
 # the precise per-project is_active check.
 # M12 (audit 2026-06-15): count only real *.flag files — the watcher's .keepwarm-readback
 # dotfile made the old `ls -A` always non-empty, so this cheap skip never fired and every
-# PreToolUse on every project shelled into python. (pre-tool-use.py only auto-reads — no
-# precache — so skipping when no project reads is a pure win. stop.sh is intentionally NOT
-# changed: it must reach stop.py for keepwarm precache regardless of mode.)
+# PreToolUse on every project shelled into python. So the predictive read-back precache
+# (precache_in_progress) only runs while some project reads; with reading off, read-back
+# still gets stop.sh's precache at the end of the turn (stop.sh keeps the non-empty test).
 compgen -G "$CZYTAJ_FLAG_DIR"/*.flag >/dev/null 2>&1 || exit 0
 
-exec python3 "$(dirname "$0")/pre-tool-use.py"
+# Thin client: the warm piper_server runs the hook body in-process (no python boot +
+# _speak import per fire); hook_client falls back to running pre-tool-use.py itself.
+exec python3 -S "$(dirname "$0")/hook_client.py" pre-tool-use
@@ -1,29 +1,186 @@
 #!/usr/bin/env python3
 """Background pre-synth of recent transcript turns into the read-back cache.
 
-Spawned detached (start_new_session) by stop.py (the active window's last turns)
-and by a read_message_back cache MISS. The 2nd arg is a MAX depth: we pre-synth
-turns n=1..maxn so the last `maxn` assistant turns stay warm — fixing the bug
-where caching only n=1 left re-reads of older turns as misses. Best-effort: any
-failure is swallowed so it never affects the hook that launched it.
+Requested by stop.py (the active window's last turns) and by a read_message_back cache
+MISS. The depth is a MAX: turns n=1..maxn are pre-synthed so the last `maxn` assistant turns
+stay warm — fixing the bug where caching only n=1 left re-reads of older turns as misses.
+
+ONE coordinated worker (was one independent process per request): every Stop and every
+read-back miss spawned its own precache.py, each re-parsed the transcript once per turn,
+and two of them close together synthesized the same turns twice. Now:
+  - request() drops a job file in PRECACHE_QUEUE_DIR — one file per transcript, so a
+    second request before the worker got to the first just raises its depth (two Stops
+    in quick succession are ONE job) — and spawns this script only if no worker holds
+    PRECACHE_LOCK;
+  - the worker (main) holds PRECACHE_LOCK, takes the queued jobs, parses each transcript
+    ONCE for all its turns, skips turns already cached / already being written / repeated
+    in the same run (same cache key), and abandons a transcript's plan as soon as a newer
+    job for it is queued (that job re-plans the current last turns) — request() also
+    cancels that transcript's synth jobs still queued on the server, so the worker does
+    not first finish the turn it is on;
+  - on an empty queue it releases the lock and looks once more, so a job queued in the
+    gap is never stranded (its requester saw the lock held and didn't spawn).
+One worker is also the right amount of parallelism: the server pool keeps worker 0 off
+precache work, so precache synth only ever has one daemon to run on.
+Best-effort: any failure is swallowed so it never affects the hook that launched it.
 """
+import fcntl
+import hashlib
 import os
+import subprocess
 import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from czytaj_paths import PRECACHE_QUEUE_DIR, PRECACHE_LOCK  # noqa: E402
+
+
+def _job_path(transcript: str) -> str:
+    key = hashlib.sha1(os.path.realpath(transcript).encode("utf-8", "replace")).hexdigest()
+    return os.path.join(PRECACHE_QUEUE_DIR, key[:16] + ".job")
+
+
+def _enqueue(transcript: str, maxn: int) -> bool:
+    """Queue (or deepen) the job for `transcript`: file = "<maxn>\\n<path>", atomic replace.
+    True iff a job for it was already queued (this one only deepened it)."""
+    path = _job_path(transcript)
+    queued = False
+    try:
+        with open(path) as f:
+            queued = True
+            maxn = max(maxn, int(f.readline().strip() or 0))
+    except (OSError, ValueError):
+        pass
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(PRECACHE_QUEUE_DIR, exist_ok=True)
+        with open(tmp, "w") as f:
+            f.write(f"{maxn}\n{transcript}\n")
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+    return queued
+
+
+def _cancel_stale(transcript: str) -> None:
+    """The worker may be mid-way through `transcript`'s previous job: drop its synth jobs
+    still queued on the server, so the worker stops at once (SynthCancelled) instead of at
+    its next superseded() check — which only runs between turns."""
+    try:
+        from _speak import precache_tag
+        from piper_server import cancel_pending
+        n = cancel_pending(precache_tag(os.path.basename(transcript)))
+    except Exception:
+        return
+    if n:
+        from _speak import _log
+        _log("PRECACHE", "cancel-stale", os.path.basename(transcript)[:20], "jobs=", n)
+
+
+def _take_jobs() -> dict[str, int]:
+    """Claim every queued job ({transcript: maxn}). Rename-then-read, so a request landing
+    meanwhile writes a NEW job file instead of being consumed half-read."""
+    jobs: dict[str, int] = {}
+    try:
+        names = [f for f in os.listdir(PRECACHE_QUEUE_DIR) if f.endswith(".job")]
+    except OSError:
+        return jobs
+    for name in names:
+        src = os.path.join(PRECACHE_QUEUE_DIR, name)
+        taken = f"{src}.{os.getpid()}.taken"
+        try:
+            os.rename(src, taken)
+            with open(taken) as f:
+                maxn = int(f.readline().strip() or 1)
+                transcript = f.readline().rstrip("\n")
+        except (OSError, ValueError):
+            continue
+        finally:
+            try:
+                os.unlink(taken)
+            except OSError:
+                pass
+        if transcript:
+            jobs[transcript] = max(maxn, jobs.get(transcript, 0))
+    return jobs
+
+
+def _lock():
+    """Open + non-blocking flock PRECACHE_LOCK; the fd if we got it, else None."""
+    try:
+        os.makedirs(PRECACHE_QUEUE_DIR, exist_ok=True)
+        fd = os.open(PRECACHE_LOCK, os.O_RDWR | os.O_CREAT, 0o600)
+    except OSError:
+        return None
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return fd
+    except OSError:
+        os.close(fd)
+        return None
+
+
+def request(transcript: str, maxn: int) -> None:
+    """Queue a precache of `transcript`'s last `maxn` turns; start the worker unless one is
+    already running (it picks the job up before it exits). Never raises."""
+    if not transcript:
+        return
+    try:
+        queued = _enqueue(transcript, max(1, int(maxn)))
+        fd = _lock()
+        if fd is None:   # a worker is running — it re-checks the queue before releasing
+            if not queued:   # (a job already queued means its request already cancelled)
+                _cancel_stale(transcript)
+            return
+        os.close(fd)  # free → spawn one (if two requesters race here, the loser exits at once)
+        subprocess.Popen(
+            [sys.executable or "python3", os.path.abspath(__file__)],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL, start_new_session=True,
+        )
+    except Exception:
+        pass
+
+
+def _work() -> None:
+    from _speak import precache_turns
+    while True:
+        jobs = _take_jobs()
+        if not jobs:
+            return
+        for transcript, maxn in jobs.items():
+            job = _job_path(transcript)
+            precache_turns(transcript, maxn, superseded=lambda: os.path.exists(job))
+
+
+def _jobs_pending() -> bool:
+    """A job queued after the worker's last look (its requester saw the lock held)?"""
+    try:
+        return any(f.endswith(".job") for f in os.listdir(PRECACHE_QUEUE_DIR))
+    except OSError:
+        return False
 
 
 def main() -> int:
-    if len(sys.argv) < 2:
-        return 0
-    transcript = sys.argv[1]
-    maxn = 1
-    if len(sys.argv) >= 3 and sys.argv[2].lstrip("-").isdigit():
-        maxn = max(1, int(sys.argv[2]))
-    try:
-        from _speak import precache_turn
-        for n in range(1, maxn + 1):
-            precache_turn(transcript, n)
+    # Legacy form `precache.py <transcript> [maxn]` still works: it queues, then works.
+    if len(sys.argv) >= 2:
+        maxn = 1
+        if len(sys.argv) >= 3 and sys.argv[2].lstrip("-").isdigit():
+            maxn = max(1, int(sys.argv[2]))
+        _enqueue(sys.argv[1], maxn)
+    try:
+        while True:
+            fd = _lock()
+            if fd is None:
+                return 0   # another worker owns the queue
+            try:
+                _work()
+            finally:
+                os.close(fd)   # releases the flock
+            if not _jobs_pending():
+                return 0
     except Exception:
         pass
     return 0
@@ -15,13 +15,18 @@ def main() -> int:
         data = json.load(sys.stdin)
     except Exception:
         return 0
+    return handle(data)
+
+
+def handle(data: dict) -> int:
+    """Hook body — also run in-process by the warm piper_server (hook_client.py)."""
     transcript = data.get("transcript_path", "")
     cwd = data.get("cwd", "")
     # On-demand VolumeUp read-back is INDEPENDENT of reading mode (the intended design): keep the
     # last N turns PRE-RENDERED in the read-back cache REGARDLESS of /czytaj on/off, so a press is
     # always an instant cache HIT, never a cold synth. This runs even with auto-read OFF because the
     # watcher's keepwarm sentinel keeps FLAG_DIR non-empty (so stop.sh still reaches us) and keeps the
-    # daemon warm. Fire-and-forget; precache_turn skips already-cached turns, so it only synths the new one.
+    # daemon warm. Fire-and-forget; the precache worker skips already-cached turns, so it only synths the new one.
     _precache_latest(transcript)
     # F2: AUTO-READ (speaking the new text aloud) stays gated on the per-project flag + recording/call.
     # Gate keyed by the hook's project dir (data['cwd'] / CLAUDE_PROJECT_DIR), not os.getcwd().
@@ -31,20 +36,11 @@ def main() -> int:
 
 
 def _precache_latest(transcript_path: str) -> None:
-    if not transcript_path:
-        return
-    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "precache.py")
-    if not os.path.isfile(script):
-        return
     try:
-        import subprocess
-        subprocess.Popen(
-            [sys.executable or "python3", script, transcript_path, str(READBACK_CACHE_MAX)],
-            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL, start_new_session=True,
-        )
-    except Exception:
-        pass
+        import precache
+    except ImportError:
+        return
+    precache.request(transcript_path, READBACK_CACHE_MAX)   # one queued job per transcript
 
 
 if __name__ == "__main__":
@@ -7,4 +7,6 @@ source "$HOME/.claude/hooks/czytaj/czytaj-env.sh" 2>/dev/null || exit 0   # SSOT
 # per-project check is in stop.py (is_active keyed by the hook's project dir).
 [ -n "$(ls -A "$CZYTAJ_FLAG_DIR" 2>/dev/null)" ] || exit 0
 
-exec python3 "$(dirname "$0")/stop.py"
+# Thin client: the warm piper_server runs the hook body in-process (no python boot +
+# _speak import per fire); hook_client falls back to running stop.py itself.
+exec python3 -S "$(dirname "$0")/hook_client.py" stop
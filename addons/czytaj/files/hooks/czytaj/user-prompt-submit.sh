@@ -4,8 +4,7 @@
 # + claim "active session" so Stop hooks of OTHER Claude panes stay silent.
 
 source "$HOME/.claude/hooks/czytaj/czytaj-env.sh" 2>/dev/null   # SSOT (audit 2026-06-15)
-LOG="$CZYTAJ_LOG"
-echo "$(date +%H:%M:%S) pid=$$ UPS-FIRED" >> "$LOG" 2>/dev/null
+czytaj_log UPS FIRED
 
 # GLOBAL-KEYS: ensure the volume-key watcher is running REGARDLESS of czytaj on/off
 # — the keys are an always-on remote (read-back / pause), so they must survive even
@@ -26,9 +25,15 @@ HOOK_INPUT=$(cat)
 
 # F1/F18: per-project gate — ONE key derivation (czytaj_project_key in czytaj-env.sh).
 _CZYTAJ_DIR="${CLAUDE_PROJECT_DIR:-$PWD}"
+
+# Session index (project dir → its transcripts) for VolumeUp read-back, which works with
+# reading on or off — so ABOVE the gate. Backgrounded: never delays the prompt.
+printf '%s' "$HOOK_INPUT" | setsid python3 "$HOME/.claude/hooks/czytaj/czytaj_sessions.py" \
+  record "$_CZYTAJ_DIR" >/dev/null 2>&1 &
+
 _CZYTAJ_KEY=$(czytaj_project_key "$_CZYTAJ_DIR")
 if [ ! -f "$CZYTAJ_FLAG_DIR/$_CZYTAJ_KEY.flag" ]; then
-  echo "$(date +%H:%M:%S) pid=$$ UPS-EXIT mode-off" >> "$LOG" 2>/dev/null
+  czytaj_log UPS "EXIT mode-off"
   exit 0
 fi
 
@@ -40,7 +45,9 @@ rm -f "$CZYTAJ_KEYPAUSE_STATE" >/dev/null 2>&1
 # helpers so single source of truth, no duplicated atomic-write code.
 HOOK_TMP=$(mktemp "${TMPDIR:-/data/data/com.termux/files/usr/tmp}/czytaj-ups.XXXXXX")
 printf '%s' "$HOOK_INPUT" > "$HOOK_TMP"
-python3 <<PY 2>>"$LOG"
+# stderr (a traceback) is captured and logged as ONE record — appending it raw to czytaj.log
+# bypassed czytaj_log's rotation and broke the one-JSON-record-per-line format.
+_UPS_ERR=$(python3 2>&1 >/dev/null <<PY
 import json, os, sys
 sys.path.insert(0, os.path.expanduser("~/.claude/hooks/czytaj"))
 from _speak import mark_active_session, reset_state_atomic, _log
@@ -54,6 +61,8 @@ mark_active_session(data.get("transcript_path", ""))
 reset_state_atomic()
 _log("UPS", "marked-active", os.path.basename(data.get("transcript_path","") or "<none>"))
 PY
+)
+[ -n "$_UPS_ERR" ] && czytaj_log UPS "python-stderr $_UPS_ERR" warn
 rm -f "$HOOK_TMP"
 
 # Kill ONLY in-progress audio clients. Leave both piper_server AND its
@@ -71,7 +80,7 @@ done
 # round-trip landed (final-sweep 2026-06-16). Nothing runs after it here, so it survives; new-turn
 # audio only starts seconds later at the Stop hook anyway.
 termux-media-player stop >/dev/null 2>&1 &
-echo "$(date +%H:%M:%S) pid=$$ UPS-KILLED-CLIENTS+STOP" >> "$LOG" 2>/dev/null
+czytaj_log UPS "KILLED-CLIENTS+STOP"
 true
 
 cat <<'JSON'
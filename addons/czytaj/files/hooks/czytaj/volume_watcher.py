@@ -33,7 +33,11 @@ import threading
 import time
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from _speak import _log, read_message_back, is_readback_playing, _run_shell  # noqa: E402
+from _speak import (  # noqa: E402
+    _log, read_message_back, is_readback_playing, _run_shell, sample_device_state,
+    device_state_wanted_age,
+)
+import czytaj_shell  # noqa: E402
 from czytaj_paths import (  # noqa: E402  — SSOT for paths (audit 2026-06-15)
     FLAG_DIR, SHIZUKU_FLAG, KEYPAUSE_STATE, PLAYING_MARKER, PREHEAT_MARKER,
     TERMUX_FLAGS_DIR, WATCHER_LOCK as LOCK_FILE,
@@ -89,7 +93,7 @@ def _keep_daemon_warm(force: bool = False) -> None:
         )
         _track_child(proc)   # M1: reap in the idle loop (this 'start' child exits fast)
     except (OSError, ValueError) as e:
-        _log("VOLKEY", "keepwarm-fail", repr(e))
+        _log("VOLKEY", "keepwarm-fail", repr(e), level="warn")
 
 # INSTANT path: the Voice Typer accessibility service writes this flag the moment a
 # volume key is pressed (see thoughts/shared/petla/czytaj-volume-keys-CONTRACT.md),
@@ -101,7 +105,26 @@ KEYTRIGGER_FLAG = os.environ.get(
     "CZYTAJ_KEYTRIGGER_FLAG",
     os.path.join(TERMUX_FLAGS_DIR, "czytaj-keytrigger.flag"),
 )
-KEYTRIGGER_POLL_S = 0.08      # how often to poll the trigger flag (~instant, negligible cost)
+# The flag is WATCHED, not polled: an inotify instance on its directory (ctypes → libc, no
+# new dependency) wakes the poller only on IN_CLOSE_WRITE / IN_MOVED_TO of the flag or its
+# .tmp. The old 80 ms poll woke ~1M times a day to open + parse two files that changed a few
+# times a day. /storage/emulated is FUSE, though, and FUSE may not report a write made by
+# another app — so inotify must PROVE itself: until the first press arrives as an event the
+# poller also polls adaptively, and a press that polling finds with no event behind it drops
+# inotify for good (logged). Adaptive = fast (80 ms) for KEYTRIGGER_HOT_S after a press (scrub
+# bursts) and for the first KEYTRIGGER_PROVE_S after start while inotify is still unproven
+# (so the first press isn't a slow-poll tick late while the watch may yet be working), slow
+# idle otherwise — which is also the steady state on FUSE storage that never reports events.
+# A proven watch only re-reads every KEYTRIGGER_SAFETY_S (a lost event costs at most that);
+# IN_IGNORED (the directory was removed / remounted, the kernel dropped the watch) re-adds it.
+KEYTRIGGER_POLL_S = 0.08      # fast poll: after a press / while inotify is being proven
+try:                          # slow poll: idle, inotify unproven past PROVE_S or unavailable
+    KEYTRIGGER_IDLE_POLL_S = float(os.environ.get("CZYTAJ_KEYTRIGGER_IDLE_POLL_S", "1.0"))
+except ValueError:
+    KEYTRIGGER_IDLE_POLL_S = 1.0
+KEYTRIGGER_HOT_S = 30.0       # how long after a press the fast poll holds
+KEYTRIGGER_PROVE_S = 600.0    # fast poll after start while an inotify watch is unproven
+KEYTRIGGER_SAFETY_S = 60.0    # inotify proven: re-read this often anyway (catches a lost event)
 FLAG_ECHO_WINDOW_S = 20.0     # (evdev fallback only) suppression window for the echo of an
                              # accessibility press — unreliable here, hence evdev is off by default.
 # The evdev/Shizuku reader was the original key path, but delivery is slow (~3-11s) and
@@ -172,10 +195,12 @@ READBACK_WINDOW_S = 5.0   # rapid-tap window for scrubbing further back. Short n
 
 
 def _reading_on() -> bool:
-    """True iff at least one project currently has reading mode ON."""
+    """True iff at least one project currently has reading mode ON. Counts real *.flag files
+    only — our own .keepwarm-readback sentinel lives in FLAG_DIR too and would otherwise keep
+    this True (wakelock + device sampler) for the watcher's whole life (same trap as M11/M12)."""
     try:
         with os.scandir(FLAG_DIR) as it:
-            return any(True for _ in it)
+            return any(e.name.endswith(".flag") for e in it)
     except OSError:
         return False
 
@@ -236,6 +261,38 @@ def _prewarm_fg() -> None:
         pass
 
 
+# Device-state sampler: while reading is on, re-run the hooks' guard probes every
+# DEVICE_SAMPLE_S and publish one snapshot (_speak.sample_device_state → DEVICE_STATE), so
+# the Stop/PreToolUse guard is a file read instead of a ~1.2s probe round on the hot path.
+# Kept under _speak.DEVICE_STATE_MAX_AGE_S (5s) so a live watcher's snapshot never lapses.
+# The probes fork (termux-volume) and cross the rish relay, so the fixed 2s cadence only runs
+# while the snapshot is actually wanted: a hook read it (device_state_wanted_age) within
+# DEVICE_DEMAND_S. Unread → no sampling at all (a hook then probes inline as before, and its
+# read renews the demand, so sampling resumes within one tick). Screen locked at the last
+# sample → re-sample only every DEVICE_SAMPLE_IDLE_S, just to notice the unlock.
+DEVICE_SAMPLE_S = 2.0
+DEVICE_SAMPLE_IDLE_S = 30.0   # cadence while the screen is locked
+DEVICE_DEMAND_S = 300.0       # a snapshot read this recently keeps the fast cadence
+
+
+def _sample_device_state() -> None:
+    locked = False
+    last = 0.0
+    while True:
+        time.sleep(DEVICE_SAMPLE_S)
+        if not _reading_on():
+            continue
+        now = time.monotonic()
+        wanted = device_state_wanted_age() < DEVICE_DEMAND_S
+        if not wanted or (locked and now - last < DEVICE_SAMPLE_IDLE_S):
+            continue
+        last = now
+        try:
+            locked = bool(sample_device_state().get("screen_locked"))
+        except Exception as e:   # a probe blowing up must not kill the sampler thread
+            _log("VOLKEY", "device-sample-fail", repr(e), level="warn")
+
+
 def _single_instance() -> "int | None":
     """Hold an exclusive lock so only one watcher runs. Returns the held fd (keep
     it open for the process lifetime) or None if another instance owns it."""
@@ -264,11 +321,8 @@ def _discover_volume_device() -> str:
     script = ("getevent -lp 2>/dev/null | "
               "awk '/^add device/{d=$4} /KEY_VOLUMEUP/{print d; exit}'")
     for _ in range(3):
-        try:
-            out = subprocess.run(["rish", "-c", script],
-                                 capture_output=True, text=True, timeout=15).stdout.strip()
-        except (subprocess.SubprocessError, FileNotFoundError, OSError):
-            out = ""
+        _ok, out = _run_shell(script, timeout_s=15.0)   # resident session (czytaj_shell)
+        out = out.strip()
         if out:
             return out.splitlines()[0].strip()
         time.sleep(0.5)
@@ -316,11 +370,17 @@ def _wake_unlock() -> None:
         pass
 
 
-def _toggle_pause() -> None:
+def _toggle_pause(count: int = 1) -> None:
     """VolumeDown: pause the current TTS at its position, or resume if paused —
     media-player style. Uses a local state flag (no slow status query) for snappy
-    response, sending termux-media-player pause/play accordingly."""
+    response, sending termux-media-player pause/play accordingly. `count` coalesced
+    presses toggle by parity: an even burst (pause+resume) only ends the scrub sequence."""
     global _paused, _readback_n
+    if count % 2 == 0:
+        with _action_lock:
+            _readback_n = 0
+        _log("VOLKEY", "pause+resume coalesced", count)
+        return
     # M2: mutate the shared state atomically; run the slow _media() subprocess OUTSIDE the lock.
     with _action_lock:
         _readback_n = 0  # VolumeDown breaks any VolumeUp read-back scrubbing sequence
@@ -348,11 +408,13 @@ def _toggle_pause() -> None:
     _log("VOLKEY", "resume" if action == "play" else "pause")
 
 
-def _read_back() -> None:
+def _read_back(count: int = 1, superseded=None) -> None:
     """VolumeUp: read the LAST message. Step one further back (scrub) only when the user
     is clearly continuing — either a read-back is still PLAYING (pressed while listening)
     OR this press follows the last within READBACK_WINDOW_S (rapid taps). Otherwise reset
-    to the last message. is_readback_playing() polls our own child (no slow media query)."""
+    to the last message. is_readback_playing() polls our own child (no slow media query).
+    `count` coalesced presses step back `count` at once; the counter moves even when
+    `superseded()` then says a newer VolumeUp is queued — that one plays the combined n."""
     global _paused, _readback_n, _last_read_ts
     now = time.monotonic()
     # M2: compute scrub + mutate the shared state atomically; capture n for the slow read.
@@ -363,14 +425,18 @@ def _read_back() -> None:
         except OSError:
             pass
         scrub = is_readback_playing() or (now - _last_read_ts) < READBACK_WINDOW_S
-        _readback_n = _readback_n + 1 if scrub else 1
+        _readback_n = (_readback_n if scrub else 0) + count
         _last_read_ts = now
         n = _readback_n
-    _log("VOLKEY", "VolumeUp -> read-back", n, "scrub" if scrub else "fresh")
+    _log("VOLKEY", "VolumeUp -> read-back", n, "scrub" if scrub else "fresh",
+         *([f"x{count}"] if count > 1 else []))
+    if superseded is not None and superseded():
+        _log("VOLKEY", "read-back superseded", n)
+        return
     try:
-        read_message_back(n)   # slow (synth/playback) — runs with the captured n, outside the lock
+        read_message_back(n, superseded=superseded)   # slow (synth/playback) — runs with the captured n, outside the lock
     except Exception as e:  # never let one bad action kill the watcher
-        _log("VOLKEY", "read-back-error", repr(e))
+        _log("VOLKEY", "read-back-error", repr(e), level="warn")
 
 
 # Shared dispatch for BOTH input paths (evdev reader + accessibility trigger flag).
@@ -421,22 +487,72 @@ def _czytaj_audio_playing() -> bool:
         return False
 
 
-def _gated_action(code: int) -> None:
+def _gated_action(code: int, count: int = 1, superseded=None) -> None:
     """Lock-screen GATE + the action. The accessibility service passes the volume key THROUGH
     (volume always changes) and writes the trigger flag even on the keyguard, because it can't
     tell Termux (FLAG_SECURE → package reads as null) from the lock screen. So gate HERE: drive
     czytaj only if (a) czytaj is currently playing — so pause/scrub work on a LOCKED screen — or
     (b) Termux is genuinely the foreground app (dumpsys mCurrentFocus DOES distinguish it from
     the keyguard). Otherwise the press was meant only to change the volume; don't fire a spurious
-    read-back of the last message. Runs in the dispatch thread so a cold _termux_foreground
+    read-back of the last message. Runs in the action worker so a cold _termux_foreground
     (~1.8s) never blocks key detection."""
     if not (_czytaj_audio_playing() or _termux_foreground()):
         _log("VOLKEY", "skip", "locked/other-app + no audio (volume-only)")
         return
     if code == KEY_VOLUMEDOWN:
-        _toggle_pause()
+        _toggle_pause(count)
     else:
-        _read_back()
+        _read_back(count, superseded)
+
+
+# Action queue (was one threading.Thread per press): a VolumeUp scrub burst left several
+# _gated_action threads running the foreground check, read_message_back and
+# _stop_previous_readback at once, racing on _speak._readback_proc — and every press paid
+# its own synth/play. Now key detection only appends to _pending, and ONE worker takes
+# whatever piled up while it was busy: a run of equal keys is one action (three VolumeUps =
+# one n+3 read-back; VolumeDown toggles by parity), and an in-flight read-back abandons
+# itself before it starts playing once another VolumeUp is queued behind it.
+_pending: "list[int]" = []
+_pending_cv = threading.Condition()
+
+
+def _enqueue_action(code: int) -> None:
+    with _pending_cv:
+        _pending.append(code)
+        _pending_cv.notify()
+
+
+def _up_queued() -> bool:
+    with _pending_cv:
+        return KEY_VOLUMEUP in _pending
+
+
+def _coalesce(codes: "list[int]") -> "list[tuple[int, int]]":
+    """Runs of the same key → [(code, count)], order kept (a VolumeDown between two
+    VolumeUps still ends the first scrub sequence)."""
+    runs: "list[list[int]]" = []
+    for code in codes:
+        if runs and runs[-1][0] == code:
+            runs[-1][1] += 1
+        else:
+            runs.append([code, 1])
+    return [(code, count) for code, count in runs]
+
+
+def _action_worker() -> None:
+    """Daemon loop: run queued presses one batch at a time, coalesced (see above)."""
+    while True:
+        with _pending_cv:
+            while not _pending:
+                _pending_cv.wait()
+            batch = _coalesce(_pending)
+            _pending.clear()
+        for i, (code, count) in enumerate(batch):
+            later_up = any(c == KEY_VOLUMEUP for c, _ in batch[i + 1:])
+            try:
+                _gated_action(code, count, superseded=lambda: later_up or _up_queued())
+            except Exception as e:  # never let one bad action kill the worker
+                _log("VOLKEY", "action-error", repr(e), level="warn")
 
 
 def _dispatch_key(code: int, *, trusted_fg: bool) -> None:
@@ -460,12 +576,12 @@ def _dispatch_key(code: int, *, trusted_fg: bool) -> None:
         if now - _last_fire.get(code, 0.0) < DEBOUNCE_S:
             return
         _last_fire[code] = now
-    # FS1: run the (slow) action in a DETACHED thread so the poller/evdev reader returns
-    # IMMEDIATELY to detect the NEXT press. The lock-screen GATE runs inside the thread too
+    # FS1: hand the (slow) action to the action worker so the poller/evdev reader returns
+    # IMMEDIATELY to detect the NEXT press. The lock-screen GATE runs in the worker too
     # (_gated_action), so a cold _termux_foreground (~1.8s) can't block key detection either.
-    # The debounce above already deduped THIS press; _stop_previous_readback() inside
-    # read_message_back interrupts the prior child so a fresh tap scrubs rather than overlaps.
-    threading.Thread(target=_gated_action, args=(code,), daemon=True).start()
+    # The debounce above already deduped THIS press; presses queued behind a busy worker
+    # coalesce, and _stop_previous_readback() interrupts the prior child so a tap scrubs.
+    _enqueue_action(code)
 
 
 def _parse_keytrigger(path: str) -> "tuple[str, str] | None":
@@ -508,18 +624,121 @@ def _read_keytrigger() -> "tuple[str, str] | None":
     return max(cands, key=_newest)
 
 
+# <sys/inotify.h>; struct inotify_event = int wd; u32 mask, cookie, len; char name[len].
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_EVENT = struct.Struct("iIII")
+
+
+def _inotify_add(fd: int, directory: str) -> bool:
+    """(Re-)add the watch on `directory` to inotify instance `fd`."""
+    try:
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        return libc.inotify_add_watch(fd, os.fsencode(directory),
+                                      _IN_CLOSE_WRITE | _IN_MOVED_TO) >= 0
+    except (OSError, AttributeError):
+        return False
+
+
+def _inotify_watch(directory: str) -> "int | None":
+    """Non-blocking inotify fd watching `directory` for finished writes and renames-in, or
+    None (no libc symbol, syscall blocked, dir missing) — the caller then polls."""
+    try:
+        import ctypes
+        fd = ctypes.CDLL(None, use_errno=True).inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    if not _inotify_add(fd, directory):
+        os.close(fd)
+        return None
+    return fd
+
+
+def _inotify_drain(fd: int) -> "tuple[set[str] | None, bool]":
+    """Read every queued event: (the file names they touched, or None on a queue overflow —
+    events were lost, the caller must treat it as 'anything may have changed'; whether the
+    kernel dropped the watch (IN_IGNORED) and it must be re-added)."""
+    names: "set[str] | None" = set()
+    ignored = False
+    while True:
+        try:
+            buf = os.read(fd, 4096)
+        except OSError:   # EAGAIN: queue empty
+            return names, ignored
+        if not buf:
+            return names, ignored
+        off = 0
+        while off + _IN_EVENT.size <= len(buf):
+            _wd, mask, _cookie, ln = _IN_EVENT.unpack_from(buf, off)
+            off += _IN_EVENT.size
+            if mask & _IN_Q_OVERFLOW:
+                names = None
+            elif mask & _IN_IGNORED:
+                ignored = True
+            elif names is not None:
+                names.add(buf[off:off + ln].rstrip(b"\0").decode("utf-8", "replace"))
+            off += ln
+
+
+def _rewatch(fd: int, directory: str) -> "int | None":
+    """The kernel dropped the watch (IN_IGNORED): re-add it on the same fd, else close the
+    fd and fall back to polling (None)."""
+    if _inotify_add(fd, directory):
+        _log("VOLKEY", "keytrigger-watch", "watch re-added")
+        return fd
+    _log("VOLKEY", "keytrigger-watch", "watch lost -> poll", level="warn")
+    os.close(fd)
+    return None
+
+
 def _poll_keytrigger() -> None:
     """Daemon loop: watch the accessibility-written trigger flag and dispatch the
     instant the app reports a press. Diffs the per-press timestamp so each physical
     press fires once; seeds from the current flag at startup so a stale flag left by a
     previous session doesn't fire on launch. This is the path that removes the ~3s
-    key-delivery floor while the screen is ON."""
+    key-delivery floor while the screen is ON. Sleeps in select() on the inotify fd
+    (see KEYTRIGGER_* above); without a working inotify it polls adaptively."""
     seen = None
     cur = _read_keytrigger()
     if cur:
         seen = cur[1]  # whatever is there at startup counts as already handled
+    watched = {os.path.basename(KEYTRIGGER_FLAG), os.path.basename(KEYTRIGGER_FLAG) + ".tmp"}
+    watch_dir = os.path.dirname(KEYTRIGGER_FLAG) or "."
+    fd = _inotify_watch(watch_dir)
+    proven = False
+    started = time.monotonic()
+    last_press = float("-inf")
+    _log("VOLKEY", "keytrigger-watch", "inotify (unproven)" if fd is not None else "poll")
     while True:
-        time.sleep(KEYTRIGGER_POLL_S)
+        now = time.monotonic()
+        if fd is not None and proven:
+            timeout = KEYTRIGGER_SAFETY_S
+        elif (now - last_press < KEYTRIGGER_HOT_S
+              or (fd is not None and now - started < KEYTRIGGER_PROVE_S)):
+            timeout = KEYTRIGGER_POLL_S
+        else:
+            timeout = KEYTRIGGER_IDLE_POLL_S
+        notified = False
+        if fd is None:
+            time.sleep(timeout)
+        else:
+            try:
+                ready = select.select([fd], [], [], timeout)[0]
+            except (OSError, ValueError):
+                ready = []
+            if ready:
+                hit, ignored = _inotify_drain(fd)
+                notified = hit is None or bool(hit & watched)
+                if ignored:
+                    fd = _rewatch(fd, watch_dir)
+                    notified = True   # whatever changed with the dir: read the flag now
+                if not notified:
+                    continue  # another flag in the shared dir changed
         cur = _read_keytrigger()
         if not cur:
             continue
@@ -527,6 +746,25 @@ def _poll_keytrigger() -> None:
         if ts == seen:
             continue  # no new press
         seen = ts
+        if fd is not None and not notified:
+            # found by the poll: was its event merely queued just after select() timed out?
+            try:
+                if select.select([fd], [], [], 0)[0]:
+                    hit, ignored = _inotify_drain(fd)
+                    notified = hit is None or bool(hit & watched)
+                    if ignored:   # the miss is the dropped watch's, not inotify's
+                        fd = _rewatch(fd, watch_dir)
+                        notified = True
+            except (OSError, ValueError):
+                pass
+            if fd is not None and not notified:
+                _log("VOLKEY", "keytrigger-watch", "inotify missed a press -> poll")
+                os.close(fd)
+                fd = None
+        if notified and not proven and fd is not None:
+            proven = True
+            _log("VOLKEY", "keytrigger-watch", "inotify proven")
+        last_press = time.monotonic()
         # the app's write already refreshed the flag's mtime → evdev sees it via
         # _flag_recent() and stands down (filesystem is the reliable cross-thread channel).
         code = KEY_VOLUMEUP if key == "up" else KEY_VOLUMEDOWN
@@ -568,7 +806,7 @@ def _stream(device: str) -> None:
         proc = subprocess.Popen(cmd, stdout=subprocess.PIPE,
                                 stderr=subprocess.DEVNULL, bufsize=0)
     except (FileNotFoundError, OSError) as e:
-        _log("VOLKEY", "reader-spawn-fail", repr(e))
+        _log("VOLKEY", "reader-spawn-fail", repr(e), level="warn")
         return
     buf = b""
     try:
@@ -724,7 +962,7 @@ def _bt_keepalive() -> None:
             pass
         _log("VOLKEY", "bt-keepalive pulse")
     except (FileNotFoundError, OSError) as e:
-        _log("VOLKEY", "bt-keepalive-fail", repr(e))
+        _log("VOLKEY", "bt-keepalive-fail", repr(e), level="warn")
 
 
 def _on_sigterm(signum, frame):
@@ -744,7 +982,9 @@ def main() -> int:
     # PRIMARY path: poll the accessibility trigger flag in a daemon thread. The Voice Typer
     # service delivers presses here at ~0ms (verified screen-on AND screen-off), so this is
     # the sole key path by default. Daemon so teardown (SIGTERM/lock release) isn't blocked.
+    threading.Thread(target=_action_worker, name="actions", daemon=True).start()
     threading.Thread(target=_poll_keytrigger, name="keytrigger", daemon=True).start()
+    threading.Thread(target=_sample_device_state, name="device-sampler", daemon=True).start()
     if not EVDEV_FALLBACK:
         _log("VOLKEY", "evdev reader DISABLED — accessibility is the sole key path")
     # Clear a wakelock a previously-crashed watcher may have left held (SIGKILL skips finally).
@@ -767,6 +1007,7 @@ def main() -> int:
             _keep_daemon_warm()   # re-ensure the daemon stays warm (throttled 60s; self-heals a death)
             _bt_keepalive()       # keep the car's BT A2DP warm while reading in the car (approach B)
             _reap_children()      # M1: reap the periodic Popen children so they don't pile up <defunct>
+            czytaj_shell.reap_idle()   # close the resident rish/adb session after a long idle
             if not EVDEV_FALLBACK:
                 # accessibility poller (daemon thread) handles keys; the main loop just
                 # keeps the wakelock fresh so the device can't doze and freeze the poller.
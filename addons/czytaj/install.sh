@@ -112,8 +112,11 @@ rm -rf "$CLAUDE_DIR/skills/czytaj"
 # F32/F50: reading mode is per-project (~/.claude/czytaj-flags/<sha1>.flag). The
 # per-project flags are PRESERVED across reinstall (not touched here), so a
 # reinstall never silently turns a project off. F49: pause flag also preserved.
-# Only the transient daemon + state.json are reset below.
+# Only the transient daemon + spoken state are reset below: state.json (legacy per-file
+# path) AND the czytaj_store db that now holds the same state — resetting only the json
+# left the db's copy in force. (WAL: the -wal/-shm side files go with it.)
 rm -f "$HOME/.claude/czytaj-state.json"
+rm -f "$HOME/.claude/czytaj-store.db" "$HOME/.claude/czytaj-store.db-wal" "$HOME/.claude/czytaj-store.db-shm"
 PIPER_RUN="$CZYTAJ_RUN_DIR"   # SSOT: one definition in czytaj-env.sh (was hardcoded here + toggle.sh + piper_server.py)
 [ -d "$PIPER_RUN" ] && rm -rf "$PIPER_RUN"
 pkill -9 -f 'python.*piper_server\.py' >/dev/null 2>&1 || true   # F21: anchored (final-sweep)